@@ -1,5 +1,7 @@
 from src.langgraphagenticai.main import load_langgraph_agenticai_app
+from src.langgraphagenticai.LLMS.http_clients import start_http_clients
 
 
 if __name__=="__main__":
+    start_http_clients()
     load_langgraph_agenticai_app()
\ No newline at end of file
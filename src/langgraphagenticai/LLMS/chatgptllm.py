@@ -1,6 +1,8 @@
 import os
 import streamlit as st
 from langchain_openai import ChatOpenAI
+from src.langgraphagenticai.LLMS.llm_registry import llm_registry
+from src.langgraphagenticai.LLMS.http_clients import http_clients
 
 class OpenaiLLM:
     def __init__(self,user_controls_input):
@@ -15,7 +17,11 @@ class OpenaiLLM:
                 st.error("Error: OpenAI API key not provided")
                 return None
             
-            llm = ChatOpenAI(api_key=openai_api_key, model=selected_OPENAI_model)
+            llm = llm_registry.get_or_create(
+                "openai", selected_OPENAI_model, openai_api_key,
+                lambda: ChatOpenAI(api_key=openai_api_key, model=selected_OPENAI_model,
+                                   http_client=http_clients.client_for("openai"))
+            )
             return llm
         except Exception as e:
             st.error(f"Error initializing OpenAI LLM: {e}")
@@ -0,0 +1,167 @@
+# src/langgraphagenticai/LLMS/coalescing_llm.py
+import asyncio
+import concurrent.futures
+import contextvars
+import hashlib
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.load import dumps
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+
+from src.langgraphagenticai.LLMS.delegating_llm import DelegatingChatModel
+from src.langgraphagenticai.logging.logging_utils import logger
+
+
+class _Flight:
+    """One upstream call and the callers waiting for it."""
+
+    def __init__(self):
+        self.future: concurrent.futures.Future = concurrent.futures.Future()
+        self.waiters = 1
+        self.cancel: Optional[Callable[[], None]] = None
+
+
+# Shared by every session in the process; keys include the API key scope, model and call parameters.
+_inflight: Dict[str, _Flight] = {}
+_inflight_lock = threading.Lock()
+_stats = {"upstream_calls": 0, "coalesced": 0, "cancelled": 0}
+
+_flight_loop: Optional[asyncio.AbstractEventLoop] = None
+_flight_loop_lock = threading.Lock()
+
+
+def get_flight_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the process-wide event loop that runs coalesced async upstream calls, starting its
+    thread on first use. Callers' loops come and go with each graph run, so a shared call must not
+    live on any of them.
+    """
+    global _flight_loop
+    with _flight_loop_lock:
+        if _flight_loop is None:
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name="llm-coalescing", daemon=True).start()
+            _flight_loop = loop
+        return _flight_loop
+
+
+async def _in_context(coro, context: contextvars.Context):
+    """Run `coro` on the current loop in the caller's context (callbacks and tracing read context vars)."""
+    return await asyncio.get_running_loop().create_task(coro, context=context)
+
+
+def coalescing_stats() -> Dict[str, int]:
+    with _inflight_lock:
+        return {**_stats, "in_flight": len(_inflight)}
+
+
+def _join(key: str) -> Tuple[_Flight, bool]:
+    """Attach to the in-flight call for `key`, starting a new one if there is none. Returns (flight, is_leader)."""
+    with _inflight_lock:
+        flight = _inflight.get(key)
+        if flight is not None and not flight.future.done():
+            flight.waiters += 1
+            _stats["coalesced"] += 1
+            return flight, False
+        flight = _Flight()
+        _inflight[key] = flight
+        _stats["upstream_calls"] += 1
+        return flight, True
+
+
+def _release(key: str, flight: _Flight) -> None:
+    with _inflight_lock:
+        if _inflight.get(key) is flight:
+            del _inflight[key]
+
+
+def _leave(key: str, flight: _Flight) -> None:
+    """A waiter went away; cancel the upstream call once nobody is waiting for it."""
+    with _inflight_lock:
+        flight.waiters -= 1
+        abandoned = flight.waiters <= 0 and not flight.future.done()
+        if abandoned:
+            _stats["cancelled"] += 1
+            if _inflight.get(key) is flight:
+                del _inflight[key]
+    if abandoned and flight.cancel is not None:
+        logger.info("All callers of an in-flight LLM request went away; cancelling it")
+        flight.cancel()
+
+
+class CoalescingChatModel(DelegatingChatModel):
+    """
+    Single-flight layer: concurrent identical requests share one upstream call.
+
+    Requests are identical when the model, its parameters, bound tools, stop sequences and the
+    full message list (ignoring message ids) match; `key_scope` keeps different API keys apart.
+    The first caller runs the request; callers arriving while it is in flight wait for it and
+    each receive a copy of the result. Unlike the response cache nothing is kept once the call completes.
+
+    Async callers may come from different event loops (one per session run), so results are
+    handed over through a thread-safe future. The upstream call runs on a loop owned by this layer
+    (get_flight_loop), not on the first caller's, so it survives that caller being cancelled and
+    its loop closed while others still wait; it is cancelled once every waiter has been
+    cancelled. Its callbacks therefore fire on that loop's thread, in a copy of the leader's
+    context, and per-loop layers (ConcurrencyLimitedChatModel) belong above this one. Streaming
+    calls are not coalesced.
+    """
+
+    key_scope: str = ""
+
+    def _flight_key(self, messages: List[BaseMessage], stop: Optional[List[str]], kwargs: Dict[str, Any]) -> str:
+        llm_string = self.inner._get_llm_string(stop=stop, **kwargs)
+        # Graph state gives every message a fresh uuid; like the LLM cache, ignore ids when comparing requests.
+        normalized = [m.model_copy(update={"id": None}) if getattr(m, "id", None) is not None else m for m in messages]
+        payload = f"{self.key_scope}\x00{llm_string}\x00{dumps(normalized)}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        key = self._flight_key(messages, stop, kwargs)
+        flight, leader = _join(key)
+        if not leader:
+            return flight.future.result().model_copy(deep=True)
+        try:
+            result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        except BaseException as e:
+            flight.future.set_exception(e)
+            raise
+        else:
+            flight.future.set_result(result)
+            return result
+        finally:
+            _release(key, flight)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        key = self._flight_key(messages, stop, kwargs)
+        flight, leader = _join(key)
+        if leader:
+            upstream = asyncio.run_coroutine_threadsafe(
+                _in_context(super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs),
+                            contextvars.copy_context()),
+                get_flight_loop(),
+            )
+            flight.cancel = upstream.cancel
+            upstream.add_done_callback(lambda done: self._settle(key, flight, done))
+        try:
+            # Shield so that one waiter being cancelled does not cancel the shared future for the others.
+            result = await asyncio.shield(asyncio.wrap_future(flight.future))
+        except asyncio.CancelledError:
+            _leave(key, flight)
+            raise
+        return result if leader else result.model_copy(deep=True)
+
+    @staticmethod
+    def _settle(key: str, flight: _Flight, task: concurrent.futures.Future) -> None:
+        if task.cancelled():
+            flight.future.cancel()
+        elif task.exception() is not None:
+            flight.future.set_exception(task.exception())
+        else:
+            flight.future.set_result(task.result())
+        _release(key, flight)
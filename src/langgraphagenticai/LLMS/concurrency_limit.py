@@ -0,0 +1,45 @@
+# src/langgraphagenticai/LLMS/concurrency_limit.py
+import asyncio
+import weakref
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+from src.langgraphagenticai.LLMS.delegating_llm import DelegatingChatModel
+
+# asyncio semaphores belong to one event loop, so keep one set of per-provider semaphores per loop.
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = weakref.WeakKeyDictionary()
+
+
+def _provider_semaphore(provider: str, limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    loop_semaphores = _semaphores.setdefault(loop, {})
+    if provider not in loop_semaphores:
+        loop_semaphores[provider] = asyncio.Semaphore(limit)
+    return loop_semaphores[provider]
+
+
+class ConcurrencyLimitedChatModel(DelegatingChatModel):
+    """
+    Caps the number of in-flight async requests per provider on the running event loop.
+
+    Only the async path is limited: sync calls already hold a thread each, while async graphs can
+    fan out many section workers at once and would otherwise open one request per section.
+    """
+
+    provider: str
+    max_concurrency: int = 8
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        async with _provider_semaphore(self.provider, self.max_concurrency):
+            return await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        async with _provider_semaphore(self.provider, self.max_concurrency):
+            async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                yield chunk
@@ -0,0 +1,80 @@
+# src/langgraphagenticai/LLMS/delegating_llm.py
+import json
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, BaseMessage
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+
+class DelegatingChatModel(BaseChatModel):
+    """
+    Base class for chat models that wrap another chat model and add behaviour around its calls.
+
+    Subclasses override `_generate`/`_agenerate` (and the streaming variants when needed) and
+    call the `super()` implementation to reach the wrapped model. Because the wrapper is itself a
+    BaseChatModel, `with_structured_output`, `bind_tools`, caching and callbacks all work on the
+    outermost layer: tool definitions are formatted by the wrapped provider and bound as call
+    kwargs on the wrapper, so every call still passes through each layer.
+    """
+
+    inner: BaseChatModel
+
+    @property
+    def _llm_type(self) -> str:
+        return self.inner._llm_type
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return self.inner._identifying_params
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        return self.inner._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        return await self.inner._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        if type(self.inner)._stream is BaseChatModel._stream:
+            # The wrapped model cannot stream; emit its full answer as a single chunk.
+            result = self._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            yield _result_to_chunk(result)
+            return
+        yield from self.inner._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        if type(self.inner)._stream is BaseChatModel._stream and type(self.inner)._astream is BaseChatModel._astream:
+            result = await self._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            yield _result_to_chunk(result)
+            return
+        async for chunk in self.inner._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+            yield chunk
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        """Let the wrapped provider format the tools, then bind the resulting call kwargs to this wrapper."""
+        provider_binding = self.inner.bind_tools(tools, **kwargs)
+        return self.bind(**provider_binding.kwargs)
+
+
+def _result_to_chunk(result: ChatResult) -> ChatGenerationChunk:
+    """Convert a complete ChatResult into a single streaming chunk, keeping any tool calls."""
+    message = result.generations[0].message
+    chunk = AIMessageChunk(
+        content=message.content,
+        additional_kwargs=message.additional_kwargs,
+        response_metadata=message.response_metadata,
+        tool_call_chunks=[
+            tool_call_chunk(name=call["name"], args=json.dumps(call["args"]), id=call["id"], index=index)
+            for index, call in enumerate(getattr(message, "tool_calls", None) or [])
+        ],
+        usage_metadata=getattr(message, "usage_metadata", None),
+        id=message.id,
+    )
+    return ChatGenerationChunk(message=chunk, generation_info=result.generations[0].generation_info)
@@ -0,0 +1,364 @@
+# src/langgraphagenticai/LLMS/fakellm.py
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+import streamlit as st
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.load import dumps, loads
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+from langchain_core.messages.tool import tool_call_chunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+from src.langgraphagenticai.LLMS.delegating_llm import DelegatingChatModel, _result_to_chunk
+from src.langgraphagenticai.LLMS.llm_registry import llm_registry
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+_WORDS = (
+    "system data model latency throughput design team workflow agent graph section cache request "
+    "response pipeline user feature quality review test deploy release metric signal trade-off "
+    "approach result context budget provider process state update plan draft content value"
+).split()
+
+
+def _text(content: Any) -> str:
+    if isinstance(content, str):
+        return content
+    return json.dumps(content, sort_keys=True, default=str)
+
+
+def _tool_name(tool: Dict[str, Any]) -> str:
+    return tool.get("function", {}).get("name") or tool.get("name", "")
+
+
+def cassette_key(messages: List[BaseMessage], tools: Optional[Sequence[Dict[str, Any]]] = None) -> str:
+    """
+    Provider-independent key for a chat call: message roles, text and tool calls plus the bound tool names.
+
+    Tool call ids are random per run, so they are left out; this lets a cassette recorded against a
+    real provider be replayed by the fake one.
+    """
+    payload = [
+        [message.type, _text(message.content),
+         [[call["name"], call["args"]] for call in getattr(message, "tool_calls", None) or []]]
+        for message in messages
+    ]
+    payload.append(sorted(_tool_name(tool) for tool in tools or []))
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+class LatencyDistribution:
+    """
+    Time-to-first-token distribution parsed from a spec such as "lognormal:0.8:0.5".
+
+    Supported specs: fixed:<s>, uniform:<low>:<high>, normal:<mean>:<sd>, lognormal:<median>:<sigma>,
+    exponential:<mean>.
+    """
+
+    def __init__(self, spec: str):
+        kind, *params = (spec or "fixed:0").split(":")
+        self.kind = kind.strip().lower()
+        self.params = [float(p) for p in params]
+        if self.kind not in ("fixed", "uniform", "normal", "lognormal", "exponential"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+
+    def sample(self, rng: random.Random) -> float:
+        p = self.params
+        if self.kind == "fixed":
+            return p[0]
+        if self.kind == "uniform":
+            return rng.uniform(p[0], p[1])
+        if self.kind == "normal":
+            return max(0.0, rng.gauss(p[0], p[1]))
+        if self.kind == "lognormal":
+            return rng.lognormvariate(math.log(p[0]), p[1])
+        return rng.expovariate(1.0 / p[0])
+
+
+class Cassette:
+    """
+    JSONL file of recorded chat calls: one {"key", "latency", "message"} object per line.
+
+    Repeated calls with the same key are replayed in recording order; the last recording is reused
+    once they run out.
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._entries: Dict[str, List[Dict[str, Any]]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries.setdefault(entry["key"], []).append(entry)
+
+    def lookup(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                return None
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            entry = entries[min(index, len(entries) - 1)]
+        return {"latency": entry["latency"], "message": loads(entry["message"])}
+
+    def record(self, key: str, message: BaseMessage, latency: float) -> None:
+        entry = {"key": key, "latency": round(latency, 4), "message": dumps(message)}
+        with self._lock:
+            self._entries.setdefault(key, []).append(entry)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str) -> Cassette:
+    """Return the shared Cassette for `path`; relative paths resolve against the repository root."""
+    if not os.path.isabs(path):
+        path = str(Path(__file__).resolve().parents[3] / path)
+    with _cassettes_lock:
+        if path not in _cassettes:
+            _cassettes[path] = Cassette(path)
+        return _cassettes[path]
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    Offline chat model for running every use case without API keys.
+
+    In "synthetic" mode answers are generated deterministically from the prompt: the blog
+    structure prompt gets a {"sections": [...]} JSON object, the Sections planner gets a tool
+    call built from the section names in its prompt (SectionDrafts likewise writes one filler
+    draft per listed section, RevisionScope picks the listed sections the feedback names, or the
+    first one), a model bound to the search tool calls it
+    once per user turn, and everything else gets filler text. Latency is drawn from
+    `latency` (time to first token) plus output tokens / `tokens_per_second`.
+
+    In "replay" mode answers come from a cassette recorded against a real provider and are
+    replayed with their recorded latency; calls missing from the cassette fall back to synthetic.
+    """
+
+    mode: str = "synthetic"
+    latency: str = "lognormal:0.6:0.4"
+    tokens_per_second: float = 80.0
+    seed: int = 0
+    cassette_path: Optional[str] = None
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": f"fake-{self.mode}", "seed": self.seed}
+
+    def bind_tools(self, tools: Sequence[Any], tool_choice: Optional[Any] = None, **kwargs: Any):
+        return self.bind(tools=[convert_to_openai_tool(tool) for tool in tools], tool_choice=tool_choice, **kwargs)
+
+    def _rng(self, key: str) -> random.Random:
+        return random.Random(f"{self.seed}:{key}")
+
+    def _respond(self, messages: List[BaseMessage], tools: Optional[List[Dict[str, Any]]],
+                 tool_choice: Any) -> Dict[str, Any]:
+        """Pick the answer for a call. Returns {"message": AIMessage, "ttft": seconds}."""
+        key = cassette_key(messages, tools)
+        rng = self._rng(key)
+        if self.mode == "replay" and self.cassette_path:
+            entry = get_cassette(self.cassette_path).lookup(key)
+            if entry is not None:
+                return {"message": entry["message"], "ttft": entry["latency"], "replayed": True}
+            logger.warning("Fake LLM cassette miss; answering synthetically")
+        message = self._synthetic_message(messages, tools or [], tool_choice, rng)
+        return {"message": message, "ttft": LatencyDistribution(self.latency).sample(rng), "replayed": False}
+
+    def _synthetic_message(self, messages: List[BaseMessage], tools: List[Dict[str, Any]],
+                           tool_choice: Any, rng: random.Random) -> AIMessage:
+        system = " ".join(_text(m.content) for m in messages if isinstance(m, SystemMessage))
+        last = messages[-1] if messages else HumanMessage(content="")
+        last_text = _text(last.content)
+
+        sections_tool = next((tool for tool in tools if _tool_name(tool) == "Sections"), None)
+        if sections_tool is not None:
+            match = re.search(r"section names:\s*(.+?)\.\s", system + " ")
+            names = [n.strip() for n in match.group(1).split(",")] if match else ["Introduction", "Main Content", "Conclusion"]
+            sections = [{"name": name, "description": f"{name}: {self._words(rng, 12)}"} for name in names if name]
+            return self._tool_call_message("Sections", {"sections": sections}, rng)
+
+        if any(_tool_name(tool) == "SectionDrafts" for tool in tools):
+            names = re.findall(r"^\d+\. (.+?):", last_text, re.MULTILINE)
+            drafts = [{"name": name, "content": f"## {name}\n\n{self._words(rng, rng.randint(60, 120))}"} for name in names]
+            return self._tool_call_message("SectionDrafts", {"sections": drafts}, rng)
+
+        if any(_tool_name(tool) == "RevisionScope" for tool in tools):
+            names = re.findall(r"^- (.+?): ", last_text, re.MULTILINE)
+            feedback = last_text.rsplit("Feedback:", 1)[-1].lower()
+            picked = [name for name in names if name.lower() in feedback] or names[:1]
+            return self._tool_call_message("RevisionScope", {"sections": picked, "replan": False}, rng)
+
+        if tools and not isinstance(last, ToolMessage):
+            tool = tools[0]
+            properties = tool.get("function", {}).get("parameters", {}).get("properties", {})
+            argument = "query" if "query" in properties else next(iter(properties), "query")
+            return self._tool_call_message(_tool_name(tool), {argument: last_text[:200]}, rng)
+
+        if "single key 'sections'" in system:
+            structure = re.search(r"structure:\s*(.+)", last_text, re.IGNORECASE)
+            names = [n.strip().capitalize() for n in structure.group(1).split(",")] if structure else \
+                ["Introduction", "Main Content", "Conclusion"]
+            return AIMessage(content=json.dumps({"sections": [n for n in names if n]}))
+
+        if isinstance(last, ToolMessage):
+            return AIMessage(content=f"According to the search results: {last_text[:300]}\n\n{self._words(rng, 40)}")
+
+        subject = last_text.strip().splitlines()[0][:80] if last_text.strip() else "Response"
+        paragraphs = [self._words(rng, rng.randint(40, 90)) for _ in range(rng.randint(2, 4))]
+        return AIMessage(content=f"## {subject}\n\n" + "\n\n".join(paragraphs))
+
+    def _words(self, rng: random.Random, count: int) -> str:
+        return (" ".join(rng.choice(_WORDS) for _ in range(count)).capitalize() + ".")
+
+    def _tool_call_message(self, name: str, args: Dict[str, Any], rng: random.Random) -> AIMessage:
+        call_id = f"call_{rng.getrandbits(48):012x}"
+        return AIMessage(content="", tool_calls=[{"name": name, "args": args, "id": call_id, "type": "tool_call"}])
+
+    def _finish(self, messages: List[BaseMessage], message: BaseMessage) -> AIMessage:
+        input_tokens = sum(len(_text(m.content)) for m in messages) // 4
+        output_tokens = max(1, (len(_text(message.content)) + len(json.dumps([c["args"] for c in message.tool_calls]))) // 4)
+        return AIMessage(
+            content=message.content,
+            tool_calls=message.tool_calls,
+            response_metadata={"model_name": f"fake-{self.mode}"},
+            usage_metadata={"input_tokens": input_tokens, "output_tokens": output_tokens,
+                            "total_tokens": input_tokens + output_tokens},
+        )
+
+    def _chunks(self, message: AIMessage) -> List[AIMessageChunk]:
+        """Split a finished answer into word chunks; tool calls are sent as one chunk, usage in the last."""
+        chunks = [AIMessageChunk(content=piece) for piece in re.findall(r"\S+\s*", _text(message.content))]
+        if message.tool_calls:
+            chunks.append(AIMessageChunk(content="", tool_call_chunks=[
+                tool_call_chunk(name=call["name"], args=json.dumps(call["args"]), id=call["id"], index=index)
+                for index, call in enumerate(message.tool_calls)
+            ]))
+        chunks.append(AIMessageChunk(content="", usage_metadata=message.usage_metadata,
+                                     response_metadata=message.response_metadata))
+        return chunks
+
+    def _plan(self, messages: List[BaseMessage], kwargs: Dict[str, Any]):
+        answer = self._respond(messages, kwargs.get("tools"), kwargs.get("tool_choice"))
+        message = self._finish(messages, answer["message"])
+        token_delay = 0.0 if answer["replayed"] else 1.0 / self.tokens_per_second if self.tokens_per_second > 0 else 0.0
+        return message, answer["ttft"], token_delay
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        message, ttft, token_delay = self._plan(messages, kwargs)
+        time.sleep(ttft + token_delay * message.usage_metadata["output_tokens"])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        message, ttft, token_delay = self._plan(messages, kwargs)
+        await asyncio.sleep(ttft + token_delay * message.usage_metadata["output_tokens"])
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        message, ttft, token_delay = self._plan(messages, kwargs)
+        time.sleep(ttft)
+        for chunk in self._chunks(message):
+            time.sleep(token_delay * max(1, len(_text(chunk.content)) // 4) if chunk.content else 0)
+            yield ChatGenerationChunk(message=chunk)
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        message, ttft, token_delay = self._plan(messages, kwargs)
+        await asyncio.sleep(ttft)
+        for chunk in self._chunks(message):
+            await asyncio.sleep(token_delay * max(1, len(_text(chunk.content)) // 4) if chunk.content else 0)
+            yield ChatGenerationChunk(message=chunk)
+
+
+class RecordingChatModel(DelegatingChatModel):
+    """Passes calls through to a real provider and appends each answer and its latency to a cassette."""
+
+    cassette_path: str
+
+    def _record(self, messages: List[BaseMessage], kwargs: Dict[str, Any], result: ChatResult, started: float) -> None:
+        try:
+            get_cassette(self.cassette_path).record(
+                cassette_key(messages, kwargs.get("tools")), result.generations[0].message, time.monotonic() - started
+            )
+        except Exception as e:
+            logger.warning(f"Could not record LLM call to cassette: {e}")
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        started = time.monotonic()
+        result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._record(messages, kwargs, result, started)
+        return result
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        started = time.monotonic()
+        result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        self._record(messages, kwargs, result, started)
+        return result
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        # Record the complete answer; replay re-chunks it.
+        yield _result_to_chunk(self._generate(messages, stop=stop, run_manager=run_manager, **kwargs))
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        result = await self._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        yield _result_to_chunk(result)
+
+
+class FakeLLM:
+    def __init__(self, user_controls_input):
+        self.user_controls_input = user_controls_input
+
+    def get_llm_model(self):
+        try:
+            config = Config()
+            mode = self.user_controls_input.get("selected_fake_model") or config.get_fake_llm_mode()
+            cassette_path = config.get_llm_cassette_path()
+            if mode not in ("synthetic", "replay"):
+                st.error(f"Error: Unsupported fake LLM mode '{mode}'")
+                return None
+            llm = llm_registry.get_or_create(
+                "fake", mode, "",
+                lambda: FakeChatModel(
+                    mode=mode,
+                    latency=config.get_fake_llm_latency(),
+                    tokens_per_second=config.get_fake_llm_tokens_per_second(),
+                    seed=config.get_fake_llm_seed(),
+                    cassette_path=cassette_path or None,
+                )
+            )
+            return llm
+        except Exception as e:
+            st.error(f"Error initializing Fake LLM: {e}")
+            return None
@@ -1,6 +1,8 @@
 import os
 import streamlit as st
 from langchain_google_genai import ChatGoogleGenerativeAI
+from src.langgraphagenticai.LLMS.llm_registry import llm_registry
+from src.langgraphagenticai.LLMS.http_clients import http_clients
 
 class GoogleLLM:
     def __init__(self,user_controls_input):
@@ -13,7 +15,11 @@ class GoogleLLM:
             if not google_api_key:
                 st.error("Error: Google API key not provided")
                 return None
-            llm = ChatGoogleGenerativeAI(api_key=google_api_key, model=selected_google_genai_model)
+            llm = llm_registry.get_or_create(
+                "google", selected_google_genai_model, google_api_key,
+                lambda: ChatGoogleGenerativeAI(api_key=google_api_key, model=selected_google_genai_model,
+                                               client_args={"limits": http_clients.limits})
+            )
             return llm
         except Exception as e:
             st.error(f"Error initializing Google LLM: {e}")
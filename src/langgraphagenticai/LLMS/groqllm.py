@@ -1,6 +1,8 @@
 import os
 import streamlit as st
 from langchain_groq import ChatGroq
+from src.langgraphagenticai.LLMS.llm_registry import llm_registry
+from src.langgraphagenticai.LLMS.http_clients import http_clients
 
 class GroqLLM:
     def __init__(self, user_controls_input):
@@ -13,7 +15,11 @@ class GroqLLM:
             if not groq_api_key:
                 st.error("Error: Groq API key not provided")
                 return None
-            llm = ChatGroq(api_key=groq_api_key, model=selected_groq_model)
+            llm = llm_registry.get_or_create(
+                "groq", selected_groq_model, groq_api_key,
+                lambda: ChatGroq(api_key=groq_api_key, model=selected_groq_model,
+                                 http_client=http_clients.client_for("groq"))
+            )
             return llm
         except Exception as e:
             st.error(f"Error initializing Groq LLM: {e}")
@@ -0,0 +1,419 @@
+# src/langgraphagenticai/LLMS/hedged_llm.py
+import asyncio
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from queue import Empty, Queue
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManager, CallbackManagerForLLMRun
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+from src.langgraphagenticai.logging.logging_utils import logger
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker for one backend.
+
+    After `failure_threshold` failures in a row the backend is taken out of rotation for
+    `reset_timeout` seconds; then a single probe call is let through and its outcome decides
+    whether the breaker closes again or stays open for another period.
+    """
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+        self.probe_started = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            now = time.monotonic()
+            # A probe that was never sent (e.g. another backend answered first) expires after one period.
+            if now - max(self.opened_at, self.probe_started) >= self.reset_timeout:
+                self.probing = True
+                self.probe_started = now
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+                self.probing = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        return "half_open" if self.probing else "open"
+
+
+class LatencyTracker:
+    """Sliding window of successful call latencies for one backend."""
+
+    def __init__(self, window: int = 200):
+        self._samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def percentile(self, percentile: float, min_samples: int = 20) -> Optional[float]:
+        """Return the given percentile (0-100) of recent latencies, or None until enough samples exist."""
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < min_samples:
+            return None
+        index = min(len(samples) - 1, int(round(percentile / 100.0 * (len(samples) - 1))))
+        return samples[index]
+
+
+# Health and latency are properties of a backend, not of a session, so they are shared process-wide.
+_breakers: Dict[str, CircuitBreaker] = {}
+_latencies: Dict[str, LatencyTracker] = {}
+_hedge_stats: Dict[str, int] = {"calls": 0, "hedges": 0, "failovers": 0, "secondary_wins": 0}
+_state_lock = threading.Lock()
+_executor = ThreadPoolExecutor(max_workers=32, thread_name_prefix="llm-hedge")
+# Marks the end of a backend's stream in the chunk queues of _stream/_astream.
+_END = object()
+
+
+def _backend_state(label: str, failure_threshold: int, reset_timeout: float):
+    with _state_lock:
+        if label not in _breakers:
+            _breakers[label] = CircuitBreaker(failure_threshold, reset_timeout)
+            _latencies[label] = LatencyTracker()
+        return _breakers[label], _latencies[label]
+
+
+def _count(stat: str) -> None:
+    with _state_lock:
+        _hedge_stats[stat] += 1
+
+
+def hedge_stats() -> Dict[str, Any]:
+    """Hedging counters plus the breaker state and p50/p95 latency of every backend seen so far."""
+    with _state_lock:
+        stats: Dict[str, Any] = dict(_hedge_stats)
+        backends = list(_breakers)
+    stats["backends"] = {
+        label: {
+            "breaker": _breakers[label].state,
+            "p50": _latencies[label].percentile(50, min_samples=1),
+            "p95": _latencies[label].percentile(95, min_samples=1),
+        }
+        for label in backends
+    }
+    return stats
+
+
+class HedgedChatModel(BaseChatModel):
+    """
+    Chat model that spreads each call over two or more provider backends.
+
+    The call goes to the first healthy backend. If it has not answered within that backend's
+    `hedge_percentile` latency, the same request is fired at the next backend and whichever
+    answer arrives first wins; the other request is cancelled (async) or its result discarded
+    (sync, where a running thread cannot be interrupted). A failing backend triggers an
+    immediate failover and counts towards its circuit breaker.
+
+    Streamed calls hedge the same way until the first chunk arrives, then commit to the backend
+    that sent it: its chunks are passed through as they come and the other streams are stopped.
+    Once a chunk has been emitted there is no failover, so an error mid-stream is raised.
+
+    `bind_tools` binds the tools on every backend, so `with_structured_output` and tool-calling
+    graphs work unchanged.
+    """
+
+    models: List[Any]
+    labels: List[str]
+    hedge_percentile: float = 95.0
+    initial_hedge_delay: float = 2.0
+    min_hedge_delay: float = 0.25
+    failure_threshold: int = 3
+    reset_timeout: float = 60.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "hedged"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"backends": self.labels}
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        return self.model_copy(update={"models": [model.bind_tools(tools, **kwargs) for model in self.models]})
+
+    def _candidates(self) -> List[int]:
+        """Backends in priority order whose breaker lets a call through; all of them if every breaker is open."""
+        healthy = [
+            index for index, label in enumerate(self.labels)
+            if _backend_state(label, self.failure_threshold, self.reset_timeout)[0].allow()
+        ]
+        return healthy or list(range(len(self.models)))
+
+    def _hedge_delay(self, index: int) -> float:
+        latency = _backend_state(self.labels[index], self.failure_threshold, self.reset_timeout)[1]
+        delay = latency.percentile(self.hedge_percentile)
+        return self.initial_hedge_delay if delay is None else max(self.min_hedge_delay, delay)
+
+    def _record(self, index: int, started: float, error: Optional[BaseException]) -> None:
+        breaker, latency = _backend_state(self.labels[index], self.failure_threshold, self.reset_timeout)
+        if error is None:
+            breaker.record_success()
+            latency.record(time.monotonic() - started)
+        else:
+            breaker.record_failure()
+            logger.warning(f"LLM backend {self.labels[index]} failed: {error}")
+
+    def _call_config(self, run_manager) -> Dict[str, Any]:
+        # Backend runs are traced as children of the hedged run. "nostream" keeps them out of
+        # LangGraph's message stream; the hedged run itself reports the winning answer.
+        if run_manager is None:
+            return {"tags": ["nostream"]}
+        callbacks = CallbackManager(
+            handlers=run_manager.inheritable_handlers,
+            inheritable_handlers=run_manager.inheritable_handlers,
+            parent_run_id=run_manager.run_id,
+        )
+        callbacks.add_tags(run_manager.inheritable_tags)
+        callbacks.add_metadata(run_manager.inheritable_metadata)
+        return {"callbacks": callbacks, "tags": ["nostream"]}
+
+    def _result(self, index: int, message: BaseMessage) -> ChatResult:
+        if index != 0:
+            _count("secondary_wins")
+        return ChatResult(generations=[ChatGeneration(message=message)], llm_output={"served_by": self.labels[index]})
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        _count("calls")
+        queue = self._candidates()
+        chunks: Queue = Queue()
+        streams = {}  # backend index -> (stop event, start time)
+
+        def produce(index: int, stopped: threading.Event):
+            try:
+                for chunk in self.models[index].stream(messages, self._call_config(run_manager), stop=stop, **kwargs):
+                    if stopped.is_set():
+                        return
+                    chunks.put((index, chunk, None))
+                chunks.put((index, _END, None))
+            except BaseException as e:
+                chunks.put((index, None, e))
+
+        def launch():
+            index = queue.pop(0)
+            streams[index] = (threading.Event(), time.monotonic())
+            _executor.submit(contextvars.copy_context().run, produce, index, streams[index][0])
+            return index
+
+        current = launch()
+        live = {current}
+        committed: Optional[int] = None
+        try:
+            while True:
+                timeout = self._hedge_delay(current) if committed is None and queue else None
+                try:
+                    index, chunk, error = chunks.get(timeout=timeout)
+                except Empty:
+                    _count("hedges")
+                    current = launch()
+                    live.add(current)
+                    continue
+                if committed is not None and index != committed:
+                    continue
+                if error is not None:
+                    self._record(index, streams[index][1], error)
+                    if committed is not None:
+                        raise error
+                    live.discard(index)
+                    if not live:
+                        if not queue:
+                            raise error
+                        _count("failovers")
+                        current = launch()
+                        live.add(current)
+                    continue
+                if committed is None:
+                    committed = index
+                    for other, (stopped, _) in streams.items():
+                        if other != index:
+                            stopped.set()
+                    if index != 0:
+                        _count("secondary_wins")
+                if chunk is _END:
+                    self._record(index, streams[index][1], None)
+                    return
+                generation = ChatGenerationChunk(message=chunk)
+                if run_manager is not None:
+                    run_manager.on_llm_new_token(generation.text, chunk=generation)
+                yield generation
+        finally:
+            for stopped, _ in streams.values():
+                stopped.set()
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        _count("calls")
+        queue = self._candidates()
+        chunks: asyncio.Queue = asyncio.Queue()
+        streams = {}  # backend index -> (task, start time)
+
+        async def produce(index: int):
+            try:
+                async for chunk in self.models[index].astream(messages, self._call_config(run_manager), stop=stop, **kwargs):
+                    chunks.put_nowait((index, chunk, None))
+                chunks.put_nowait((index, _END, None))
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                chunks.put_nowait((index, None, e))
+
+        def launch():
+            index = queue.pop(0)
+            streams[index] = (asyncio.ensure_future(produce(index)), time.monotonic())
+            return index
+
+        current = launch()
+        live = {current}
+        committed: Optional[int] = None
+        try:
+            while True:
+                timeout = self._hedge_delay(current) if committed is None and queue else None
+                try:
+                    index, chunk, error = await asyncio.wait_for(chunks.get(), timeout)
+                except asyncio.TimeoutError:
+                    _count("hedges")
+                    current = launch()
+                    live.add(current)
+                    continue
+                if committed is not None and index != committed:
+                    continue
+                if error is not None:
+                    self._record(index, streams[index][1], error)
+                    if committed is not None:
+                        raise error
+                    live.discard(index)
+                    if not live:
+                        if not queue:
+                            raise error
+                        _count("failovers")
+                        current = launch()
+                        live.add(current)
+                    continue
+                if committed is None:
+                    committed = index
+                    for other, (task, _) in streams.items():
+                        if other != index:
+                            task.cancel()
+                    if index != 0:
+                        _count("secondary_wins")
+                if chunk is _END:
+                    self._record(index, streams[index][1], None)
+                    return
+                generation = ChatGenerationChunk(message=chunk)
+                if run_manager is not None:
+                    await run_manager.on_llm_new_token(generation.text, chunk=generation)
+                yield generation
+        finally:
+            for task, _ in streams.values():
+                task.cancel()
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        _count("calls")
+        queue = self._candidates()
+        pending = {}
+        last_error: Optional[BaseException] = None
+
+        def launch():
+            index = queue.pop(0)
+            started = time.monotonic()
+            context = contextvars.copy_context()
+            future = _executor.submit(
+                context.run, self.models[index].invoke, messages, self._call_config(run_manager), stop=stop, **kwargs
+            )
+            pending[future] = (index, started)
+            return index
+
+        current = launch()
+        while pending:
+            done, _ = wait(list(pending), timeout=self._hedge_delay(current) if queue else None,
+                           return_when=FIRST_COMPLETED)
+            if not done:
+                _count("hedges")
+                current = launch()
+                continue
+            for future in done:
+                index, started = pending.pop(future)
+                error = future.exception()
+                self._record(index, started, error)
+                if error is None:
+                    for loser in pending:
+                        loser.cancel()
+                    return self._result(index, future.result())
+                last_error = error
+            if not pending and queue:
+                _count("failovers")
+                current = launch()
+        raise last_error
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        _count("calls")
+        queue = self._candidates()
+        pending = {}
+        last_error: Optional[BaseException] = None
+
+        def launch():
+            index = queue.pop(0)
+            task = asyncio.ensure_future(
+                self.models[index].ainvoke(messages, self._call_config(run_manager), stop=stop, **kwargs)
+            )
+            pending[task] = (index, time.monotonic())
+            return index
+
+        current = launch()
+        try:
+            while pending:
+                done, _ = await asyncio.wait(list(pending), timeout=self._hedge_delay(current) if queue else None,
+                                             return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    _count("hedges")
+                    current = launch()
+                    continue
+                for task in done:
+                    index, started = pending.pop(task)
+                    error = task.exception()
+                    self._record(index, started, error)
+                    if error is None:
+                        return self._result(index, task.result())
+                    last_error = error
+                if not pending and queue:
+                    _count("failovers")
+                    current = launch()
+            raise last_error
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,169 @@
+# src/langgraphagenticai/LLMS/http_clients.py
+import atexit
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+import httpx
+
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+# Hosts of the providers whose SDKs accept a shared client; warm-up and keep-alive pings go to these.
+# Google is not listed: ChatGoogleGenerativeAI only takes `client_args` and builds its own httpx
+# client per model, so a warmed "google" pool would never carry a real request.
+PROVIDER_BASE_URLS = {
+    "groq": "https://api.groq.com",
+    "openai": "https://api.openai.com",
+}
+
+
+class SharedHttpClient(httpx.Client):
+    """
+    httpx client shared by every chat model of one provider.
+
+    The provider SDKs close their HTTP client when the model is closed (e.g. when the client
+    registry evicts an idle model); `close` is therefore a no-op and the pool is only torn down
+    by `shutdown` when the process exits.
+    """
+
+    def close(self) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        super().close()
+
+
+class HttpClientPool:
+    """
+    One keep-alive HTTP client per provider, created on first use and shared by all sessions.
+
+    Every request made through a shared client is timed up to its response headers and counted
+    as "warm" when the provider's pool was used within `keepalive_expiry` seconds (a pooled
+    connection was available) and "cold" otherwise, so the cost of DNS/TCP/TLS setup on a
+    session's first request is visible in `stats()`.
+    """
+
+    def __init__(self, max_connections: int = 20, max_keepalive: int = 10, keepalive_expiry: float = 120.0,
+                 timeout: float = 60.0):
+        self.limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive,
+                                   keepalive_expiry=keepalive_expiry)
+        self.keepalive_expiry = keepalive_expiry
+        self.timeout = timeout
+        self._clients: Dict[str, SharedHttpClient] = {}
+        self._last_used: Dict[str, float] = {}
+        self._latency: Dict[str, Dict[str, Dict[str, float]]] = {}
+        self._lock = threading.Lock()
+        self._pinger: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def client_for(self, provider: str) -> SharedHttpClient:
+        """Return the shared client for `provider` ("groq", "openai")."""
+        with self._lock:
+            client = self._clients.get(provider)
+            if client is None:
+                client = SharedHttpClient(
+                    limits=self.limits,
+                    timeout=httpx.Timeout(self.timeout, connect=10.0),
+                    event_hooks={"request": [self._on_request], "response": [self._on_response]},
+                )
+                self._clients[provider] = client
+                logger.info(f"Created shared {provider} HTTP client ({self.limits.max_connections} connections)")
+            return client
+
+    def _on_request(self, request: httpx.Request) -> None:
+        request.extensions["agenticai_started"] = time.monotonic()
+
+    def _on_response(self, response: httpx.Response) -> None:
+        request = response.request
+        started = request.extensions.get("agenticai_started")
+        provider = next((p for p, url in PROVIDER_BASE_URLS.items() if url.endswith(request.url.host)), None)
+        if started is None or provider is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            warm = started - self._last_used.get(provider, float("-inf")) <= self.keepalive_expiry
+            self._last_used[provider] = now
+            if request.extensions.get("agenticai_warmup"):
+                return
+            bucket = self._latency.setdefault(provider, {}).setdefault(
+                "warm" if warm else "cold", {"requests": 0, "seconds": 0.0})
+            bucket["requests"] += 1
+            bucket["seconds"] += now - started
+
+    def warm_up(self, providers: Iterable[str]) -> None:
+        """Open a pooled connection to each provider so the first LLM request skips DNS/TCP/TLS setup."""
+        for provider in providers:
+            url = PROVIDER_BASE_URLS.get(provider)
+            if url is None:
+                continue
+            try:
+                # Any HTTP answer (usually 404 without an API key) leaves a connection in the pool.
+                self.client_for(provider).head(url, extensions={"agenticai_warmup": True})
+            except httpx.HTTPError as e:
+                logger.warning(f"Could not warm up {provider} connection: {e!r}")
+
+    def start_keepalive(self, providers: Iterable[str], interval: float) -> None:
+        """Re-warm the pools every `interval` seconds in a daemon thread so they outlive idle periods."""
+        providers = list(providers)
+        if interval <= 0 or self._pinger is not None:
+            return
+
+        def run():
+            while not self._stop.wait(interval):
+                self.warm_up(providers)
+
+        self._pinger = threading.Thread(target=run, name="http-keepalive", daemon=True)
+        self._pinger.start()
+
+    def stats(self) -> Dict[str, Any]:
+        """Per provider: request count and mean latency to response headers, split into cold and warm."""
+        with self._lock:
+            return {
+                provider: {
+                    kind: {"requests": b["requests"], "mean_seconds": round(b["seconds"] / b["requests"], 4)}
+                    for kind, b in buckets.items()
+                }
+                for provider, buckets in self._latency.items()
+            }
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.shutdown()
+
+
+def _build_pool() -> HttpClientPool:
+    config = Config()
+    return HttpClientPool(
+        max_connections=config.get_http_max_connections(),
+        max_keepalive=config.get_http_max_keepalive(),
+        keepalive_expiry=config.get_http_keepalive_expiry(),
+    )
+
+
+# Shared by all sessions in this process; Streamlit keeps imported modules alive across reruns.
+http_clients = _build_pool()
+atexit.register(http_clients.shutdown)
+
+_started = threading.Event()
+
+
+def start_http_clients() -> None:
+    """
+    Startup hook called from app.py: warm up the configured providers in the background and
+    start the keep-alive pinger. Streamlit re-executes app.py on every interaction, so only the
+    first call in a process does anything.
+    """
+    if _started.is_set():
+        return
+    _started.set()
+    config = Config()
+    providers = [p.lower() for p in config.get_http_warmup_providers()]
+    if not providers:
+        return
+    threading.Thread(target=http_clients.warm_up, args=(providers,), name="http-warmup", daemon=True).start()
+    http_clients.start_keepalive(providers, config.get_http_keepalive_ping_interval())
@@ -0,0 +1,142 @@
+# src/langgraphagenticai/LLMS/llm_registry.py
+import atexit
+import hashlib
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+
+def hash_api_key(api_key: str) -> str:
+    """Return a short, non-reversible fingerprint of an API key for use in cache keys."""
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:16]
+
+
+def _close_model(model: Any) -> None:
+    """
+    Best-effort release of the HTTP resources held by a LangChain chat model.
+    ChatOpenAI exposes `root_client`/`root_async_client`, ChatGroq keeps the SDK
+    client behind `client._client`; anything else is left to the garbage collector.
+    """
+    for attr in ("root_client", "root_async_client", "client", "async_client"):
+        client = getattr(model, attr, None)
+        if client is None:
+            continue
+        client = client if hasattr(client, "close") else getattr(client, "_client", None)
+        close = getattr(client, "close", None)
+        if close is None:
+            continue
+        try:
+            result = close()
+            if inspect.isawaitable(result):
+                # Async clients cannot be awaited from here; drop the coroutine quietly.
+                result.close()
+        except Exception as e:
+            logger.warning(f"Error closing {attr} of {type(model).__name__}: {e}")
+
+
+class LLMClientRegistry:
+    """
+    Process-wide registry of chat model clients shared by every Streamlit session.
+
+    Clients are keyed by (provider, model, api key hash) so a Streamlit rerun reuses the
+    client - and its HTTP connection pool - built on a previous run instead of paying
+    client setup and TLS handshakes again. Entries idle for longer than `idle_ttl`
+    seconds are closed and evicted on the next lookup.
+    """
+
+    def __init__(self, idle_ttl: float = 1800.0):
+        self.idle_ttl = idle_ttl
+        self._entries: Dict[Tuple[str, str, str], Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_create(self, provider: str, model_name: str, api_key: str, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached client for (provider, model_name, api_key), building it with `factory` on a miss.
+
+        Args:
+            provider (str): Provider name, e.g. "groq".
+            model_name (str): Model identifier passed to the provider.
+            api_key (str): API key; only its hash is kept in the registry key.
+            factory (Callable[[], Any]): Zero-argument callable that constructs the client.
+
+        Returns:
+            The shared chat model instance.
+        """
+        key = (provider, model_name or "", hash_api_key(api_key))
+        with self._lock:
+            self.evict_idle()
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                entry["last_used"] = time.monotonic()
+                return entry["model"]
+
+            self.misses += 1
+            model = factory()
+            self._entries[key] = {"model": model, "created": time.monotonic(), "last_used": time.monotonic()}
+            logger.info(f"Created {provider} client for model '{model_name}' ({len(self._entries)} cached)")
+            return model
+
+    def evict_idle(self, idle_ttl: Optional[float] = None) -> int:
+        """Close and drop clients that have not been used for `idle_ttl` seconds. Returns the number evicted."""
+        idle_ttl = self.idle_ttl if idle_ttl is None else idle_ttl
+        if idle_ttl is None or idle_ttl <= 0:
+            return 0
+        now = time.monotonic()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if now - entry["last_used"] > idle_ttl]
+            for key in expired:
+                _close_model(self._entries.pop(key)["model"])
+                self.evictions += 1
+                logger.info(f"Evicted idle {key[0]} client for model '{key[1]}'")
+        return len(expired)
+
+    def close(self, provider: str, model_name: str, api_key: str) -> bool:
+        """Explicitly close and remove a single client. Returns True if it was registered."""
+        key = (provider, model_name or "", hash_api_key(api_key))
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        _close_model(entry["model"])
+        return True
+
+    def close_all(self) -> None:
+        """Close every registered client, e.g. on application shutdown."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for entry in entries:
+            _close_model(entry["model"])
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss counters so client reuse can be verified."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+
+def _configured_idle_ttl() -> float:
+    try:
+        return Config().get_llm_client_idle_ttl()
+    except Exception as e:
+        logger.warning(f"Could not read LLM client idle TTL from config; using default: {e}")
+        return 1800.0
+
+
+# Shared by all sessions in this process; Streamlit keeps imported modules alive across reruns.
+llm_registry = LLMClientRegistry(idle_ttl=_configured_idle_ttl())
+atexit.register(llm_registry.close_all)
@@ -0,0 +1,91 @@
+# src/langgraphagenticai/LLMS/model_pipeline.py
+from src.langgraphagenticai.LLMS.coalescing_llm import CoalescingChatModel
+from src.langgraphagenticai.LLMS.concurrency_limit import ConcurrencyLimitedChatModel
+from src.langgraphagenticai.LLMS.fakellm import RecordingChatModel
+from src.langgraphagenticai.LLMS.hedged_llm import HedgedChatModel
+from src.langgraphagenticai.LLMS.llm_registry import hash_api_key
+from src.langgraphagenticai.LLMS.rate_limiter import RateLimitedChatModel, get_rate_limiter, model_api_key
+from src.langgraphagenticai.LLMS.response_cache import with_response_cache
+from src.langgraphagenticai.LLMS.retry_policy import RetryingChatModel
+from src.langgraphagenticai.logging.llm_usage import with_usage_tracking
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+
+def _model_name(model) -> str:
+    return getattr(model, "model_name", None) or getattr(model, "model", "") or ""
+
+
+def _model_label(provider: str, model) -> str:
+    return f"{provider}:{_model_name(model)}"
+
+
+def _wrap_backend(model, provider: str, use_async: bool, config: Config):
+    """
+    Apply the per-provider layers (cassette recording, rate limiting, request coalescing and
+    async concurrency cap) to a single backend. Coalescing sits above the rate limiter, so
+    callers waiting on an identical in-flight request spend no rate-limit budget. The concurrency
+    cap is outermost: coalesced upstream calls run on the coalescing layer's own event loop
+    (see get_flight_loop), where a per-loop cap below it would become one process-wide cap, so
+    it is applied on the caller's loop instead and a waiting caller holds a slot of its own run.
+    """
+    api_key = model_api_key(model)
+    limiter = get_rate_limiter(provider, api_key, _model_name(model))
+    if config.get_llm_record() and provider != "Fake" and config.get_llm_cassette_path():
+        model = RecordingChatModel(inner=model, cassette_path=config.get_llm_cassette_path())
+    if limiter is not None:
+        model = RateLimitedChatModel(
+            inner=model,
+            limiter=limiter,
+            completion_tokens=config.get_rate_limit_completion_tokens(),
+            max_retries=config.get_rate_limit_max_retries(),
+        )
+    if config.get_request_coalescing():
+        model = CoalescingChatModel(inner=model, key_scope=f"{provider}:{hash_api_key(api_key)}")
+    if use_async:
+        model = ConcurrencyLimitedChatModel(
+            inner=model,
+            provider=provider,
+            max_concurrency=config.get_llm_max_concurrency().get(provider, 8),
+        )
+    return model
+
+
+def build_model_pipeline(model, provider: str, usecase: str, use_async: bool = False, secondaries=None):
+    """
+    Wrap a provider chat model with the cross-cutting layers configured in uiconfigfile.ini.
+
+    Wrappers are applied innermost first; the response cache goes on the outermost layer so a
+    cache hit skips every layer below it, and usage tracking is attached there so each logical
+    call is recorded once. Transient-error retries sit just below the cache and around hedging,
+    so a retry starts a fresh hedged call and every attempt counts against the same step deadline.
+
+    Args:
+        model: Chat model returned by one of the LLMS/* provider classes.
+        provider (str): Provider name as shown in the UI, e.g. "Groq".
+        usecase (str): Selected use case, used for per-use-case opt-ins.
+        use_async (bool): Whether the graph will run its nodes on an event loop.
+        secondaries (list): Optional (provider, model) pairs to hedge and fail over to.
+
+    Returns:
+        The wrapped chat model.
+    """
+    config = Config()
+    backend = _wrap_backend(model, provider, use_async, config)
+    if secondaries and config.get_hedging_enabled():
+        backend = HedgedChatModel(
+            models=[backend] + [_wrap_backend(m, p, use_async, config) for p, m in secondaries],
+            labels=[_model_label(provider, model)] + [_model_label(p, m) for p, m in secondaries],
+            hedge_percentile=config.get_hedge_percentile(),
+            initial_hedge_delay=config.get_hedge_initial_delay(),
+            failure_threshold=config.get_circuit_breaker_failures(),
+            reset_timeout=config.get_circuit_breaker_reset(),
+        )
+    if config.get_llm_retry_max_attempts() > 1:
+        backend = RetryingChatModel(
+            inner=backend,
+            max_attempts=config.get_llm_retry_max_attempts(),
+            base_delay=config.get_llm_retry_base_delay(),
+            max_delay=config.get_llm_retry_max_delay(),
+            step_deadline=config.get_llm_step_deadline(),
+        )
+    return with_usage_tracking(with_response_cache(backend, usecase), provider)
@@ -0,0 +1,51 @@
+# src/langgraphagenticai/LLMS/model_router.py
+from typing import Any, Dict
+
+from src.langgraphagenticai.logging.logging_utils import logger
+
+
+class ModelRouter:
+    """
+    Maps the LLM call sites of a use case to model tiers.
+
+    Call sites are short names chosen by the nodes ("structure", "planner", "section" for
+    blog generation, the stage names for SDLC). The "default" tier is the model selected in the
+    sidebar; other tiers, e.g. "fast", are smaller models of the same provider declared in
+    uiconfigfile.ini. Call sites without a route, or routed to a tier that could not be built,
+    use the default model.
+
+    Args:
+        default_model: The user-selected model (already wrapped by build_model_pipeline).
+        tier_models (dict): Tier name -> model for every non-default tier that was built.
+        routes (dict): Call site -> tier name for the current use case.
+    """
+
+    DEFAULT_TIER = "default"
+
+    def __init__(self, default_model, tier_models: Dict[str, Any] = None, routes: Dict[str, str] = None):
+        self.default_model = default_model
+        self.tier_models = tier_models or {}
+        self.routes = routes or {}
+
+    def tier_for(self, call_site: str) -> str:
+        tier = self.routes.get(call_site, self.DEFAULT_TIER)
+        return tier if tier in self.tier_models else self.DEFAULT_TIER
+
+    def for_call(self, call_site: str):
+        """Return the model that should serve `call_site`."""
+        tier = self.tier_for(call_site)
+        return self.default_model if tier == self.DEFAULT_TIER else self.tier_models[tier]
+
+    def describe(self) -> Dict[str, str]:
+        """Effective call site -> tier mapping, for logging."""
+        return {call_site: self.tier_for(call_site) for call_site in self.routes}
+
+
+def route_model(model, router, call_site: str):
+    """Return the model for `call_site` from `router`, or `model` when no router is configured."""
+    if router is None:
+        return model
+    routed = router.for_call(call_site)
+    if routed is not model:
+        logger.info(f"Routing '{call_site}' call to the '{router.tier_for(call_site)}' model tier")
+    return routed
@@ -0,0 +1,308 @@
+# src/langgraphagenticai/LLMS/rate_limiter.py
+import asyncio
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+
+from src.langgraphagenticai.LLMS.delegating_llm import DelegatingChatModel
+from src.langgraphagenticai.LLMS.llm_registry import hash_api_key
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+
+class _TokenBucket:
+    """Token bucket refilled continuously at `per_minute / 60` units per second, holding at most one minute of budget."""
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.level = per_minute
+        self.updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.level = min(self.per_minute, self.level + (now - self.updated) * self.per_minute / 60.0)
+        self.updated = now
+
+    def wait_time(self, amount: float, now: float) -> float:
+        """Seconds until `amount` units are available; requests larger than the bucket wait for a full bucket."""
+        self._refill(now)
+        needed = min(amount, self.per_minute)
+        if self.level >= needed:
+            return 0.0
+        return (needed - self.level) * 60.0 / self.per_minute
+
+    def consume(self, amount: float) -> None:
+        # The level may go negative; an oversized request is paid back before the next one runs.
+        self.level -= amount
+
+    def set_rate(self, per_minute: float, now: float) -> None:
+        self._refill(now)
+        self.per_minute = per_minute
+        self.level = min(self.level, per_minute)
+
+    def drain(self, now: float) -> None:
+        self._refill(now)
+        self.level = min(self.level, 0.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    Client-side rate limiter for one provider model and API key.
+
+    Requests and estimated tokens are budgeted with two token buckets sized from the provider's
+    published RPM/TPM limits. The buckets run at `factor` times those limits: every 429 halves
+    the factor (multiplicative decrease) and pauses the key for the provider's Retry-After, and
+    every successful call adds `increase_step` back (additive increase), so throughput settles
+    just below the real ceiling instead of repeatedly tripping it.
+    """
+
+    def __init__(self, rpm: float, tpm: float, decrease_factor: float = 0.5,
+                 increase_step: float = 0.05, min_factor: float = 0.05):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.decrease_factor = decrease_factor
+        self.increase_step = increase_step
+        self.min_factor = min_factor
+        self.factor = 1.0
+        self._requests = _TokenBucket(rpm)
+        self._tokens = _TokenBucket(tpm)
+        self._paused_until = 0.0
+        self._last_decrease = 0.0
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.rate_limited = 0
+        self.waited_seconds = 0.0
+
+    def _try_acquire(self, tokens: float) -> float:
+        """Reserve one request and `tokens` tokens if both are available now; otherwise return the wait in seconds."""
+        with self._lock:
+            now = time.monotonic()
+            wait = max(
+                self._paused_until - now,
+                self._requests.wait_time(1, now),
+                self._tokens.wait_time(tokens, now),
+            )
+            if wait <= 0:
+                self._requests.consume(1)
+                self._tokens.consume(tokens)
+                self.requests += 1
+            return wait
+
+    def acquire(self, tokens: float) -> None:
+        """Block the calling thread until a request of `tokens` estimated tokens fits the budget."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return
+            self.waited_seconds += wait
+            time.sleep(wait)
+
+    async def aacquire(self, tokens: float) -> None:
+        """Async counterpart of `acquire`; waits without blocking the event loop."""
+        while True:
+            wait = self._try_acquire(tokens)
+            if wait <= 0:
+                return
+            self.waited_seconds += wait
+            await asyncio.sleep(wait)
+
+    def reconcile(self, estimated: float, actual: Optional[float]) -> None:
+        """Correct the token bucket once the provider reports the real token usage of a call."""
+        if actual is None:
+            return
+        with self._lock:
+            self._tokens.consume(actual - estimated)
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self.factor < 1.0:
+                self._set_factor(min(1.0, self.factor + self.increase_step))
+
+    def on_rate_limited(self, retry_after: Optional[float] = None) -> float:
+        """
+        Record a 429 from the provider and return how long the caller should wait before retrying.
+
+        Concurrent calls usually fail together, so the factor is cut at most once per cooldown.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.rate_limited += 1
+            cooldown = retry_after if retry_after and retry_after > 0 else 60.0 / max(self._requests.per_minute, 1.0)
+            if now >= self._last_decrease + cooldown:
+                self._set_factor(max(self.min_factor, self.factor * self.decrease_factor))
+                self._last_decrease = now
+                self._requests.drain(now)
+                self._tokens.drain(now)
+                logger.warning(f"Rate limited by provider; throttling to {self.factor:.0%} of configured limits")
+            self._paused_until = max(self._paused_until, now + cooldown)
+            return self._paused_until - now
+
+    def _set_factor(self, factor: float) -> None:
+        now = time.monotonic()
+        self.factor = factor
+        self._requests.set_rate(self.rpm * factor, now)
+        self._tokens.set_rate(self.tpm * factor, now)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "factor": round(self.factor, 3),
+                "effective_rpm": round(self.rpm * self.factor, 1),
+                "effective_tpm": round(self.tpm * self.factor, 1),
+                "requests": self.requests,
+                "rate_limited": self.rate_limited,
+                "waited_seconds": round(self.waited_seconds, 2),
+            }
+
+
+_limiters: Dict[Tuple[str, str, str], AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, api_key: str, model_name: str = "") -> Optional[AdaptiveRateLimiter]:
+    """
+    Return the process-wide limiter for (provider, model, api key), or None if no limits are configured.
+
+    Provider quotas are enforced per key and model, so every session using the same key and model
+    shares one budget while a second model of the same key gets its own.
+    """
+    limits = Config().get_rate_limits().get(provider)
+    if not limits:
+        return None
+    key = (provider, model_name or "", hash_api_key(api_key))
+    with _limiters_lock:
+        if key not in _limiters:
+            rpm, tpm = limits
+            _limiters[key] = AdaptiveRateLimiter(rpm=rpm, tpm=tpm)
+        return _limiters[key]
+
+
+def rate_limiter_stats() -> Dict[str, Dict[str, Any]]:
+    """Stats for every limiter in the process, keyed by provider, model and key fingerprint."""
+    with _limiters_lock:
+        limiters = dict(_limiters)
+    return {
+        f"{provider}:{model_name}:{key_hash}": limiter.stats()
+        for (provider, model_name, key_hash), limiter in limiters.items()
+    }
+
+
+def model_api_key(model) -> str:
+    """Read the API key a LangChain provider model was built with."""
+    for attr in ("groq_api_key", "openai_api_key", "google_api_key"):
+        secret = getattr(model, attr, None)
+        if secret is not None:
+            return secret.get_secret_value() if hasattr(secret, "get_secret_value") else str(secret)
+    return ""
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Recognise 429 responses from the Groq/OpenAI SDKs and the Google GenAI client."""
+    if getattr(error, "status_code", None) == 429 or getattr(error, "code", None) == 429:
+        return True
+    if type(error).__name__ in ("RateLimitError", "ResourceExhausted"):
+        return True
+    return "RESOURCE_EXHAUSTED" in str(error)
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def estimate_tokens(messages: List[BaseMessage], completion_tokens: int) -> int:
+    """Rough token estimate (~4 characters per token) for the prompt plus the completion budget."""
+    chars = sum(len(str(message.content)) for message in messages)
+    return chars // 4 + completion_tokens
+
+
+class RateLimitedChatModel(DelegatingChatModel):
+    """
+    Waits for the shared AdaptiveRateLimiter before each call and retries calls rejected with a 429.
+
+    Streaming calls are only retried if the provider rejected them before the first chunk.
+    """
+
+    limiter: AdaptiveRateLimiter
+    completion_tokens: int = 512
+    max_retries: int = 4
+
+    def _usage_tokens(self, result: ChatResult) -> Optional[int]:
+        usage = getattr(result.generations[0].message, "usage_metadata", None) if result.generations else None
+        return usage.get("total_tokens") if usage else None
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        estimated = estimate_tokens(messages, self.completion_tokens)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(estimated)
+            try:
+                result = super()._generate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                time.sleep(self.limiter.on_rate_limited(_retry_after(e)))
+                continue
+            self.limiter.on_success()
+            self.limiter.reconcile(estimated, self._usage_tokens(result))
+            return result
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        estimated = estimate_tokens(messages, self.completion_tokens)
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.aacquire(estimated)
+            try:
+                result = await super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.limiter.on_rate_limited(_retry_after(e)))
+                continue
+            self.limiter.on_success()
+            self.limiter.reconcile(estimated, self._usage_tokens(result))
+            return result
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        estimated = estimate_tokens(messages, self.completion_tokens)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(estimated)
+            started = False
+            try:
+                for chunk in super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    started = True
+                    yield chunk
+            except Exception as e:
+                if started or not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                time.sleep(self.limiter.on_rate_limited(_retry_after(e)))
+                continue
+            self.limiter.on_success()
+            return
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        estimated = estimate_tokens(messages, self.completion_tokens)
+        for attempt in range(self.max_retries + 1):
+            await self.limiter.aacquire(estimated)
+            started = False
+            try:
+                async for chunk in super()._astream(messages, stop=stop, run_manager=run_manager, **kwargs):
+                    started = True
+                    yield chunk
+            except Exception as e:
+                if started or not is_rate_limit_error(e) or attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self.limiter.on_rate_limited(_retry_after(e)))
+                continue
+            self.limiter.on_success()
+            return
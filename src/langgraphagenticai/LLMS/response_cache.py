@@ -0,0 +1,188 @@
+# src/langgraphagenticai/LLMS/response_cache.py
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from langchain_core._api import LangChainBetaWarning
+from langchain_core.caches import BaseCache, RETURN_VAL_TYPE
+from langchain_core.load import dumps, loads
+
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+# dumps/loads are marked beta and would warn on every disk write and hit.
+warnings.filterwarnings("ignore", category=LangChainBetaWarning, module=__name__)
+
+
+class ResponseCache(BaseCache):
+    """
+    Exact-match cache for chat model responses.
+
+    LangChain hands every cache call a serialized prompt (the full message list) and an
+    `llm_string` describing the provider, model and generation parameters, so the key is
+    a SHA-256 over both. Lookups hit an in-memory LRU with a TTL first and fall back to a
+    persistent SQLite table, promoting disk hits back into memory. Every write purges rows
+    older than `disk_ttl` and the least recently used ones beyond `max_disk_entries`.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = 512,
+                 ttl: float = 3600.0, disk_ttl: float = 7 * 24 * 3600.0, max_disk_entries: int = 10000):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.disk_ttl = disk_ttl
+        self.max_disk_entries = max_disk_entries
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._conn = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_response_cache "
+                "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL, "
+                "last_used REAL NOT NULL DEFAULT 0)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(llm_response_cache)")}
+            if "last_used" not in columns:
+                # Tables created before disk eviction existed.
+                self._conn.execute("ALTER TABLE llm_response_cache ADD COLUMN last_used REAL NOT NULL DEFAULT 0")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS llm_response_cache_last_used ON llm_response_cache (last_used)")
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        """Canonical cache key for a (prompt, llm_string) pair."""
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        key = self.make_key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, value = entry
+                if now - created_at <= self.ttl:
+                    self._memory.move_to_end(key)
+                    self.memory_hits += 1
+                    return value
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT response, created_at FROM llm_response_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] <= self.disk_ttl:
+                    try:
+                        value = loads(row[0], allowed_objects="core", valid_namespaces=[])
+                    except Exception as e:
+                        logger.warning(f"Discarding undecodable response cache entry: {e}")
+                    else:
+                        self._conn.execute("UPDATE llm_response_cache SET last_used = ? WHERE key = ?", (now, key))
+                        self._conn.commit()
+                        self._remember(key, value, now)
+                        self.disk_hits += 1
+                        return value
+
+            self.misses += 1
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        key = self.make_key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            self._remember(key, return_val, now)
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO llm_response_cache (key, response, created_at, last_used) "
+                        "VALUES (?, ?, ?, ?)",
+                        (key, dumps(return_val), now, now),
+                    )
+                    self._evict_disk(now)
+                    self._conn.commit()
+                except Exception as e:
+                    logger.warning(f"Could not persist LLM response to cache: {e}")
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM llm_response_cache")
+                self._conn.commit()
+
+    def _remember(self, key: str, value: RETURN_VAL_TYPE, created_at: float) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self, now: float) -> None:
+        """Delete expired rows and the least recently used ones beyond max_disk_entries."""
+        deleted = self._conn.execute(
+            "DELETE FROM llm_response_cache WHERE created_at < ?", (now - self.disk_ttl,)
+        ).rowcount
+        deleted += self._conn.execute(
+            "DELETE FROM llm_response_cache WHERE key IN (SELECT key FROM llm_response_cache "
+            "ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_disk_entries,)
+        ).rowcount
+        self.evictions += max(deleted, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters for the memory and disk tiers."""
+        with self._lock:
+            hits = self.memory_hits + self.disk_hits
+            lookups = hits + self.misses
+            return {
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+            }
+
+
+_response_cache: Optional[ResponseCache] = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """Return the process-wide response cache, creating it from uiconfigfile.ini on first use."""
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            config = Config()
+            db_path = config.get_response_cache_path()
+            if db_path and not os.path.isabs(db_path):
+                db_path = str(Path(__file__).resolve().parents[3] / db_path)
+            _response_cache = ResponseCache(
+                db_path=db_path or None,
+                max_entries=config.get_response_cache_max_entries(),
+                ttl=config.get_response_cache_ttl(),
+                disk_ttl=config.get_response_cache_disk_ttl(),
+                max_disk_entries=config.get_response_cache_max_disk_entries(),
+            )
+        return _response_cache
+
+
+def with_response_cache(model, usecase: str):
+    """
+    Return `model` with the shared response cache attached if caching is enabled for `usecase`.
+
+    The registry hands out one model instance per provider/model/key, so the cache is set on a
+    shallow copy; the copy still shares the underlying HTTP clients.
+    """
+    if usecase not in Config().get_response_cache_usecases():
+        return model
+    return model.model_copy(update={"cache": get_response_cache()})
@@ -0,0 +1,222 @@
+# src/langgraphagenticai/LLMS/retry_policy.py
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import AsyncCallbackManagerForLLMRun, CallbackManagerForLLMRun
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGenerationChunk, ChatResult
+from tenacity import AsyncRetrying, RetryCallState, Retrying, retry_if_exception, stop_after_attempt, wait_random_exponential
+from tenacity.stop import stop_base
+
+from src.langgraphagenticai.LLMS.delegating_llm import DelegatingChatModel
+from src.langgraphagenticai.LLMS.rate_limiter import is_rate_limit_error
+from src.langgraphagenticai.logging.logging_utils import logger
+
+_RETRYABLE_STATUS = {408, 500, 502, 503, 504, 529}
+_RETRYABLE_NAMES = ("Timeout", "APIConnectionError", "ConnectError", "RemoteProtocolError",
+                    "ServiceUnavailable", "InternalServerError", "DeadlineExceeded", "ServerError")
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """
+    Transient failures worth retrying: timeouts, connection errors and 5xx responses.
+
+    429s are left to RateLimitedChatModel, which already waits for the provider's Retry-After;
+    retrying them here as well would multiply the attempts. Everything else (auth, bad request,
+    validation) fails the same way on every attempt.
+    """
+    if is_rate_limit_error(error):
+        return False
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError, ConnectionError)):
+        return True
+    status = getattr(error, "status_code", None) or getattr(error, "code", None)
+    if isinstance(status, int) and status in _RETRYABLE_STATUS:
+        return True
+    return any(name in type(error).__name__ for name in _RETRYABLE_NAMES)
+
+
+class _StepDeadlines:
+    """
+    Deadline of each graph step, measured from the first LLM call seen in it.
+
+    Steps are identified by thread_id and the task's checkpoint namespace from the run metadata
+    LangGraph adds to every call, so all calls and retries of one node execution share a budget.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._started: "OrderedDict[tuple, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def deadline(self, metadata: Dict[str, Any], budget: float) -> float:
+        now = time.monotonic()
+        if budget <= 0:
+            return float("inf")
+        if "langgraph_checkpoint_ns" not in metadata:
+            return now + budget
+        key = (metadata.get("thread_id"), metadata["langgraph_checkpoint_ns"], metadata.get("langgraph_step"))
+        with self._lock:
+            started = self._started.setdefault(key, now)
+            self._started.move_to_end(key)
+            while len(self._started) > self.max_entries:
+                self._started.popitem(last=False)
+        return started + budget
+
+
+_step_deadlines = _StepDeadlines()
+_stats_lock = threading.Lock()
+_retry_stats = {"calls": 0, "retried_calls": 0, "retries": 0, "retry_delay": 0.0, "gave_up": 0, "deadline_exceeded": 0}
+
+
+def retry_stats() -> Dict[str, Any]:
+    with _stats_lock:
+        return {**_retry_stats, "retry_delay": round(_retry_stats["retry_delay"], 3)}
+
+
+class _StopAtDeadline(stop_base):
+    """Stop retrying when the next backoff sleep would end past the step deadline."""
+
+    def __init__(self, deadline: float):
+        self.deadline = deadline
+
+    def __call__(self, retry_state: RetryCallState) -> bool:
+        return time.monotonic() + (retry_state.upcoming_sleep or 0.0) >= self.deadline
+
+
+class RetryingChatModel(DelegatingChatModel):
+    """
+    Retries transient LLM errors with exponential backoff and full jitter, within a step deadline.
+
+    Each retry sleeps a random time between 0 and min(max_delay, base_delay * 2**attempt). No
+    attempt starts, and async attempts are cut off, once `step_deadline` seconds have passed since
+    the graph step made its first LLM call, so retries stay within the user-facing latency budget.
+    Streaming calls are only retried if they fail before the first chunk.
+
+    Attempts and total backoff are returned in `llm_output` (and set on the exception when the
+    call gives up) so the usage ledger records them per call; `retry_stats()` has process totals.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 8.0
+    step_deadline: float = 90.0
+
+    def _deadline(self, run_manager) -> float:
+        return _step_deadlines.deadline(getattr(run_manager, "metadata", None) or {}, self.step_deadline)
+
+    def _retry_kwargs(self, deadline: float) -> Dict[str, Any]:
+        return {
+            "stop": stop_after_attempt(self.max_attempts) | _StopAtDeadline(deadline),
+            "wait": wait_random_exponential(multiplier=self.base_delay, max=self.max_delay),
+            "retry": retry_if_exception(is_retryable_error),
+            "before_sleep": self._before_sleep,
+            "reraise": True,
+        }
+
+    @staticmethod
+    def _before_sleep(retry_state: RetryCallState) -> None:
+        logger.warning(f"Transient LLM error on attempt {retry_state.attempt_number}, retrying in "
+                       f"{retry_state.upcoming_sleep:.2f}s: {retry_state.outcome.exception()!r}")
+
+    def _record(self, retrying, error: Optional[BaseException] = None) -> Dict[str, Any]:
+        attempts = retrying.statistics.get("attempt_number", 1)
+        delay = retrying.statistics.get("idle_for", 0.0)
+        with _stats_lock:
+            _retry_stats["calls"] += 1
+            _retry_stats["retries"] += attempts - 1
+            _retry_stats["retry_delay"] += delay
+            _retry_stats["retried_calls"] += 1 if attempts > 1 else 0
+            if error is not None and is_retryable_error(error):
+                _retry_stats["gave_up"] += 1
+                # Gave up before using every attempt: the step deadline stopped it.
+                _retry_stats["deadline_exceeded"] += 1 if attempts < self.max_attempts else 0
+        metrics = {"retry_attempts": attempts, "retry_delay": round(delay, 3)}
+        if error is not None:
+            try:
+                error.retry_metrics = metrics
+            except AttributeError:
+                pass
+        return metrics
+
+    def _remaining(self, deadline: float) -> Optional[float]:
+        return None if deadline == float("inf") else max(deadline - time.monotonic(), 0.001)
+
+    def _with_metrics(self, result: ChatResult, metrics: Dict[str, Any]) -> ChatResult:
+        result.llm_output = {**(result.llm_output or {}), **metrics}
+        return result
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        deadline = self._deadline(run_manager)
+        retrying = Retrying(**self._retry_kwargs(deadline))
+        try:
+            result = retrying(super()._generate, messages, stop=stop, run_manager=run_manager, **kwargs)
+        except BaseException as e:
+            self._record(retrying, e)
+            raise
+        return self._with_metrics(result, self._record(retrying))
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        deadline = self._deadline(run_manager)
+        retrying = AsyncRetrying(**self._retry_kwargs(deadline))
+
+        async def attempt() -> ChatResult:
+            return await asyncio.wait_for(
+                super(RetryingChatModel, self)._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs),
+                timeout=self._remaining(deadline),
+            )
+
+        try:
+            result = await retrying(attempt)
+        except BaseException as e:
+            self._record(retrying, e)
+            raise
+        return self._with_metrics(result, self._record(retrying))
+
+    def _stream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> Iterator[ChatGenerationChunk]:
+        deadline = self._deadline(run_manager)
+        retrying = Retrying(**self._retry_kwargs(deadline))
+
+        def start():
+            chunks = super(RetryingChatModel, self)._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            return next(chunks, None), chunks
+
+        try:
+            first, chunks = retrying(start)
+        except BaseException as e:
+            self._record(retrying, e)
+            raise
+        self._record(retrying)
+        if first is not None:
+            yield first
+            yield from chunks
+
+    async def _astream(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                       run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+                       **kwargs: Any) -> AsyncIterator[ChatGenerationChunk]:
+        deadline = self._deadline(run_manager)
+        retrying = AsyncRetrying(**self._retry_kwargs(deadline))
+
+        async def start():
+            chunks = super(RetryingChatModel, self)._astream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            try:
+                first = await asyncio.wait_for(chunks.__anext__(), timeout=self._remaining(deadline))
+            except StopAsyncIteration:
+                first = None
+            return first, chunks
+
+        try:
+            first, chunks = await retrying(start)
+        except BaseException as e:
+            self._record(retrying, e)
+            raise
+        self._record(retrying)
+        if first is not None:
+            yield first
+            async for chunk in chunks:
+                yield chunk
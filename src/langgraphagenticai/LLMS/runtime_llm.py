@@ -0,0 +1,98 @@
+# src/langgraphagenticai/LLMS/runtime_llm.py
+from typing import Any, List, Optional, Sequence
+
+from langchain_core.callbacks import (AsyncCallbackManager, AsyncCallbackManagerForLLMRun, CallbackManager,
+                                     CallbackManagerForLLMRun)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables.config import ensure_config
+
+from src.langgraphagenticai.LLMS.model_router import ModelRouter
+
+# Keys of config["configurable"] that carry the session's models into a shared graph.
+LLM_CONFIG_KEY = "llm"
+ROUTER_CONFIG_KEY = "router"
+
+
+def runtime_configurable(model, router=None) -> dict:
+    """The config["configurable"] entries a RuntimeChatModel resolves its model from."""
+    return {LLM_CONFIG_KEY: model, ROUTER_CONFIG_KEY: router}
+
+
+def _child_callbacks(run_manager, manager_class):
+    """Callbacks for a call nested under `run_manager`'s run (LLM run managers have no get_child)."""
+    if run_manager is None:
+        return None
+    return manager_class(
+        handlers=run_manager.inheritable_handlers,
+        inheritable_handlers=run_manager.inheritable_handlers,
+        parent_run_id=run_manager.run_id,
+        tags=run_manager.inheritable_tags,
+        inheritable_tags=run_manager.inheritable_tags,
+        metadata=run_manager.inheritable_metadata,
+        inheritable_metadata=run_manager.inheritable_metadata,
+    )
+
+
+class RuntimeChatModel(BaseChatModel):
+    """
+    Stand-in chat model compiled into graphs that are shared by every session.
+
+    Each call is forwarded to the model passed in config["configurable"]["llm"] of the graph run
+    (or, for a non-default `tier`, to that tier of config["configurable"]["router"]), so one
+    compiled graph serves any number of sessions, each with its own provider, API key and
+    wrapper pipeline. The configurable values reach the call through LangChain's run context, so
+    nodes keep calling `invoke`/`ainvoke`/`with_structured_output`/`bind_tools` unchanged.
+
+    The resolved model is invoked as a child run: its response cache and usage tracking apply as
+    before, and in "messages" stream mode LangGraph streams its tokens.
+
+    Args:
+        tier (str): Model tier to resolve; "default" is the session's selected model.
+        model_name (str): Name of the model the graph was built for, reported to code that sizes
+            prompts by model (see `model_name_of`).
+    """
+
+    tier: str = ModelRouter.DEFAULT_TIER
+    model_name: str = ""
+
+    @property
+    def _llm_type(self) -> str:
+        return "runtime"
+
+    def resolve(self):
+        """Return the session model this call should use, read from the current run's config."""
+        configurable = ensure_config().get("configurable", {})
+        router = configurable.get(ROUTER_CONFIG_KEY)
+        if router is not None and self.tier in router.tier_models:
+            return router.tier_models[self.tier]
+        model = configurable.get(LLM_CONFIG_KEY) or getattr(router, "default_model", None)
+        if model is None:
+            raise ValueError("No chat model in config['configurable']['llm'] for a graph built with runtime models")
+        return model
+
+    def _target(self, kwargs: dict):
+        model = self.resolve()
+        tools = kwargs.pop("runtime_tools", None)
+        if tools is not None:
+            model = model.bind_tools(tools, **kwargs.pop("runtime_tool_kwargs", {}))
+        return model
+
+    def _generate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                  run_manager: Optional[CallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        model = self._target(kwargs)
+        callbacks = _child_callbacks(run_manager, CallbackManager)
+        message = model.invoke(messages, config={"callbacks": callbacks}, stop=stop, **kwargs)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(self, messages: List[BaseMessage], stop: Optional[List[str]] = None,
+                         run_manager: Optional[AsyncCallbackManagerForLLMRun] = None, **kwargs: Any) -> ChatResult:
+        model = self._target(kwargs)
+        callbacks = _child_callbacks(run_manager, AsyncCallbackManager)
+        message = await model.ainvoke(messages, config={"callbacks": callbacks}, stop=stop, **kwargs)
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        """Defer tool formatting to the resolved model, whose provider decides the tool schema."""
+        return self.bind(runtime_tools=list(tools), runtime_tool_kwargs=kwargs)
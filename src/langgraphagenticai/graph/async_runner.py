@@ -0,0 +1,47 @@
+# src/langgraphagenticai/graph/async_runner.py
+import asyncio
+from typing import Any, Iterator, Optional
+
+from src.langgraphagenticai.logging.logging_utils import logger
+
+
+class AsyncGraphRunner:
+    """
+    Runs a graph compiled from async nodes behind the synchronous `stream`/`invoke` API the UI uses.
+
+    Each call drives `graph.astream`/`graph.ainvoke` on a single event loop owned by the calling
+    thread, so all LLM requests of a run - e.g. every blog section worker - are awaited concurrently
+    on that loop. Running on the caller's thread keeps Streamlit's script context available to
+    nodes that read `st.session_state`. Every other attribute (get_state, update_state, ...) is
+    forwarded to the compiled graph.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def stream(self, input: Any, config: Optional[dict] = None, **kwargs: Any) -> Iterator[Any]:
+        loop = asyncio.new_event_loop()
+        events = self.graph.astream(input, config, **kwargs)
+        try:
+            while True:
+                try:
+                    yield loop.run_until_complete(events.__anext__())
+                except StopAsyncIteration:
+                    break
+        finally:
+            try:
+                loop.run_until_complete(events.aclose())
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception as e:
+                logger.warning(f"Error shutting down async graph stream: {e}")
+            loop.close()
+
+    def invoke(self, input: Any, config: Optional[dict] = None, **kwargs: Any) -> Any:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(self.graph.ainvoke(input, config, **kwargs))
+        finally:
+            loop.close()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.graph, name)
@@ -0,0 +1,205 @@
+# src/langgraphagenticai/graph/checkpoint_blobs.py
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Set, Tuple
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.langgraphagenticai.logging.logging_utils import logger
+
+try:
+    import zstandard
+except ImportError:  # zstd is optional; zlib is always available
+    zstandard = None
+
+# Key of the placeholder that replaces a large string in a checkpoint's channel values.
+BLOB_MARKER = "__cas_blob__"
+# Serialized type of a write whose value is a large string stored as a blob.
+BLOB_TYPE = "cas"
+_MARKER_PATTERN = re.compile(rb"__cas_blob__[\s\S]{1,3}?([0-9a-f]{64})")
+
+
+class CasBlobStore:
+    """
+    Content-addressed store for large checkpoint strings, in a table of the checkpoint database.
+
+    Blobs are keyed by the SHA-256 of their text and stored once, compressed with zstd when the
+    `zstandard` package is installed and zlib otherwise; the codec is stored per blob, so a
+    database written with either can be read back. Hashes known to be stored are remembered, so
+    an unchanged artifact costs a hash per checkpoint instead of compression and an INSERT, and
+    recently read blobs are kept decompressed in a small LRU.
+
+    The store has its own connection (WAL lets it read while the checkpointer writes) because the
+    checkpointer serializes values while holding its connection's lock.
+
+    Args:
+        db_path (str): SQLite database file, normally the checkpointer's.
+        codec (str): "zstd" or "zlib".
+        level (int): Compression level.
+        read_cache_size (int): Number of decompressed blobs kept in memory.
+    """
+
+    def __init__(self, db_path: str, codec: str = "zstd", level: int = 3, read_cache_size: int = 256):
+        if codec == "zstd" and zstandard is None:
+            logger.warning("zstandard is not installed; compressing checkpoint blobs with zlib")
+            codec = "zlib"
+        self.codec = codec
+        self.level = level
+        self.read_cache_size = read_cache_size
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30.0, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoint_blobs (hash TEXT PRIMARY KEY, codec TEXT NOT NULL, "
+            "size INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        self._lock = threading.Lock()
+        self._known: "OrderedDict[str, float]" = OrderedDict()
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._stats = {"stored": 0, "reused": 0, "raw_bytes": 0, "stored_bytes": 0, "collected": 0}
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.codec == "zstd":
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        return zlib.compress(data, self.level)
+
+    @staticmethod
+    def _decompress(codec: str, data: bytes) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise RuntimeError("Checkpoint blob was written with zstd; install the zstandard package to read it")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return zlib.decompress(data)
+
+    def put(self, text: str) -> str:
+        """Store `text` if it is not stored yet and return its hash."""
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock:
+            if digest in self._known:
+                self._known[digest] = time.monotonic()
+                self._known.move_to_end(digest)
+                self._stats["reused"] += 1
+                return digest
+        compressed = self._compress(data)
+        with self._lock:
+            inserted = self._conn.execute(
+                "INSERT OR IGNORE INTO checkpoint_blobs (hash, codec, size, data) VALUES (?, ?, ?, ?)",
+                (digest, self.codec, len(data), compressed),
+            ).rowcount
+            self._known[digest] = time.monotonic()
+            while len(self._known) > 4096:
+                self._known.popitem(last=False)
+            if inserted:
+                self._stats["stored"] += 1
+                self._stats["raw_bytes"] += len(data)
+                self._stats["stored_bytes"] += len(compressed)
+            else:
+                self._stats["reused"] += 1
+        return digest
+
+    def get(self, digest: str) -> str:
+        with self._lock:
+            text = self._cache.get(digest)
+            if text is not None:
+                self._cache.move_to_end(digest)
+                return text
+            row = self._conn.execute("SELECT codec, data FROM checkpoint_blobs WHERE hash = ?", (digest,)).fetchone()
+        if row is None:
+            raise KeyError(f"Checkpoint blob {digest} is missing")
+        text = self._decompress(row[0], row[1]).decode("utf-8")
+        with self._lock:
+            self._cache[digest] = text
+            while len(self._cache) > self.read_cache_size:
+                self._cache.popitem(last=False)
+        return text
+
+    def collect(self, live: Set[str], grace: float = 60.0) -> int:
+        """
+        Delete blobs outside `live`, except those handed out in the last `grace` seconds: a
+        checkpoint serialized just before the scan may not be in the database yet.
+        """
+        now = time.monotonic()
+        with self._lock:
+            recent = {digest for digest, touched in self._known.items() if now - touched < grace}
+            stored = [row[0] for row in self._conn.execute("SELECT hash FROM checkpoint_blobs")]
+            dead = [digest for digest in stored if digest not in live and digest not in recent]
+            self._conn.executemany("DELETE FROM checkpoint_blobs WHERE hash = ?", [(d,) for d in dead])
+            for digest in dead:
+                self._known.pop(digest, None)
+                self._cache.pop(digest, None)
+            self._stats["collected"] += len(dead)
+        return len(dead)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            ratio = self._stats["stored_bytes"] / self._stats["raw_bytes"] if self._stats["raw_bytes"] else None
+            return {**self._stats, "codec": self.codec, "compression_ratio": round(ratio, 3) if ratio else None}
+
+
+def referenced_blobs(rows: Iterable[Tuple[Optional[str], Optional[bytes]]]) -> Set[str]:
+    """Hashes referenced by serialized checkpoints or writes, given as (type, bytes) rows."""
+    live = set()
+    for type_, data in rows:
+        if not data:
+            continue
+        if type_ == BLOB_TYPE:
+            live.add(data.decode("ascii"))
+        else:
+            live.update(match.decode("ascii") for match in _MARKER_PATTERN.findall(data))
+    return live
+
+
+class BlobStoreSerializer:
+    """
+    Checkpoint serializer that keeps large strings in a CasBlobStore.
+
+    String channel values of at least `min_size` characters (the SDLC artifacts, blog drafts)
+    are replaced in each checkpoint by a {BLOB_MARKER: hash} placeholder, and a write of such a
+    string is stored as its hash with type BLOB_TYPE. Everything else, and the checkpoint around
+    the placeholders, goes through the wrapped serializer unchanged.
+
+    Args:
+        store (CasBlobStore): Where large strings are kept.
+        min_size (int): Shortest string moved into the store.
+        serde: Wrapped serializer; JsonPlusSerializer by default.
+    """
+
+    def __init__(self, store: CasBlobStore, min_size: int = 2048, serde=None):
+        self.store = store
+        self.min_size = min_size
+        self.serde = serde or JsonPlusSerializer()
+
+    def _is_large(self, value: Any) -> bool:
+        return isinstance(value, str) and len(value) >= self.min_size
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        if self._is_large(obj):
+            return BLOB_TYPE, self.store.put(obj).encode("ascii")
+        if isinstance(obj, dict) and isinstance(obj.get("channel_values"), dict):
+            obj = {**obj, "channel_values": {
+                key: {BLOB_MARKER: self.store.put(value)} if self._is_large(value) else value
+                for key, value in obj["channel_values"].items()
+            }}
+        return self.serde.dumps_typed(obj)
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == BLOB_TYPE:
+            return self.store.get(payload.decode("ascii"))
+        obj = self.serde.loads_typed(data)
+        if isinstance(obj, dict) and isinstance(obj.get("channel_values"), dict):
+            obj["channel_values"] = {
+                key: self.store.get(value[BLOB_MARKER]) if isinstance(value, dict) and BLOB_MARKER in value else value
+                for key, value in obj["channel_values"].items()
+            }
+        return obj
+
+    def with_msgpack_allowlist(self, extra_allowlist) -> "BlobStoreSerializer":
+        """Keep LangGraph's strict msgpack allowlist working on the wrapped serializer."""
+        serde = self.serde.with_msgpack_allowlist(extra_allowlist)
+        return self if serde is self.serde else BlobStoreSerializer(self.store, self.min_size, serde)
@@ -0,0 +1,201 @@
+# src/langgraphagenticai/graph/checkpoint_retention.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+# Channel values written when a reviewer accepts a stage: SDLC feedback and blog draft approval.
+ACCEPTANCE_MARKERS = {"feedback_decision": "accept", "draft_approved": True}
+
+
+class RetentionPolicy:
+    """
+    Limits on the checkpoints kept by a checkpointer; 0 disables a limit.
+
+    Args:
+        keep_last (int): Checkpoints kept per thread and namespace; older ones are deleted.
+        idle_ttl (float): Seconds without a new checkpoint after which a whole thread is deleted.
+        max_bytes (int): Cap on the serialized size of all threads; least recently written threads
+            are deleted whole until the total fits.
+        compact_on_accept (bool): Once a stage is accepted, keep only the checkpoint recording the
+            acceptance; the review loop that led to it is not needed to resume.
+    """
+
+    def __init__(self, keep_last: int = 0, idle_ttl: float = 0.0, max_bytes: int = 0, compact_on_accept: bool = False):
+        self.keep_last = keep_last
+        self.idle_ttl = idle_ttl
+        self.max_bytes = max_bytes
+        self.compact_on_accept = compact_on_accept
+
+    @classmethod
+    def from_config(cls) -> "RetentionPolicy":
+        config = Config()
+        return cls(
+            keep_last=config.get_checkpoint_keep_last(),
+            idle_ttl=config.get_checkpoint_idle_ttl(),
+            max_bytes=config.get_checkpoint_max_bytes(),
+            compact_on_accept=config.get_checkpoint_compact_on_accept(),
+        )
+
+
+def message_log_snapshot_every() -> int:
+    """
+    Snapshot interval of the chat message log (see `message_log_state`).
+
+    A message log checkpoint can only be rebuilt from its ancestors back to the last snapshot, so
+    retention never prunes into that chain and keeps at most about `snapshot_every` checkpoints of
+    a chat thread regardless of `checkpoint_keep_last`. Capping the interval at keep_last keeps
+    that limit meaningful for chats, at the cost of more frequent full snapshots.
+    """
+    config = Config()
+    snapshot_every = config.get_chat_message_log_snapshot_every()
+    keep_last = config.get_checkpoint_keep_last()
+    return min(snapshot_every, keep_last) if keep_last > 0 else snapshot_every
+
+
+class CheckpointRetentionMixin:
+    """
+    Applies a RetentionPolicy after every `put` of a checkpointer.
+
+    Backends provide four primitives: `_checkpoint_ids` (newest first), `_delete_checkpoints`,
+    `_thread_bytes` and `_stored_threads`. Whole threads are removed with `delete_thread`. The
+    async API of both checkpointers goes through `put`, so async graphs are covered as well.
+
+    Thread sizes and last-write times are tracked in memory, in LRU order; threads already
+    stored when the process starts are counted as written at startup.
+    """
+
+    retention = None
+
+    def _init_retention(self, policy: RetentionPolicy) -> None:
+        self.retention = policy
+        self._retention_lock = threading.RLock()
+        self._thread_usage: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._usage_loaded = False
+        self._last_sweep = time.monotonic()
+        self._last_collect = time.monotonic()
+        self._deleted_since_collect = False
+        self._retention_stats = {"pruned": 0, "compactions": 0, "expired_threads": 0, "evicted_threads": 0}
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        next_config = super().put(config, checkpoint, metadata, new_versions)
+        if self.retention is not None:
+            try:
+                self._apply_retention(config, checkpoint, new_versions, metadata)
+            except Exception as e:
+                logger.warning(f"Checkpoint retention failed: {e}")
+        return next_config
+
+    @staticmethod
+    def _is_acceptance(checkpoint: Dict[str, Any], new_versions: Dict[str, Any]) -> bool:
+        values = checkpoint.get("channel_values", {})
+        return any(channel in new_versions and values.get(channel) == value
+                   for channel, value in ACCEPTANCE_MARKERS.items())
+
+    @staticmethod
+    def _delta_chain_length(metadata: Dict[str, Any]) -> int:
+        """
+        Checkpoints needed to rebuild the delta (message log) channels of the checkpoint just put.
+
+        Those channels are replayed from the writes of every ancestor back to the last one holding
+        a snapshot, which is as many supersteps back as the metadata's counters say.
+        """
+        counters = (metadata or {}).get("counters_since_delta_snapshot") or {}
+        return 1 + max((supersteps for _, supersteps in counters.values()), default=0)
+
+    def _apply_retention(self, config, checkpoint, new_versions, metadata=None) -> None:
+        policy = self.retention
+        thread_id = str(config["configurable"]["thread_id"])
+        checkpoint_ns = config["configurable"].get("checkpoint_ns", "")
+        keep = policy.keep_last
+        compact = policy.compact_on_accept and self._is_acceptance(checkpoint, new_versions)
+        if compact:
+            keep = 1
+        if keep > 0:
+            # Never prune into the replay chain of a message log (bounded by message_log_snapshot_every)
+            keep = max(keep, self._delta_chain_length(metadata))
+        with self._retention_lock:
+            if keep > 0:
+                ids = self._checkpoint_ids(thread_id, checkpoint_ns)
+                if len(ids) > keep:
+                    self._delete_checkpoints(thread_id, checkpoint_ns, ids[keep:])
+                    self._deleted_since_collect = True
+                    self._retention_stats["pruned"] += len(ids) - keep
+                    if compact:
+                        self._retention_stats["compactions"] += 1
+                        logger.info(f"Compacted {len(ids) - keep} checkpoints of thread {thread_id} after an accepted stage")
+            if policy.idle_ttl > 0 or policy.max_bytes > 0:
+                self._track(thread_id, self._thread_bytes(thread_id))
+                self._expire_idle(thread_id)
+                self._evict_to_cap(thread_id)
+            self._collect_if_due()
+
+    def _track(self, thread_id: str, size: int) -> None:
+        now = time.monotonic()
+        if not self._usage_loaded:
+            self._usage_loaded = True
+            for stored_thread, stored_size in self._stored_threads().items():
+                self._thread_usage.setdefault(stored_thread, [now, stored_size])
+        self._thread_usage[thread_id] = [now, size]
+        self._thread_usage.move_to_end(thread_id)
+
+    def _drop_thread(self, thread_id: str) -> None:
+        self._thread_usage.pop(thread_id, None)
+        self.delete_thread(thread_id)
+        self._deleted_since_collect = True
+
+    def collect_garbage(self) -> int:
+        """Delete data no checkpoint refers to any more (see SqliteCheckpointer); returns the count."""
+        return 0
+
+    def _collect_if_due(self, interval: float = 300.0) -> None:
+        now = time.monotonic()
+        if not self._deleted_since_collect or now - self._last_collect < interval:
+            return
+        self._last_collect = now
+        self._deleted_since_collect = False
+        collected = self.collect_garbage()
+        if collected:
+            logger.info(f"Collected {collected} unreferenced checkpoint blobs")
+
+    def _expire_idle(self, current_thread: str) -> None:
+        ttl = self.retention.idle_ttl
+        now = time.monotonic()
+        # Sweeping walks every tracked thread, so do it at most every tenth of the TTL.
+        if ttl <= 0 or now - self._last_sweep < min(ttl / 10, 60.0):
+            return
+        self._last_sweep = now
+        expired = [t for t, (last_used, _) in self._thread_usage.items() if now - last_used > ttl and t != current_thread]
+        for thread_id in expired:
+            self._drop_thread(thread_id)
+        if expired:
+            self._retention_stats["expired_threads"] += len(expired)
+            logger.info(f"Deleted {len(expired)} checkpoint threads idle for more than {ttl:.0f}s")
+
+    def _evict_to_cap(self, current_thread: str) -> None:
+        cap = self.retention.max_bytes
+        if cap <= 0:
+            return
+        total = sum(size for _, size in self._thread_usage.values())
+        for thread_id in list(self._thread_usage):
+            if total <= cap:
+                break
+            if thread_id == current_thread:
+                continue
+            total -= self._thread_usage[thread_id][1]
+            self._drop_thread(thread_id)
+            self._retention_stats["evicted_threads"] += 1
+            logger.info(f"Evicted checkpoint thread {thread_id} to stay within {cap} bytes")
+
+    def retention_stats(self) -> Dict[str, Any]:
+        if self.retention is None:
+            return {}
+        with self._retention_lock:
+            return {
+                **self._retention_stats,
+                "threads": len(self._thread_usage),
+                "bytes": sum(size for _, size in self._thread_usage.values()),
+            }
@@ -0,0 +1,111 @@
+# src/langgraphagenticai/graph/checkpoint_serde.py
+from enum import Enum
+from typing import Any, Dict, Tuple, Type
+
+import ormsgpack
+from langchain_core.messages import (AIMessage, AIMessageChunk, ChatMessage, FunctionMessage, HumanMessage,
+                                     RemoveMessage, SystemMessage, ToolMessage)
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer, _msgpack_default
+from pydantic import BaseModel
+
+from src.langgraphagenticai.state.state import SDLCStages, Section, SectionDraft
+
+# Serialized type of values written by CompactSerializer; "msgpack" values of older checkpoints still load.
+COMPACT_TYPE = "msgpack-compact"
+
+# Ext codes of the fast paths, kept clear of LangGraph's own codes (0-7).
+EXT_MESSAGE = 64
+EXT_MODEL = 65
+EXT_ENUM = 66
+
+# Position in each tuple is the on-disk tag: only append, never reorder.
+MESSAGE_TYPES: Tuple[Type, ...] = (HumanMessage, AIMessage, SystemMessage, ToolMessage, AIMessageChunk,
+                                   ChatMessage, FunctionMessage, RemoveMessage)
+MODEL_TYPES: Tuple[Type[BaseModel], ...] = (Section, SectionDraft)
+ENUM_TYPES: Tuple[Type[Enum], ...] = (SDLCStages,)
+
+# Same as JsonPlusSerializer: enums, dataclasses, datetimes and UUIDs reach `_default` instead of being flattened.
+_PACK_OPTIONS = (ormsgpack.OPT_NON_STR_KEYS | ormsgpack.OPT_PASSTHROUGH_DATACLASS | ormsgpack.OPT_PASSTHROUGH_DATETIME
+                 | ormsgpack.OPT_PASSTHROUGH_ENUM | ormsgpack.OPT_PASSTHROUGH_UUID | ormsgpack.OPT_REPLACE_SURROGATES)
+_OPTIONS = ormsgpack.OPT_NON_STR_KEYS
+_MISSING = object()
+
+
+class CompactSerializer(JsonPlusSerializer):
+    """
+    Checkpoint serializer with compact encodings for the types our graph states are made of.
+
+    JsonPlusSerializer already writes msgpack, but stores every LangChain message, pydantic model
+    and enum with its module and class name and, for messages, a `model_dump` of every field, then
+    looks the class up by name (and through the msgpack allowlist) to load it back. Here the types
+    in MESSAGE_TYPES, MODEL_TYPES and ENUM_TYPES are written as a one-byte tag plus only the fields
+    that differ from their defaults (messages) or the field values in schema order (models), and
+    the tag indexes the class directly. Anything else falls through to the default encoding, and
+    values written by JsonPlusSerializer load unchanged.
+    """
+
+    _message_tags: Dict[Type, int] = {cls: tag for tag, cls in enumerate(MESSAGE_TYPES)}
+    _message_defaults: Tuple[Dict[str, Any], ...] = tuple(
+        {name: field.get_default(call_default_factory=True) for name, field in cls.model_fields.items()}
+        for cls in MESSAGE_TYPES
+    )
+    _model_tags: Dict[Type, int] = {cls: tag for tag, cls in enumerate(MODEL_TYPES)}
+    _model_fields: Tuple[Tuple[str, ...], ...] = tuple(tuple(cls.model_fields) for cls in MODEL_TYPES)
+    _enum_tags: Dict[Type, int] = {cls: tag for tag, cls in enumerate(ENUM_TYPES)}
+
+    def _pack(self, obj: Any) -> bytes:
+        return ormsgpack.packb(obj, default=self._default, option=_PACK_OPTIONS)
+
+    def _default(self, obj: Any) -> Any:
+        cls = type(obj)
+        tag = self._message_tags.get(cls)
+        if tag is not None:
+            defaults = self._message_defaults[tag]
+            fields = {name: value for name, value in obj.__dict__.items() if value != defaults.get(name, _MISSING)}
+            return ormsgpack.Ext(EXT_MESSAGE, self._pack((tag, fields)))
+        tag = self._model_tags.get(cls)
+        if tag is not None:
+            return ormsgpack.Ext(EXT_MODEL, self._pack((tag, [getattr(obj, f) for f in self._model_fields[tag]])))
+        tag = self._enum_tags.get(cls)
+        if tag is not None:
+            return ormsgpack.Ext(EXT_ENUM, self._pack((tag, obj.value)))
+        return _msgpack_default(obj)
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == EXT_MESSAGE:
+            tag, fields = ormsgpack.unpackb(data, ext_hook=self._ext_hook, option=_OPTIONS)
+            return MESSAGE_TYPES[tag](**fields)
+        if code == EXT_MODEL:
+            tag, values = ormsgpack.unpackb(data, ext_hook=self._ext_hook, option=_OPTIONS)
+            return MODEL_TYPES[tag](**dict(zip(self._model_fields[tag], values)))
+        if code == EXT_ENUM:
+            tag, value = ormsgpack.unpackb(data, ext_hook=self._ext_hook, option=_OPTIONS)
+            return ENUM_TYPES[tag](value)
+        return self._unpack_ext_hook(code, data)
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        if obj is None or isinstance(obj, (bytes, bytearray)):
+            return super().dumps_typed(obj)
+        try:
+            return COMPACT_TYPE, self._pack(obj)
+        except ormsgpack.MsgpackEncodeError:
+            return super().dumps_typed(obj)
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_ == COMPACT_TYPE:
+            return ormsgpack.unpackb(payload, ext_hook=self._ext_hook, option=_OPTIONS)
+        return super().loads_typed(data)
+
+
+def build_serde(name: str):
+    """
+    Create the checkpoint serializer named `name`: "compact" (CompactSerializer) or "jsonplus"
+    (LangGraph's default). "compact" also reads checkpoints written by "jsonplus", so switching to
+    it keeps existing threads; switching back needs a fresh database.
+    """
+    if name == "compact":
+        return CompactSerializer()
+    if name == "jsonplus":
+        return JsonPlusSerializer()
+    raise ValueError(f"Unknown checkpoint serializer: {name}")
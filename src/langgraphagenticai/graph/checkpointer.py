@@ -0,0 +1,223 @@
+# src/langgraphagenticai/graph/checkpointer.py
+import asyncio
+import copy
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.sqlite import SqliteSaver
+
+from src.langgraphagenticai.graph.checkpoint_blobs import BlobStoreSerializer, CasBlobStore, referenced_blobs
+from src.langgraphagenticai.graph.checkpoint_serde import build_serde
+from src.langgraphagenticai.graph.graph_profiler import CheckpointTimingMixin
+from src.langgraphagenticai.graph.checkpoint_retention import CheckpointRetentionMixin, RetentionPolicy
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+
+class RetainingMemorySaver(CheckpointTimingMixin, CheckpointRetentionMixin, MemorySaver):
+    """MemorySaver with a retention policy, so heap use stays bounded under sustained traffic."""
+
+    def __init__(self, retention: Optional[RetentionPolicy] = None, serde=None):
+        super().__init__(serde=serde)
+        if retention is not None:
+            self._init_retention(retention)
+
+    def _checkpoint_ids(self, thread_id: str, checkpoint_ns: str) -> List[str]:
+        return sorted(self.storage.get(thread_id, {}).get(checkpoint_ns, {}), reverse=True)
+
+    def _delete_checkpoints(self, thread_id: str, checkpoint_ns: str, checkpoint_ids: List[str]) -> None:
+        saved = self.storage[thread_id][checkpoint_ns]
+        for checkpoint_id in checkpoint_ids:
+            saved.pop(checkpoint_id, None)
+            self.writes.pop((thread_id, checkpoint_ns, checkpoint_id), None)
+        # Channel values are stored once per version; keep the versions a remaining checkpoint still uses.
+        live = {
+            (channel, version)
+            for checkpoint_typed, _, _ in list(saved.values())
+            for channel, version in self.serde.loads_typed(checkpoint_typed)["channel_versions"].items()
+        }
+        for key in list(self.blobs):
+            if key[0] == thread_id and key[1] == checkpoint_ns and (key[2], key[3]) not in live:
+                del self.blobs[key]
+
+    def _thread_bytes(self, thread_id: str) -> int:
+        size = sum(
+            len(checkpoint_typed[1]) + len(metadata_typed[1])
+            for saved in list(self.storage.get(thread_id, {}).values())
+            for checkpoint_typed, metadata_typed, _ in list(saved.values())
+        )
+        size += sum(len(value[1]) for key, value in list(self.blobs.items()) if key[0] == thread_id)
+        size += sum(
+            len(write[2][1])
+            for key, writes in list(self.writes.items()) if key[0] == thread_id
+            for write in list(writes.values())
+        )
+        return size
+
+    def _stored_threads(self) -> Dict[str, int]:
+        return {thread_id: self._thread_bytes(thread_id) for thread_id in list(self.storage)}
+
+
+class SqliteCheckpointer(CheckpointTimingMixin, CheckpointRetentionMixin, SqliteSaver):
+    """
+    SQLite checkpointer for graphs that must survive a restart.
+
+    The database runs in WAL mode with synchronous=NORMAL, so readers never block the writer
+    and a checkpoint commit costs no fsync; a busy timeout makes other processes sharing the
+    file wait instead of failing. On top of the tables' primary keys, (thread_id, checkpoint_id)
+    indexes serve the per-thread history scans that are not filtered by namespace.
+
+    SqliteSaver only implements the sync API; the async methods run it in a worker thread so
+    graphs driven by AsyncGraphRunner (a new event loop per run) can share the same instance.
+
+    SqliteSaver stores each checkpoint with all channel values, so large strings such as the
+    SDLC artifacts would be serialized and written again at every step. With `blob_min_size`
+    they are kept once in a compressed, content-addressed table (see checkpoint_blobs.py) and
+    checkpoints only hold their hashes.
+    """
+
+    blob_store = None
+
+    INDEXES = """
+        CREATE INDEX IF NOT EXISTS checkpoints_thread_idx ON checkpoints (thread_id, checkpoint_id);
+        CREATE INDEX IF NOT EXISTS writes_thread_idx ON writes (thread_id, checkpoint_id);
+    """
+
+    @classmethod
+    def from_path(cls, db_path: str, busy_timeout: float = 30.0, retention: Optional[RetentionPolicy] = None,
+                  blob_min_size: int = 0, blob_codec: str = "zstd", serde=None) -> "SqliteCheckpointer":
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(db_path, check_same_thread=False, timeout=busy_timeout)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        blob_store = CasBlobStore(db_path, codec=blob_codec) if blob_min_size > 0 else None
+        if blob_store is not None:
+            serde = BlobStoreSerializer(blob_store, blob_min_size, serde)
+        saver = cls(conn, serde=serde)
+        saver.blob_store = blob_store
+        if retention is not None:
+            saver._init_retention(retention)
+        return saver
+
+    def with_allowlist(self, extra_allowlist):
+        """LangGraph's strict msgpack allowlist, applied to the serializer inside the blob layer."""
+        if not isinstance(self.serde, BlobStoreSerializer):
+            return super().with_allowlist(extra_allowlist)
+        serde = self.serde.with_msgpack_allowlist(extra_allowlist)
+        if serde is self.serde:
+            return self
+        clone = copy.copy(self)
+        clone.serde = serde
+        return clone
+
+    def collect_garbage(self) -> int:
+        """Delete blobs that no stored checkpoint or write refers to any more."""
+        if self.blob_store is None:
+            return 0
+        with self.cursor(transaction=False) as cur:
+            cur.execute("SELECT type, checkpoint FROM checkpoints")
+            rows = cur.fetchall()
+            cur.execute("SELECT type, value FROM writes")
+            rows += cur.fetchall()
+        return self.blob_store.collect(referenced_blobs(rows))
+
+    def setup(self) -> None:
+        if self.is_setup:
+            return
+        super().setup()
+        self.conn.executescript(self.INDEXES)
+
+    def _checkpoint_ids(self, thread_id: str, checkpoint_ns: str) -> List[str]:
+        with self.cursor(transaction=False) as cur:
+            cur.execute("SELECT checkpoint_id FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? "
+                        "ORDER BY checkpoint_id DESC", (thread_id, checkpoint_ns))
+            return [row[0] for row in cur.fetchall()]
+
+    def _delete_checkpoints(self, thread_id: str, checkpoint_ns: str, checkpoint_ids: List[str]) -> None:
+        rows = [(thread_id, checkpoint_ns, checkpoint_id) for checkpoint_id in checkpoint_ids]
+        with self.cursor() as cur:
+            cur.executemany("DELETE FROM checkpoints WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", rows)
+            cur.executemany("DELETE FROM writes WHERE thread_id = ? AND checkpoint_ns = ? AND checkpoint_id = ?", rows)
+
+    def _thread_bytes(self, thread_id: str) -> int:
+        with self.cursor(transaction=False) as cur:
+            cur.execute("SELECT COALESCE(SUM(LENGTH(checkpoint) + LENGTH(metadata)), 0) FROM checkpoints "
+                        "WHERE thread_id = ?", (thread_id,))
+            size = cur.fetchone()[0]
+            cur.execute("SELECT COALESCE(SUM(LENGTH(value)), 0) FROM writes WHERE thread_id = ?", (thread_id,))
+            return size + cur.fetchone()[0]
+
+    def _stored_threads(self) -> Dict[str, int]:
+        with self.cursor(transaction=False) as cur:
+            cur.execute("SELECT thread_id, SUM(LENGTH(checkpoint) + LENGTH(metadata)) FROM checkpoints GROUP BY thread_id")
+            sizes = dict(cur.fetchall())
+            cur.execute("SELECT thread_id, SUM(LENGTH(value)) FROM writes GROUP BY thread_id")
+            for thread_id, size in cur.fetchall():
+                sizes[thread_id] = sizes.get(thread_id, 0) + (size or 0)
+        return sizes
+
+    async def aget_tuple(self, config):
+        return await asyncio.to_thread(self.get_tuple, config)
+
+    async def alist(self, config, *, filter: Optional[dict] = None, before=None,
+                    limit: Optional[int] = None) -> AsyncIterator[Any]:
+        items = await asyncio.to_thread(lambda: list(self.list(config, filter=filter, before=before, limit=limit)))
+        for item in items:
+            yield item
+
+    async def aput(self, config, checkpoint, metadata, new_versions):
+        return await asyncio.to_thread(self.put, config, checkpoint, metadata, new_versions)
+
+    async def aput_writes(self, config, writes, task_id: str, task_path: str = "") -> None:
+        await asyncio.to_thread(self.put_writes, config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await asyncio.to_thread(self.delete_thread, thread_id)
+
+    async def aget_delta_channel_history(self, *, config, channels):
+        return await asyncio.to_thread(lambda: self.get_delta_channel_history(config=config, channels=channels))
+
+
+def build_checkpointer(backend: str, db_path: str = "", retention: Optional[RetentionPolicy] = None,
+                       blob_min_size: int = 0, blob_codec: str = "zstd", serde=None) -> BaseCheckpointSaver:
+    """
+    Create a checkpointer for `backend`: "memory" (lost on restart) or "sqlite" (stored in `db_path`).
+    With `retention`, old checkpoints and threads are deleted as the policy describes; with
+    `blob_min_size`, the sqlite backend stores strings of at least that length as shared blobs.
+    `serde` serializes checkpoint values (see checkpoint_serde.py); LangGraph's default when None.
+    """
+    if backend == "sqlite":
+        if not db_path:
+            raise ValueError("checkpoint_db_path must be set for the sqlite checkpointer")
+        logger.info(f"Using SQLite checkpointer at {db_path}")
+        return SqliteCheckpointer.from_path(db_path, retention=retention, blob_min_size=blob_min_size,
+                                            blob_codec=blob_codec, serde=serde)
+    if backend != "memory":
+        raise ValueError(f"Unknown checkpointer backend: {backend}")
+    return RetainingMemorySaver(retention, serde=serde)
+
+
+_checkpointer: Optional[BaseCheckpointSaver] = None
+_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer() -> BaseCheckpointSaver:
+    """Return the process-wide checkpointer, creating it from uiconfigfile.ini on first use."""
+    global _checkpointer
+    with _checkpointer_lock:
+        if _checkpointer is None:
+            config = Config()
+            db_path = config.get_checkpoint_db_path()
+            if db_path and not os.path.isabs(db_path):
+                db_path = str(Path(__file__).resolve().parents[3] / db_path)
+            _checkpointer = build_checkpointer(
+                config.get_checkpointer_backend(), db_path, RetentionPolicy.from_config(),
+                blob_min_size=config.get_checkpoint_blob_min_size(), blob_codec=config.get_checkpoint_blob_codec(),
+                serde=build_serde(config.get_checkpoint_serde()),
+            )
+        return _checkpointer
@@ -1,6 +1,7 @@
 # src/langgraphagenticai/graph/graph_builder.py
 from langchain_core.language_models import BaseLanguageModel
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer
 from src.langgraphagenticai.graph.graph_builder_blog import BlogGraphBuilder
 from src.langgraphagenticai.graph.graph_builder_basic import BasicChatbotGraphBuilder
 from src.langgraphagenticai.graph.graph_bulider_tool import ChatbotWithToolGraphBuilder
@@ -10,13 +11,19 @@ from src.langgraphagenticai.graph.graph_builder_sdlc import SdlcGraphBuilder
 
 
 class GraphBuilder:
-    def __init__(self, llm: BaseLanguageModel):
+    def __init__(self, llm: BaseLanguageModel, router=None, memory: BaseCheckpointSaver = None):
+        """
+        Args:
+            llm: The user-selected model.
+            router: Optional ModelRouter mapping the use case's LLM call sites to model tiers.
+            memory: Checkpointer for the compiled graphs; the configured one (see graph/checkpointer.py) when not given.
+        """
         self.llm = llm
-        self.memory = MemorySaver()
-        self.blog_builder = BlogGraphBuilder(self.llm, self.memory)
-        self.basic_builder = BasicChatbotGraphBuilder(self.llm, self.memory)
-        self.tool_builder = ChatbotWithToolGraphBuilder(self.llm, self.memory)
-        self.sdlc_builder = SdlcGraphBuilder(self.llm, self.memory)
+        self.memory = memory if memory is not None else get_checkpointer()
+        self.blog_builder = BlogGraphBuilder(self.llm, self.memory, router)
+        self.basic_builder = BasicChatbotGraphBuilder(self.llm, self.memory, router)
+        self.tool_builder = ChatbotWithToolGraphBuilder(self.llm, self.memory, router)
+        self.sdlc_builder = SdlcGraphBuilder(self.llm, self.memory, router)
 
     def validate_and_standardize_structure(self, user_input: str) -> list:
         """
@@ -31,17 +38,19 @@ class GraphBuilder:
         """
         return self.blog_builder.validate_and_standardize_structure(user_input)
 
-    def setup_graph(self, usecase: str):
+    def setup_graph(self, usecase: str, use_async: bool = False):
         """
         Sets up the appropriate graph based on the selected use case.
+        With use_async=True the graph is compiled from async nodes and must be driven with astream
+        (see graph/async_runner.py).
         """
         if usecase == "Basic Chatbot":
-            return self.basic_builder.build_graph()
+            return self.basic_builder.build_graph(use_async)
         elif usecase == "Chatbot with Tool":
-            return self.tool_builder.build_graph()
+            return self.tool_builder.build_graph(use_async)
         elif usecase == "Blog Generation":
-            return self.blog_builder.build_graph()
+            return self.blog_builder.build_graph(use_async)
         elif usecase == "SDLC":
-            return self.sdlc_builder.build_graph()
+            return self.sdlc_builder.build_graph(use_async)
         else:
             raise ValueError(f"Unknown use case: {usecase}")
\ No newline at end of file
@@ -1,21 +1,31 @@
 # src/langgraphagenticai/graph/graph_builder_basic.py
 from langgraph.graph import StateGraph, START, END
 from src.langgraphagenticai.nodes.basic_chatbot_node import BasicChatbotNode
-from src.langgraphagenticai.state.state import State
-from langgraph.checkpoint.memory import MemorySaver
+from src.langgraphagenticai.state.state import State, message_log_state
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer
+from src.langgraphagenticai.graph.checkpoint_retention import message_log_snapshot_every
+from src.langgraphagenticai.nodes.chat_history_manager import build_history_manager
+from src.langgraphagenticai.ui.uiconfigfile import Config
 
 class BasicChatbotGraphBuilder:
-    def __init__(self, llm, memory: MemorySaver):
+    def __init__(self, llm, memory: BaseCheckpointSaver = None, router=None):
         self.llm = llm
-        self.memory = memory
+        self.memory = memory if memory is not None else get_checkpointer()
+        self.router = router
 
-    def build_graph(self):
+    def build_graph(self, use_async: bool = False):
         """
         Builds a graph for the Basic Chatbot use case.
+        With use_async=True the chatbot node awaits the LLM and the graph must be run with astream.
         """
-        graph_builder = StateGraph(state_schema=State)
-        basic_chatbot_node = BasicChatbotNode(self.llm)
-        graph_builder.add_node("chatbot", basic_chatbot_node.create_chatbot())
+        config = Config()
+        state_schema = message_log_state(message_log_snapshot_every()) if config.get_chat_message_log() else State
+        graph_builder = StateGraph(state_schema=state_schema)
+        basic_chatbot_node = BasicChatbotNode(self.llm, build_history_manager(self.llm, self.router))
+        chatbot = basic_chatbot_node.create_async_chatbot() if use_async else basic_chatbot_node.create_chatbot()
+        # The node is annotated with State; read it with the schema chosen above
+        graph_builder.add_node("chatbot", chatbot, input_schema=state_schema)
         graph_builder.add_edge(START, "chatbot")
         graph_builder.add_edge("chatbot", END)
         return graph_builder.compile(checkpointer=self.memory)
\ No newline at end of file
@@ -2,7 +2,8 @@
 from langgraph.graph import StateGraph, START, END
 from src.langgraphagenticai.nodes.blog_generation_node import BlogGenerationNode
 from src.langgraphagenticai.state.state import BlogState as State
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer
 from pydantic import BaseModel, Field
 from langchain_core.messages import SystemMessage, HumanMessage
 import logging
@@ -11,6 +12,7 @@ import logging
 import functools
 import time
 from src.langgraphagenticai.logging.logging_utils import logger, log_entry_exit
+from src.langgraphagenticai.LLMS.model_router import route_model
 
 
 
@@ -19,9 +21,10 @@ class ReviewFeedback(BaseModel):
     comments: str = Field(description="Reviewer comments")
 
 class BlogGraphBuilder:
-    def __init__(self, llm, memory: MemorySaver=None):
+    def __init__(self, llm, memory: BaseCheckpointSaver = None, router=None):
         self.llm = llm
-        self.memory = memory if memory is not None else MemorySaver()
+        self.router = router
+        self.memory = memory if memory is not None else get_checkpointer()
         
     @log_entry_exit
     def validate_and_standardize_structure(self, user_input: str) -> list:
@@ -74,7 +77,7 @@ class BlogGraphBuilder:
 
         try:
             # Invoke the LLM and expect a JSON response
-            response = self.llm.invoke(messages)
+            response = route_model(self.llm, self.router, "structure").invoke(messages)
             response_content = response.content if hasattr(response, "content") else str(response)
             logger.info(f"LLM response for structure: {response_content}")
 
@@ -107,22 +110,30 @@ class BlogGraphBuilder:
             return default_structure
 
     @log_entry_exit
-    def build_graph(self):
+    def build_graph(self, use_async: bool = False):
         """
         Builds a graph for the Blog Generation use case.
         Focuses on reliable checkpointing by adjusting interrupt timing.
+        With use_async=True the LLM-backed nodes are coroutines, so the section workers
+        fanned out by assign_workers share one event loop instead of a thread each.
+        Long plans skip the per-section workers and are written by batch_sections (see blog_section_mode).
+        Rejected drafts go through plan_revision, which sends only the sections the feedback concerns
+        back to the workers and keeps the rest (see blog_targeted_revision).
+        Planned sections found in the shared section cache skip the workers (see blog_section_cache).
         """
         try:
             if not self.llm:
                 raise ValueError("LLM model not initialized")
 
             graph_builder = StateGraph(state_schema=State)
-            blog_node = BlogGenerationNode(self.llm)
+            blog_node = BlogGenerationNode(self.llm, self.router)
 
             # Add nodes
-            graph_builder.add_node("user_input", blog_node.user_input)
-            graph_builder.add_node("orchestrator", blog_node.orchestrator)
-            graph_builder.add_node("llm_call", blog_node.llm_call)
+            graph_builder.add_node("user_input", blog_node.auser_input if use_async else blog_node.user_input)
+            graph_builder.add_node("orchestrator", blog_node.aorchestrator if use_async else blog_node.orchestrator)
+            graph_builder.add_node("llm_call", blog_node.allm_call if use_async else blog_node.llm_call)
+            graph_builder.add_node("batch_sections", blog_node.abatch_sections if use_async else blog_node.batch_sections)
+            graph_builder.add_node("plan_revision", blog_node.aplan_revision if use_async else blog_node.plan_revision)
             graph_builder.add_node("synthesizer", blog_node.synthesizer)
             graph_builder.add_node("feedback_collector", blog_node.feedback_collector)
             graph_builder.add_node("file_generator", blog_node.file_generator)
@@ -130,9 +141,11 @@ class BlogGraphBuilder:
 
             # Add edges
             graph_builder.add_edge(START,"user_input")
-            graph_builder.add_edge("user_input", "orchestrator")
-            graph_builder.add_conditional_edges("orchestrator", lambda state: blog_node.assign_workers(state), ["llm_call"])
+            graph_builder.add_conditional_edges("user_input", blog_node.route_revision, ["orchestrator", "plan_revision"])
+            graph_builder.add_conditional_edges("orchestrator", lambda state: blog_node.assign_workers(state), ["llm_call", "batch_sections", "synthesizer"])
+            graph_builder.add_conditional_edges("plan_revision", blog_node.assign_revisions, ["llm_call", "orchestrator"])
             graph_builder.add_edge("llm_call", "synthesizer")
+            graph_builder.add_edge("batch_sections", "synthesizer")
             graph_builder.add_edge("synthesizer", "feedback_collector")
 
             # Restore original conditional edges for feedback
@@ -142,6 +155,7 @@ class BlogGraphBuilder:
                 {
                     # If revision needed, go directly back to orchestrator
                     "orchestrator": "orchestrator", # Restored from "reset_sections"
+                    "plan_revision": "plan_revision",
                     "file_generator": "file_generator"
                 }
             )
@@ -2,7 +2,8 @@
 from langgraph.graph import StateGraph, START, END
 from src.langgraphagenticai.nodes.sdlc_node import SdlcNode
 from src.langgraphagenticai.state.state import SDLCStages, SDLCState as State
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer
 from pydantic import BaseModel, Field
 from langchain_core.messages import SystemMessage, HumanMessage
 import logging
@@ -13,31 +14,35 @@ import time
 from src.langgraphagenticai.logging.logging_utils import logger, log_entry_exit
 
 class SdlcGraphBuilder:
-    def __init__(self, llm, memory: MemorySaver=None):
+    def __init__(self, llm, memory: BaseCheckpointSaver = None, router=None):
         self.llm = llm
-        self.memory = memory if memory is not None else MemorySaver()
+        self.router = router
+        self.memory = memory if memory is not None else get_checkpointer()
 
     @log_entry_exit
-    def build_graph(self):
+    def build_graph(self, use_async: bool = False):
+        """
+        Builds the SDLC graph. With use_async=True the artifact generation nodes await the LLM.
+        """
         try:
             if not self.llm:
                 raise ValueError("LLM model not initialized")
 
             graph_builder = StateGraph(state_schema=State)
-            sldc_node = SdlcNode(self.llm)
+            sldc_node = SdlcNode(self.llm, self.router)
 
             # Add nodes
             graph_builder.add_node("Requirement", sldc_node.user_input)
-            graph_builder.add_node("GenerateRequirements", sldc_node.generate_requirements)
-            graph_builder.add_node("GenerateUserStories", sldc_node.generate_user_stories)
+            graph_builder.add_node("GenerateRequirements", sldc_node.agenerate_requirements if use_async else sldc_node.generate_requirements)
+            graph_builder.add_node("GenerateUserStories", sldc_node.agenerate_user_stories if use_async else sldc_node.generate_user_stories)
             graph_builder.add_node("ProcessFeedback", sldc_node.process_feedback)
-            graph_builder.add_node("DesignDocuments", sldc_node.design_documents)
+            graph_builder.add_node("DesignDocuments", sldc_node.adesign_documents if use_async else sldc_node.design_documents)
             graph_builder.add_node("DesignFeedback", sldc_node.process_feedback)
-            graph_builder.add_node("DevelopmentArtifact", sldc_node.development_artifact)
+            graph_builder.add_node("DevelopmentArtifact", sldc_node.adevelopment_artifact if use_async else sldc_node.development_artifact)
             graph_builder.add_node("DevelopmentFeedback", sldc_node.process_feedback)
-            graph_builder.add_node("TestingArtifact", sldc_node.testing_artifact)
+            graph_builder.add_node("TestingArtifact", sldc_node.atesting_artifact if use_async else sldc_node.testing_artifact)
             graph_builder.add_node("TestingFeedback", sldc_node.process_feedback)
-            graph_builder.add_node("DeploymentArtifact", sldc_node.deployment_artifact)
+            graph_builder.add_node("DeploymentArtifact", sldc_node.adeployment_artifact if use_async else sldc_node.deployment_artifact)
             graph_builder.add_node("DeploymentFeedback", sldc_node.process_feedback)
 
 
@@ -3,29 +3,40 @@ from langgraph.graph import StateGraph, START, END
 from src.langgraphagenticai.nodes.chatbot_with_Tool_node import ChatbotWithToolNode
 from src.langgraphagenticai.tools.search_tool import get_tools, create_tool_nodes
 from langgraph.prebuilt import tools_condition
-from src.langgraphagenticai.state.state import State
-from langgraph.checkpoint.memory import MemorySaver
+from src.langgraphagenticai.state.state import State, message_log_state
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer
+from src.langgraphagenticai.graph.checkpoint_retention import message_log_snapshot_every
+from src.langgraphagenticai.nodes.chat_history_manager import build_history_manager
+from src.langgraphagenticai.ui.uiconfigfile import Config
 
 class ChatbotWithToolGraphBuilder:
-    def __init__(self, llm, memory: MemorySaver):
+    def __init__(self, llm, memory: BaseCheckpointSaver = None, router=None):
         self.llm = llm
-        self.memory = memory
+        self.memory = memory if memory is not None else get_checkpointer()
+        self.router = router
 
-    def build_graph(self):
+    def build_graph(self, use_async: bool = False):
         """
         Builds a graph for the Chatbot with Tool use case.
+        With use_async=True the chatbot node awaits the LLM and the graph must be run with astream.
         """
-        graph_builder = StateGraph(state_schema=State)
+        config = Config()
+        state_schema = message_log_state(message_log_snapshot_every()) if config.get_chat_message_log() else State
+        graph_builder = StateGraph(state_schema=state_schema)
 
         # Define the tool and tool node
         tools = get_tools()
         tool_node = create_tool_nodes(tools)
 
         # Define chatbot node
-        chatbot_with_tool_node = ChatbotWithToolNode(self.llm)
-        chatbot_node = chatbot_with_tool_node.create_chatbot(tools)
+        chatbot_with_tool_node = ChatbotWithToolNode(self.llm, build_history_manager(self.llm, self.router))
+        if use_async:
+            chatbot_node = chatbot_with_tool_node.create_async_chatbot(tools)
+        else:
+            chatbot_node = chatbot_with_tool_node.create_chatbot(tools)
 
-        graph_builder.add_node("chatbot", chatbot_node)
+        graph_builder.add_node("chatbot", chatbot_node, input_schema=state_schema)
         graph_builder.add_node("tools", tool_node)
 
         graph_builder.add_edge(START, "chatbot")
@@ -0,0 +1,365 @@
+# src/langgraphagenticai/graph/graph_profiler.py
+import json
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler, BaseCallbackManager
+
+from src.langgraphagenticai.logging.logging_utils import LOG_DIR, logger
+
+PROFILE_DIR = LOG_DIR / "profiles"
+
+# Profiles of the runs in progress, by thread_id, so checkpointer calls can be attributed to them.
+_active_profiles: Dict[str, "GraphProfile"] = {}
+_active_lock = threading.Lock()
+
+
+def _merged_length(intervals: List[Tuple[float, float]]) -> float:
+    """Total time covered by possibly overlapping intervals (concurrent LLM calls count once)."""
+    total, end = 0.0, float("-inf")
+    for start, stop in sorted(intervals):
+        if stop <= end:
+            continue
+        total += stop - max(start, end)
+        end = stop
+    return total
+
+
+class GraphProfile(BaseCallbackHandler):
+    """
+    Timeline of one graph run: node tasks, supersteps, LLM calls and checkpoint writes.
+
+    Node tasks and LLM calls are seen through LangChain callbacks (LangGraph tags each node task
+    with `graph:step:<n>` and passes `langgraph_node` in its metadata; calls nested in a task are
+    attributed to it through their parent run), checkpoint writes through CheckpointTimingMixin.
+    A superstep spans its first task start to its last task end. LLM wait is the time a task had
+    at least one LLM call outstanding; the rest of its wall time is reported as non-LLM wall time
+    (prompt building, parsing, state handling, but also waiting for the GIL or a thread). The
+    process CPU time over the run is recorded as well; it is process-wide, so it includes other
+    sessions and background threads running at the same time.
+
+    Args:
+        name (str): Label of the run, e.g. the use case.
+        thread_id (str): Checkpoint thread of the run.
+    """
+
+    run_inline = True  # record timestamps on the event loop thread instead of an executor
+
+    def __init__(self, name: str, thread_id: str = ""):
+        self.name = name
+        self.thread_id = thread_id
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+        self._cpu_started = time.process_time()
+        self.process_cpu_seconds = 0.0
+        self.tasks: Dict[UUID, Dict[str, Any]] = {}
+        self.llm_calls: List[Dict[str, Any]] = []
+        self.checkpoint_writes: List[Dict[str, Any]] = []
+        self._task_of: Dict[UUID, UUID] = {}
+        self._llm_runs: Dict[UUID, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    # -- callbacks --------------------------------------------------------------
+
+    def on_chain_start(self, serialized: Dict[str, Any], inputs: Any, *, run_id: UUID,
+                       parent_run_id: Optional[UUID] = None, tags: Optional[List[str]] = None,
+                       metadata: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+        metadata = metadata or {}
+        node, step = metadata.get("langgraph_node"), metadata.get("langgraph_step")
+        with self._lock:
+            if node is not None and kwargs.get("name") == node and f"graph:step:{step}" in (tags or []):
+                self.tasks[run_id] = {"node": node, "step": step, "start": time.perf_counter(), "end": None,
+                                      "error": False}
+                self._task_of[run_id] = run_id
+            elif parent_run_id in self._task_of:
+                self._task_of[run_id] = self._task_of[parent_run_id]
+
+    def _end_task(self, run_id: UUID, error: bool) -> None:
+        with self._lock:
+            task = self.tasks.get(run_id)
+            if task is not None and task["end"] is None:
+                task["end"] = time.perf_counter()
+                task["error"] = error
+
+    def on_chain_end(self, outputs: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_task(run_id, False)
+
+    def on_chain_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        # GraphInterrupt ends a task through here as well; it is recorded like any other end
+        self._end_task(run_id, True)
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *, run_id: UUID,
+                            parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        with self._lock:
+            task_id = self._task_of.get(parent_run_id)
+            self._task_of[run_id] = task_id
+            self._llm_runs[run_id] = {"task": task_id, "start": time.perf_counter(),
+                                      "nested": parent_run_id in self._llm_runs}
+
+    def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID,
+                     parent_run_id: Optional[UUID] = None, **kwargs: Any) -> None:
+        self.on_chat_model_start(serialized, [], run_id=run_id, parent_run_id=parent_run_id, **kwargs)
+
+    def _end_llm(self, run_id: UUID) -> None:
+        with self._lock:
+            call = self._llm_runs.pop(run_id, None)
+            if call is not None:
+                call["end"] = time.perf_counter()
+                self.llm_calls.append(call)
+
+    def on_llm_end(self, response: Any, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_llm(run_id)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        self._end_llm(run_id)
+
+    def record_checkpoint_write(self, kind: str, start: float, end: float) -> None:
+        with self._lock:
+            self.checkpoint_writes.append({"kind": kind, "start": start, "end": end})
+
+    def finish(self) -> None:
+        self.finished = time.perf_counter()
+        self.process_cpu_seconds = time.process_time() - self._cpu_started
+
+    # -- reports ----------------------------------------------------------------
+
+    def _task_llm_wait(self) -> Dict[UUID, float]:
+        intervals: Dict[UUID, List[Tuple[float, float]]] = {}
+        for call in self.llm_calls:
+            intervals.setdefault(call["task"], []).append((call["start"], call["end"]))
+        return {task_id: _merged_length(spans) for task_id, spans in intervals.items()}
+
+    def _closed_tasks(self) -> List[Tuple[UUID, Dict[str, Any]]]:
+        end = self.finished or time.perf_counter()
+        return [(task_id, {**task, "end": task["end"] or end}) for task_id, task in self.tasks.items()]
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Aggregate the run per node and per superstep.
+
+        Returns:
+            dict: {"run": totals, "nodes": [...], "supersteps": [...]}, nodes sorted by total time.
+        """
+        with self._lock:
+            tasks = self._closed_tasks()
+            waits = self._task_llm_wait()
+            llm_spans = [(call["start"], call["end"]) for call in self.llm_calls]
+            writes = list(self.checkpoint_writes)
+        nodes: Dict[str, Dict[str, Any]] = {}
+        steps: Dict[Any, Dict[str, Any]] = {}
+        for task_id, task in tasks:
+            wall = task["end"] - task["start"]
+            llm_wait = min(waits.get(task_id, 0.0), wall)
+            row = nodes.setdefault(task["node"], {"node": task["node"], "tasks": 0, "total_s": 0.0, "max_s": 0.0,
+                                                  "llm_wait_s": 0.0, "non_llm_wall_s": 0.0})
+            row["tasks"] += 1
+            row["total_s"] += wall
+            row["max_s"] = max(row["max_s"], wall)
+            row["llm_wait_s"] += llm_wait
+            row["non_llm_wall_s"] += wall - llm_wait
+            step = steps.setdefault(task["step"], {"step": task["step"], "nodes": set(), "tasks": 0,
+                                                   "start": task["start"], "end": task["end"]})
+            step["nodes"].add(task["node"])
+            step["tasks"] += 1
+            step["start"] = min(step["start"], task["start"])
+            step["end"] = max(step["end"], task["end"])
+        for row in nodes.values():
+            row["mean_s"] = row["total_s"] / row["tasks"]
+        supersteps = [
+            {"step": step["step"], "nodes": ", ".join(sorted(step["nodes"])), "tasks": step["tasks"],
+             "wall_s": step["end"] - step["start"]}
+            for step in sorted(steps.values(), key=lambda s: s["start"])
+        ]
+        wall = (self.finished or time.perf_counter()) - self.started
+        return {
+            "run": {
+                "name": self.name, "thread_id": self.thread_id, "wall_s": wall,
+                "process_cpu_s": self.process_cpu_seconds,
+                "llm_wait_s": _merged_length(llm_spans), "llm_calls": len(llm_spans),
+                "checkpoint_writes": len(writes),
+                "checkpoint_write_s": sum(w["end"] - w["start"] for w in writes),
+            },
+            "nodes": sorted(nodes.values(), key=lambda row: row["total_s"], reverse=True),
+            "supersteps": supersteps,
+        }
+
+    def summary_table(self) -> str:
+        """The summary as a plain-text table, for logs and the console."""
+        summary = self.summary()
+        run = summary["run"]
+        lines = [
+            f"{run['name']} run {run['thread_id']}: wall {run['wall_s']:.3f}s, "
+            f"process CPU (all threads) {run['process_cpu_s']:.3f}s, "
+            f"LLM wait {run['llm_wait_s']:.3f}s over {run['llm_calls']} calls, "
+            f"checkpoint writes {run['checkpoint_write_s']:.3f}s over {run['checkpoint_writes']}",
+            f"{'node':<28} {'tasks':>5} {'total s':>9} {'mean s':>9} {'max s':>9} {'LLM wait s':>11} {'non-LLM wall s':>14}",
+        ]
+        for row in summary["nodes"]:
+            lines.append(f"{row['node']:<28} {row['tasks']:>5} {row['total_s']:>9.3f} {row['mean_s']:>9.3f} "
+                         f"{row['max_s']:>9.3f} {row['llm_wait_s']:>11.3f} {row['non_llm_wall_s']:>14.3f}")
+        lines.append(f"{'superstep':<10} {'tasks':>5} {'wall s':>9}  nodes")
+        for step in summary["supersteps"]:
+            lines.append(f"{str(step['step']):<10} {step['tasks']:>5} {step['wall_s']:>9.3f}  {step['nodes']}")
+        return "\n".join(lines)
+
+    def chrome_trace(self) -> Dict[str, Any]:
+        """
+        The run as Chrome trace events, loadable in chrome://tracing, Perfetto or speedscope.
+
+        Lane 0 holds supersteps, lane 1 checkpoint writes; concurrent node tasks (e.g. the blog's
+        Send fan-out) get lanes from 2 up, each LLM call nested under its task on the task's lane.
+        """
+        with self._lock:
+            tasks = sorted(self._closed_tasks(), key=lambda item: item[1]["start"])
+            calls = [call for call in self.llm_calls if not call["nested"]]
+            writes = list(self.checkpoint_writes)
+
+        def us(t: float) -> float:
+            return round((t - self.started) * 1e6, 1)
+
+        def span(name: str, cat: str, start: float, end: float, lane: int, args: Optional[dict] = None) -> dict:
+            return {"name": name, "cat": cat, "ph": "X", "ts": us(start), "dur": max(us(end) - us(start), 0.1),
+                    "pid": 1, "tid": lane, "args": args or {}}
+
+        events = [
+            {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": f"{self.name} {self.thread_id}"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 0, "args": {"name": "supersteps"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "checkpointer"}},
+        ]
+        for step in self.summary()["supersteps"]:
+            start = min(task["start"] for _, task in tasks if task["step"] == step["step"])
+            events.append(span(f"step {step['step']}", "superstep", start, start + step["wall_s"], 0,
+                               {"nodes": step["nodes"], "tasks": step["tasks"]}))
+        for write in writes:
+            events.append(span(write["kind"], "checkpoint", write["start"], write["end"], 1))
+        lane_free: List[float] = []
+        lane_of: Dict[UUID, int] = {}
+        for task_id, task in tasks:
+            lane = next((i for i, free in enumerate(lane_free) if free <= task["start"]), len(lane_free))
+            if lane == len(lane_free):
+                lane_free.append(task["end"])
+                events.append({"name": "thread_name", "ph": "M", "pid": 1, "tid": lane + 2,
+                               "args": {"name": f"tasks {lane + 1}"}})
+            lane_free[lane] = task["end"]
+            lane_of[task_id] = lane + 2
+            events.append(span(task["node"], "node", task["start"], task["end"], lane + 2,
+                               {"step": task["step"], "error": task["error"]}))
+        for call in calls:
+            if call["task"] in lane_of:
+                events.append(span("llm", "llm", call["start"], call["end"], lane_of[call["task"]]))
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, directory: Path = PROFILE_DIR) -> Path:
+        directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        safe_name = "".join(c if c.isalnum() else "_" for c in self.name)
+        path = directory / f"{safe_name}-{stamp}.trace.json"
+        path.write_text(json.dumps(self.chrome_trace()), encoding="utf-8")
+        return path
+
+
+def active_profile(config: Optional[dict]) -> Optional[GraphProfile]:
+    """The profile of the run writing checkpoints for `config`'s thread, if it is being profiled."""
+    if not _active_profiles or not config:
+        return None
+    thread_id = (config.get("configurable") or {}).get("thread_id")
+    return _active_profiles.get(str(thread_id)) if thread_id is not None else None
+
+
+class CheckpointTimingMixin:
+    """Times `put` and `put_writes` of a checkpointer for the profiled runs (async methods delegate to them)."""
+
+    def put(self, config, checkpoint, metadata, new_versions):
+        profile = active_profile(config)
+        if profile is None:
+            return super().put(config, checkpoint, metadata, new_versions)
+        start = time.perf_counter()
+        try:
+            return super().put(config, checkpoint, metadata, new_versions)
+        finally:
+            profile.record_checkpoint_write("put", start, time.perf_counter())
+
+    def put_writes(self, config, writes, task_id: str, task_path: str = "") -> None:
+        profile = active_profile(config)
+        if profile is None:
+            return super().put_writes(config, writes, task_id, task_path)
+        start = time.perf_counter()
+        try:
+            return super().put_writes(config, writes, task_id, task_path)
+        finally:
+            profile.record_checkpoint_write("put_writes", start, time.perf_counter())
+
+
+class ProfiledGraph:
+    """
+    Profiles every `stream`/`invoke` of a compiled graph (or AsyncGraphRunner) it wraps.
+
+    Each run gets a GraphProfile, attached to the run config as a callback handler; when the run
+    ends (including at an interrupt) its Chrome trace is written to `trace_dir` and the summary
+    table is logged if `log_summary` is set. The last profile is kept in `last_profile`. Every
+    other attribute is forwarded to the wrapped graph.
+
+    Args:
+        graph: Compiled graph or AsyncGraphRunner.
+        name (str): Label of the runs, e.g. the use case.
+        trace_dir (Path): Where traces are written; None keeps them in memory only.
+        log_summary (bool): Log the summary table of every run.
+    """
+
+    def __init__(self, graph, name: str, trace_dir: Optional[Path] = PROFILE_DIR, log_summary: bool = True):
+        self.graph = graph
+        self.name = name
+        self.trace_dir = trace_dir
+        self.log_summary = log_summary
+        self.last_profile: Optional[GraphProfile] = None
+
+    def _start(self, config: Optional[dict]) -> Tuple[GraphProfile, dict]:
+        config = dict(config or {})
+        thread_id = str((config.get("configurable") or {}).get("thread_id", ""))
+        profile = GraphProfile(self.name, thread_id)
+        callbacks = config.get("callbacks")
+        if isinstance(callbacks, BaseCallbackManager):
+            callbacks = callbacks.copy()
+            callbacks.add_handler(profile, inherit=True)
+        else:
+            callbacks = [*(callbacks or []), profile]
+        config["callbacks"] = callbacks
+        with _active_lock:
+            _active_profiles[thread_id] = profile
+        return profile, config
+
+    def _finish(self, profile: GraphProfile) -> None:
+        profile.finish()
+        with _active_lock:
+            if _active_profiles.get(profile.thread_id) is profile:
+                del _active_profiles[profile.thread_id]
+        self.last_profile = profile
+        if self.trace_dir is not None:
+            try:
+                path = profile.write_trace(self.trace_dir)
+                logger.info(f"Wrote graph profile trace to {path}")
+            except OSError as e:
+                logger.warning(f"Could not write graph profile trace: {e}")
+        if self.log_summary:
+            logger.info(f"Graph profile:\n{profile.summary_table()}")
+
+    def stream(self, input: Any, config: Optional[dict] = None, **kwargs: Any) -> Iterator[Any]:
+        profile, config = self._start(config)
+        try:
+            yield from self.graph.stream(input, config, **kwargs)
+        finally:
+            self._finish(profile)
+
+    def invoke(self, input: Any, config: Optional[dict] = None, **kwargs: Any) -> Any:
+        profile, config = self._start(config)
+        try:
+            return self.graph.invoke(input, config, **kwargs)
+        finally:
+            self._finish(profile)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.graph, name)
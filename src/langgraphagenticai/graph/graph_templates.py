@@ -0,0 +1,80 @@
+# src/langgraphagenticai/graph/graph_templates.py
+import threading
+from typing import Any, Dict, Tuple
+
+from src.langgraphagenticai.LLMS.model_router import ModelRouter
+from src.langgraphagenticai.LLMS.runtime_llm import RuntimeChatModel
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer
+from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+
+class GraphTemplateCache:
+    """
+    Compiled graphs shared by every session of the process.
+
+    A template is compiled once per use case, sync/async mode, provider and model (the model
+    name decides prompt budgets such as the chat history window; the provider decides which
+    model each routing tier uses) with RuntimeChatModel stand-ins in place of the LLMs. Sessions
+    pass their own model and ModelRouter in config["configurable"] (see `runtime_configurable`),
+    so switching sessions or use cases costs a dictionary lookup instead of a graph compile.
+
+    All templates share the configured checkpointer; runs are kept apart by their thread_id.
+
+    Args:
+        shared (bool): When False every call compiles a fresh graph, as before templates existed.
+    """
+
+    def __init__(self, shared: bool = True):
+        self.shared = shared
+        self.memory = get_checkpointer()
+        self._graphs: Dict[Tuple, Any] = {}
+        self._lock = threading.Lock()
+        self._stats = {"builds": 0, "hits": 0}
+
+    def get(self, usecase: str, provider: str, model_name: str, use_async: bool = False, scope: str = ""):
+        """
+        Return the compiled graph for `usecase`, building it on first use.
+
+        Args:
+            usecase (str): Selected use case.
+            provider (str): Provider name as shown in the UI, e.g. "Groq".
+            model_name (str): Name of the session's selected model.
+            use_async (bool): Compile from async nodes (run it through AsyncGraphRunner).
+            scope (str): Anything else baked into the graph, e.g. the search tool's API key hash.
+        """
+        key = (usecase, use_async, provider, model_name, scope)
+        with self._lock:
+            graph = self._graphs.get(key) if self.shared else None
+            if graph is not None:
+                self._stats["hits"] += 1
+                return graph
+            graph = self._build(usecase, provider, model_name, use_async)
+            self._stats["builds"] += 1
+            if self.shared:
+                self._graphs[key] = graph
+        logger.info(f"Compiled {usecase} graph template for {provider}:{model_name} (async={use_async})")
+        return graph
+
+    def _build(self, usecase: str, provider: str, model_name: str, use_async: bool):
+        config = Config()
+        llm = RuntimeChatModel(model_name=model_name)
+        routes = config.get_model_routes(usecase)
+        router = None
+        if routes:
+            tiers = set(routes.values()) - {ModelRouter.DEFAULT_TIER}
+            tier_models = {
+                tier: RuntimeChatModel(tier=tier, model_name=config.get_model_tier(tier).get(provider, model_name))
+                for tier in tiers
+            }
+            router = ModelRouter(llm, tier_models, routes)
+        return GraphBuilder(llm, router, memory=self.memory).setup_graph(usecase, use_async=use_async)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "templates": len(self._graphs)}
+
+
+# Shared by all sessions in this process; Streamlit keeps imported modules alive across reruns.
+graph_templates = GraphTemplateCache(shared=Config().get_graph_template_cache())
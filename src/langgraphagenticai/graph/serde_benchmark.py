@@ -0,0 +1,127 @@
+# src/langgraphagenticai/graph/serde_benchmark.py
+"""
+Micro-benchmark of the checkpoint serializers on checkpoints shaped like our graphs' states.
+
+    python -m src.langgraphagenticai.graph.serde_benchmark [--iterations 200]
+
+For each sample state it prints, per serializer, the serialized size and the mean time to
+serialize and deserialize the checkpoint, and checks that both round-trip to the same values.
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict, List
+
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
+from langgraph.checkpoint.base import empty_checkpoint
+
+from src.langgraphagenticai.graph.checkpoint_serde import build_serde
+from src.langgraphagenticai.state.state import SDLCStages, Section
+
+SERDES = ("jsonplus", "compact")
+
+_PARAGRAPH = (
+    "The service exposes a REST API for catalogue search and order tracking. Requests are authenticated "
+    "with short-lived tokens, results are paginated, and every write is recorded in an audit log. "
+)
+
+
+def _text(paragraphs: int) -> str:
+    return "\n\n".join(f"{i + 1}. {_PARAGRAPH}" for i in range(paragraphs))
+
+
+def _checkpoint(channel_values: Dict[str, Any]) -> Dict[str, Any]:
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = channel_values
+    checkpoint["channel_versions"] = {key: f"{i:032}.0.1" for i, key in enumerate(channel_values)}
+    return checkpoint
+
+
+def chat_state(turns: int = 40) -> Dict[str, Any]:
+    """A Chatbot with Tool conversation: a tool call and result every fourth turn."""
+    messages: List[Any] = [SystemMessage(content="You are a helpful AI assistant.")]
+    for i in range(turns):
+        messages.append(HumanMessage(content=f"Question {i}: how does the checkout flow handle retries?", id=f"h{i}"))
+        if i % 4 == 0:
+            call = {"name": "tavily_search_results_json", "args": {"query": f"checkout retries {i}"}, "id": f"call{i}"}
+            messages.append(AIMessage(content="", tool_calls=[call], id=f"c{i}"))
+            messages.append(ToolMessage(content=_text(2), tool_call_id=f"call{i}", name=call["name"], id=f"t{i}"))
+        messages.append(AIMessage(
+            content=_text(2), id=f"a{i}",
+            response_metadata={"model_name": "llama-3.1-8b-instant", "finish_reason": "stop"},
+            usage_metadata={"input_tokens": 900 + i, "output_tokens": 180, "total_tokens": 1080 + i},
+        ))
+    return _checkpoint({"messages": messages, "summary": _text(1), "summarized_count": turns})
+
+
+def blog_state(sections: int = 8) -> Dict[str, Any]:
+    """A Blog Generation run waiting for feedback on its draft."""
+    plan = [Section(name=f"Section {i}", description=_PARAGRAPH) for i in range(sections)]
+    drafts = [f"## Section {i}\n\n{_text(4)}" for i in range(sections)]
+    return _checkpoint({
+        "messages": [HumanMessage(content="Write a post about API design", id="h0")],
+        "topic": "API design", "objective": "Educate", "target_audience": "Backend engineers",
+        "tone_style": "Practical", "word_count": 1500, "structure": ", ".join(s.name for s in plan),
+        "sections": plan, "completed_sections": drafts, "initial_draft": "\n\n".join(drafts),
+        "draft_approved": False,
+    })
+
+
+def sdlc_state() -> Dict[str, Any]:
+    """An SDLC run in review of its design documents."""
+    return _checkpoint({
+        "session_id": "bench", "current_stage": SDLCStages.DESIGN,
+        "project_name": "Bookstore app", "project_description": _PARAGRAPH, "project_goals": _PARAGRAPH,
+        "project_scope": _PARAGRAPH, "project_objectives": _PARAGRAPH,
+        "generated_requirements": _text(12), "user_stories": _text(16), "design_documents": _text(24),
+        "feedback": {"planning": ["accept"], "design": ["Add a caching layer", "Describe the failure modes"]},
+        "feedback_decision": "reject",
+        "history": [{"stage": stage.value, "timestamp": "2025-01-01T00:00:00"} for stage in list(SDLCStages)[:2]],
+    })
+
+
+STATES: Dict[str, Callable[[], Dict[str, Any]]] = {
+    "chat (40 turns)": chat_state,
+    "blog (8 sections)": blog_state,
+    "sdlc (design review)": sdlc_state,
+}
+
+
+def _mean_seconds(fn: Callable[[], Any], iterations: int) -> float:
+    fn()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations
+
+
+def run(iterations: int = 200) -> List[Dict[str, Any]]:
+    """Benchmark every serializer on every sample state; returns one result row per pair."""
+    results = []
+    for state_name, make_state in STATES.items():
+        checkpoint = make_state()
+        for serde_name in SERDES:
+            serde = build_serde(serde_name)
+            typed = serde.dumps_typed(checkpoint)
+            if serde.loads_typed(typed)["channel_values"] != checkpoint["channel_values"]:
+                raise AssertionError(f"{serde_name} does not round-trip the {state_name} state")
+            results.append({
+                "state": state_name,
+                "serde": serde_name,
+                "bytes": len(typed[1]),
+                "dumps_us": _mean_seconds(lambda: serde.dumps_typed(checkpoint), iterations) * 1e6,
+                "loads_us": _mean_seconds(lambda: serde.loads_typed(typed), iterations) * 1e6,
+            })
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    print(f"{'state':<22} {'serde':<9} {'bytes':>8} {'dumps µs':>10} {'loads µs':>10}")
+    for row in run(args.iterations):
+        print(f"{row['state']:<22} {row['serde']:<9} {row['bytes']:>8} {row['dumps_us']:>10.1f} {row['loads_us']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# src/langgraphagenticai/logging/llm_usage.py
+import json
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from src.langgraphagenticai.logging.logging_utils import LOG_DIR, logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+USAGE_LOG_PATH = LOG_DIR / "llm_usage.jsonl"
+
+
+def _empty_totals() -> Dict[str, Any]:
+    return {"calls": 0, "errors": 0, "cached": 0, "input_tokens": 0, "cached_input_tokens": 0, "output_tokens": 0,
+            "latency": 0.0, "cost": 0.0, "retries": 0, "retry_delay": 0.0}
+
+
+class UsageLedger:
+    """
+    In-process record of every LLM call, aggregated per session.
+
+    Each finished call is appended to `logs/llm_usage.jsonl` as it completes, so hot spots can
+    also be analysed offline across sessions.
+    """
+
+    def __init__(self, export_path=USAGE_LOG_PATH, max_records_per_session: int = 2000):
+        self.export_path = export_path
+        self.max_records_per_session = max_records_per_session
+        self._records: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._totals: Dict[str, Dict[tuple, Dict[str, Any]]] = defaultdict(lambda: defaultdict(_empty_totals))
+        self._lock = threading.Lock()
+
+    def add(self, record: Dict[str, Any]) -> None:
+        session_id = record.get("session_id") or "unknown"
+        with self._lock:
+            records = self._records[session_id]
+            records.append(record)
+            if len(records) > self.max_records_per_session:
+                del records[0]
+            totals = self._totals[session_id][(record.get("usecase"), record.get("node"))]
+            totals["calls"] += 1
+            totals["errors"] += 1 if record.get("error") else 0
+            totals["cached"] += 1 if record.get("cached") else 0
+            totals["input_tokens"] += record.get("input_tokens") or 0
+            totals["cached_input_tokens"] += record.get("cached_input_tokens") or 0
+            totals["output_tokens"] += record.get("output_tokens") or 0
+            totals["latency"] += record.get("latency") or 0.0
+            totals["cost"] += record.get("cost") or 0.0
+            totals["retries"] += max((record.get("attempts") or 1) - 1, 0)
+            totals["retry_delay"] += record.get("retry_delay") or 0.0
+            if self.export_path:
+                try:
+                    with open(self.export_path, "a", encoding="utf-8") as f:
+                        f.write(json.dumps(record, default=str) + "\n")
+                except OSError as e:
+                    logger.warning(f"Could not export LLM usage record: {e}")
+
+    def records(self, session_id: str) -> List[Dict[str, Any]]:
+        """Raw per-call records of a session, oldest first."""
+        with self._lock:
+            return list(self._records.get(session_id, []))
+
+    def summary(self, session_id: str) -> Dict[str, Any]:
+        """
+        Aggregate a session's calls per (use case, node), sorted by total latency.
+        `cached_token_ratio` is the share of input tokens served from the provider's prompt cache.
+
+        Returns:
+            dict: {"total": totals, "by_node": [{"usecase", "node", **totals}, ...]}
+        """
+        with self._lock:
+            groups = {key: dict(value) for key, value in self._totals.get(session_id, {}).items()}
+        total = _empty_totals()
+        by_node = []
+        for (usecase, node), totals in groups.items():
+            for field in total:
+                total[field] += totals[field]
+            by_node.append({"usecase": usecase, "node": node, **totals})
+        by_node.sort(key=lambda row: row["latency"], reverse=True)
+        for row in [total] + by_node:
+            row["cached_token_ratio"] = round(row["cached_input_tokens"] / row["input_tokens"], 3) if row["input_tokens"] else 0.0
+        return {"total": total, "by_node": by_node}
+
+    def clear(self, session_id: str) -> None:
+        with self._lock:
+            self._records.pop(session_id, None)
+            self._totals.pop(session_id, None)
+
+
+class LLMUsageCallbackHandler(BaseCallbackHandler):
+    """
+    Records tokens, time to first token, latency, retries and estimated cost of every chat model call.
+
+    The graph node (`langgraph_node`) and thread_id are read from the run metadata LangGraph adds
+    to every call; session_id and use case come from the `metadata` section of the run config.
+
+    Args:
+        ledger (UsageLedger): Where finished calls are recorded.
+        pricing (dict): Model name -> (USD per 1M input tokens, USD per 1M output tokens).
+        provider (str): Provider shown in the UI, recorded with each call.
+    """
+
+    def __init__(self, ledger: UsageLedger, pricing: Optional[Dict[str, tuple]] = None, provider: str = ""):
+        self.ledger = ledger
+        self.pricing = pricing or {}
+        self.provider = provider
+        self._runs: Dict[UUID, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def on_chat_model_start(self, serialized: Dict[str, Any], messages: List[List[Any]], *, run_id: UUID,
+                            parent_run_id: Optional[UUID] = None, tags: Optional[List[str]] = None,
+                            metadata: Optional[Dict[str, Any]] = None, **kwargs: Any) -> None:
+        metadata = metadata or {}
+        params = kwargs.get("invocation_params") or {}
+        with self._lock:
+            self._runs[run_id] = {
+                "started": time.monotonic(),
+                "first_token": None,
+                "node": metadata.get("langgraph_node"),
+                "usecase": metadata.get("usecase"),
+                "thread_id": metadata.get("thread_id"),
+                "session_id": metadata.get("session_id"),
+                "model": params.get("model_name") or params.get("model") or metadata.get("ls_model_name"),
+            }
+
+    def on_llm_new_token(self, token: str, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._runs.get(run_id)
+            if run is not None and run["first_token"] is None:
+                run["first_token"] = time.monotonic()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is None:
+            return
+        usage, cached = {}, False
+        if response.generations and response.generations[0]:
+            message = getattr(response.generations[0][0], "message", None)
+            usage = getattr(message, "usage_metadata", None) or {}
+            # LangChain zeroes `total_cost` on messages served from the response cache.
+            cached = usage.get("total_cost") == 0
+        llm_output = response.llm_output or {}
+        model = llm_output.get("served_by") or run["model"]
+        self._record(run, model, usage, cached, error=None, retry=llm_output)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs: Any) -> None:
+        with self._lock:
+            run = self._runs.pop(run_id, None)
+        if run is not None:
+            self._record(run, run["model"], {}, False, error=repr(error),
+                         retry=getattr(error, "retry_metrics", None) or {})
+
+    def _record(self, run: Dict[str, Any], model: Optional[str], usage: Dict[str, Any],
+                cached: bool, error: Optional[str], retry: Dict[str, Any]) -> None:
+        now = time.monotonic()
+        input_tokens = usage.get("input_tokens", 0)
+        output_tokens = usage.get("output_tokens", 0)
+        # Prompt tokens the provider served from its prompt cache (OpenAI, Gemini, Groq report these)
+        cached_input_tokens = (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+        self.ledger.add({
+            "timestamp": time.time(),
+            "session_id": run["session_id"],
+            "thread_id": run["thread_id"],
+            "usecase": run["usecase"],
+            "node": run["node"],
+            "provider": self.provider,
+            "model": model,
+            "input_tokens": input_tokens,
+            "cached_input_tokens": cached_input_tokens,
+            "output_tokens": output_tokens,
+            "ttft": round(run["first_token"] - run["started"], 4) if run["first_token"] else None,
+            "latency": round(now - run["started"], 4),
+            "cost": 0.0 if cached else self.estimate_cost(model, input_tokens, output_tokens),
+            "cached": cached,
+            "attempts": retry.get("retry_attempts", 1),
+            "retry_delay": retry.get("retry_delay", 0.0),
+            "error": error,
+        })
+
+    def estimate_cost(self, model: Optional[str], input_tokens: int, output_tokens: int) -> float:
+        """USD cost from the pricing table; models are matched on the name without a "models/" prefix."""
+        name = (model or "").split(":")[-1].replace("models/", "")
+        price = self.pricing.get(name)
+        if price is None:
+            return 0.0
+        return round((input_tokens * price[0] + output_tokens * price[1]) / 1_000_000, 6)
+
+
+# Shared by all sessions in this process; query it with usage_ledger.summary(session_id).
+usage_ledger = UsageLedger()
+
+
+def with_usage_tracking(model, provider: str):
+    """Return a copy of `model` that reports every call to the shared usage ledger."""
+    handler = LLMUsageCallbackHandler(usage_ledger, pricing=Config().get_llm_pricing(), provider=provider)
+    return model.model_copy(update={"callbacks": [handler]})
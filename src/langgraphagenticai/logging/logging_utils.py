@@ -1,5 +1,6 @@
 import logging
 import functools
+import inspect
 import time
 from pathlib import Path
 import copy
@@ -55,8 +56,30 @@ def redact_keys(data: dict, keys_to_redact=None):
 def log_entry_exit(func):
     """
     A decorator that logs function entry, exit, execution time,
-    and captures exceptions if any.
+    and captures exceptions if any. Coroutine functions are timed until they complete.
     """
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            func_name = func.__name__
+            logger.info(f"\n{'='*20} ENTER: {func_name} {'='*20}")
+            start_time = time.perf_counter()
+
+            try:
+                result = await func(*args, **kwargs)
+                execution_time = time.perf_counter() - start_time
+                logger.info(f"{func_name} completed in {execution_time:.4f} seconds")
+                logger.info(f"{'='*20} EXIT: {func_name} {'='*21}\n")
+                return result
+
+            except Exception as e:
+                execution_time = time.perf_counter() - start_time
+                logger.error(f"Exception in {func_name} after {execution_time:.4f} seconds: {e}", exc_info=True)
+                logger.info(f"{'='*20} FAILED: {func_name} {'='*20}\n")
+                raise
+
+        return async_wrapper
+
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         func_name = func.__name__
@@ -10,8 +10,23 @@ from src.langgraphagenticai.ui.streamlitui.loadui import LoadStreamlitUI
 from src.langgraphagenticai.LLMS.groqllm import GroqLLM
 from src.langgraphagenticai.LLMS.geminillm import GoogleLLM
 from src.langgraphagenticai.LLMS.chatgptllm import OpenaiLLM
-from src.langgraphagenticai.graph.graph_builder import GraphBuilder
+from src.langgraphagenticai.LLMS.fakellm import FakeLLM
+from src.langgraphagenticai.LLMS.llm_registry import llm_registry, hash_api_key
+from src.langgraphagenticai.LLMS.http_clients import http_clients
+from src.langgraphagenticai.LLMS.response_cache import get_response_cache
+from src.langgraphagenticai.LLMS.model_pipeline import build_model_pipeline
+from src.langgraphagenticai.LLMS.model_router import ModelRouter
+from src.langgraphagenticai.LLMS.runtime_llm import runtime_configurable
+from src.langgraphagenticai.LLMS.rate_limiter import rate_limiter_stats
+from src.langgraphagenticai.LLMS.hedged_llm import hedge_stats
+from src.langgraphagenticai.logging.llm_usage import usage_ledger
+from src.langgraphagenticai.graph.checkpointer import get_checkpointer
+from src.langgraphagenticai.graph.graph_templates import graph_templates
+from src.langgraphagenticai.nodes.chat_history_manager import model_name_of
+from src.langgraphagenticai.graph.async_runner import AsyncGraphRunner
+from src.langgraphagenticai.graph.graph_profiler import ProfiledGraph
 from src.langgraphagenticai.ui.streamlitui.display_result import DisplayResultStreamlit
+from src.langgraphagenticai.ui.uiconfigfile import Config
 
 logging.basicConfig(
     level=logging.INFO,  # Set the minimum log level to INFO
@@ -26,6 +41,56 @@ def get_session_history(session_id: str) -> BaseChatMessageHistory:
         store[session_id] = ChatMessageHistory()
     return store[session_id]
 
+# Provider name -> (LLM class, API key field, model field) as read by the LLMS/* provider classes
+PROVIDERS = {
+    "Groq": (GroqLLM, "GROQ_API_KEY", "selected_groq_model"),
+    "Google": (GoogleLLM, "GOOGLE_API_KEY", "selected_google_genai_model"),
+    "OpenAI": (OpenaiLLM, "OPENAI_API_KEY", "selected_OPENAI_model"),
+}
+
+def load_secondary_models(selected_llm: str):
+    """
+    Build a model for every other provider whose API key is available in the session or environment.
+    These back the primary model for hedged requests and failover.
+    """
+    config = Config()
+    if not config.get_hedging_enabled():
+        return []
+    secondaries = []
+    for provider, model_name in config.get_hedge_models().items():
+        if provider == selected_llm or provider not in PROVIDERS:
+            continue
+        llm_class, key_field, model_field = PROVIDERS[provider]
+        api_key = st.session_state.get(key_field) or os.getenv(key_field, "")
+        if not api_key:
+            continue
+        model = llm_class(user_controls_input={key_field: api_key, model_field: model_name}).get_llm_model()
+        if model:
+            secondaries.append((provider, model))
+    return secondaries
+
+def load_model_router(user_controls: dict, selected_llm: str, usecase: str, model, use_async: bool):
+    """
+    Build the ModelRouter for a use case from the model_routes_<use case> and model_tier_<tier> settings.
+    Tier models use the selected provider and API key; returns None when the use case has no routes.
+    """
+    config = Config()
+    routes = config.get_model_routes(usecase)
+    if not routes or selected_llm not in PROVIDERS:
+        return None
+    llm_class, key_field, model_field = PROVIDERS[selected_llm]
+    tier_models = {}
+    for tier in set(routes.values()) - {ModelRouter.DEFAULT_TIER}:
+        model_name = config.get_model_tier(tier).get(selected_llm)
+        if not model_name:
+            continue
+        tier_model = llm_class(user_controls_input={**user_controls, model_field: model_name}).get_llm_model()
+        if tier_model:
+            tier_models[tier] = build_model_pipeline(tier_model, selected_llm, usecase, use_async=use_async)
+    router = ModelRouter(model, tier_models, routes)
+    logger.info(f"Model routing for {usecase}: {router.describe()}")
+    return router
+
 def load_langgraph_agenticai_app():
     """
     Loads and runs the LangGraph AgenticAI application with Streamlit UI.
@@ -38,13 +103,15 @@ def load_langgraph_agenticai_app():
         st.error("Error: Failed to load user controls from the UI.")
         return
 
-    selected_llm = user_controls.get("selected_llm")
+    selected_llm = Config().get_llm_provider_override() or user_controls.get("selected_llm")
     if not selected_llm:
         st.info("Please select an LLM in the sidebar to proceed.")
         return
 
+    # The offline provider pairs with the offline search tool so every use case runs without network access
+    st.session_state["offline_tools"] = selected_llm == "Fake"
     tavily_api_key = user_controls.get("TAVILY_API_KEY", st.session_state.get("TAVILY_API_KEY", os.getenv("TAVILY_API_KEY", "")))
-    if not tavily_api_key and user_controls.get("selected_usecase") in ["Blog Generation", "Chatbot with Tool"]:
+    if not tavily_api_key and selected_llm != "Fake" and user_controls.get("selected_usecase") in ["Blog Generation", "Chatbot with Tool"]:
         st.warning("Tavily API key not found. Web search will be skipped.")
     else:
         st.session_state["TAVILY_API_KEY"] = tavily_api_key
@@ -60,11 +127,14 @@ def load_langgraph_agenticai_app():
         st.warning("Please enter your OpenAI API key in the sidebar.")
         return
 
-    # Session state initialization
+    # Session state initialization. The IDs are mirrored in the URL so that reloading the page after a
+    # restart rejoins the same checkpointed thread (see graph/checkpointer.py)
     if "session_id" not in st.session_state:
-        st.session_state.session_id = str(uuid.uuid4())
+        st.session_state.session_id = st.query_params.get("session_id") or str(uuid.uuid4())
     if "thread_id" not in st.session_state:
-        st.session_state.thread_id = str(uuid.uuid4())
+        st.session_state.thread_id = st.query_params.get("thread_id") or str(uuid.uuid4())
+    st.query_params["session_id"] = st.session_state.session_id
+    st.query_params["thread_id"] = st.session_state.thread_id
     if "graph_state" not in st.session_state:
         st.session_state.graph_state = None
     if "waiting_for_feedback" not in st.session_state:
@@ -72,9 +142,13 @@ def load_langgraph_agenticai_app():
     if "blog_requirements_collected" not in st.session_state:
         st.session_state.blog_requirements_collected = False
     if "current_usecase" not in st.session_state:
-        st.session_state.current_usecase = None
+        st.session_state.current_usecase = st.query_params.get("usecase")
 
-    config = {"configurable": {"session_id": st.session_state.session_id, "thread_id": st.session_state.thread_id, "recursion_limit": 10}}
+    config = {
+        "configurable": {"session_id": st.session_state.session_id, "thread_id": st.session_state.thread_id, "recursion_limit": 10},
+        # Run metadata reaches every LLM callback; used to attribute usage to a session and use case
+        "metadata": {"session_id": st.session_state.session_id, "usecase": user_controls.get("selected_usecase")},
+    }
     logger.info(f"Session ID: {st.session_state.session_id}, Thread ID: {st.session_state.thread_id}")
 
     # Load LLM
@@ -85,6 +159,8 @@ def load_langgraph_agenticai_app():
             llm_config = GoogleLLM(user_controls_input=user_controls)
         elif selected_llm == "OpenAI":
             llm_config = OpenaiLLM(user_controls_input=user_controls)
+        elif selected_llm == "Fake":
+            llm_config = FakeLLM(user_controls_input=user_controls)
         else:
             st.error(f"Error: Unsupported LLM selected: '{selected_llm}'")
             return
@@ -93,6 +169,8 @@ def load_langgraph_agenticai_app():
         if not model:
             st.error("Error: LLM model could not be initialized.")
             return
+        logger.info(f"LLM client registry stats: {llm_registry.stats()}")
+        logger.info(f"Provider HTTP first-request latency (cold vs warm): {http_clients.stats()}")
 
         # Graph setup
         usecase = user_controls.get("selected_usecase")
@@ -100,33 +178,58 @@ def load_langgraph_agenticai_app():
             st.error("Error: No use case selected.")
             return
 
+        use_async = Config().get_async_execution()
+        secondaries = load_secondary_models(selected_llm)
+        model = build_model_pipeline(model, selected_llm, usecase, use_async=use_async, secondaries=secondaries)
+        logger.info(f"LLM response cache stats: {get_response_cache().stats()}")
+        logger.info(f"LLM rate limiter stats: {rate_limiter_stats()}")
+        if secondaries:
+            logger.info(f"LLM hedging stats: {hedge_stats()}")
+        logger.info(f"LLM usage this session: {usage_ledger.summary(st.session_state.session_id)['total']}")
+
         if st.session_state.current_usecase != usecase:
             logger.info(f"Use case changed to: {usecase}. Resetting session state.")
             st.session_state.waiting_for_feedback = False
             st.session_state.blog_requirements_collected = False
+            previous_usecase = st.session_state.current_usecase
             st.session_state.current_usecase = usecase
             get_session_history(st.session_state.session_id).clear()
-            if "graph" in st.session_state:
-                del st.session_state.graph
-            if "with_message_history" in st.session_state:
-                del st.session_state.with_message_history
-
-        if "graph" not in st.session_state:
-            graph_builder = GraphBuilder(model)
-            graph = graph_builder.setup_graph(usecase)
-            with_message_history = RunnableWithMessageHistory(
-                graph,
-                get_session_history,
-                input_messages_key="messages",
-                history_messages_key="messages"
-            )
-            st.session_state.graph = graph
-            st.session_state.with_message_history = with_message_history
+            if previous_usecase is not None:
+                # Graphs share one checkpointer, so a new use case starts on a new thread
+                st.session_state.thread_id = str(uuid.uuid4())
+                st.query_params["thread_id"] = st.session_state.thread_id
+                config["configurable"]["thread_id"] = st.session_state.thread_id
+            st.query_params["usecase"] = usecase
+
+        # Compiled graphs are shared process-wide; this session's models travel in the run config
+        router = load_model_router(user_controls, selected_llm, usecase, model, use_async)
+        config["configurable"].update(runtime_configurable(model, router))
+        scope = ""
+        if usecase == "Chatbot with Tool":
+            # The search tool (offline stand-in or Tavily with its API key) is compiled into the graph
+            scope = "offline" if st.session_state["offline_tools"] else hash_api_key(st.session_state.get("TAVILY_API_KEY", ""))
+        compiled_graph = graph_templates.get(usecase, selected_llm, model_name_of(model), use_async=use_async, scope=scope)
+        logger.info(f"Graph template cache stats: {graph_templates.stats()}")
+        logger.info(f"Checkpoint retention stats: {get_checkpointer().retention_stats()}")
+        if getattr(get_checkpointer(), "blob_store", None) is not None:
+            logger.info(f"Checkpoint blob store stats: {get_checkpointer().blob_store.stats()}")
+        graph = AsyncGraphRunner(compiled_graph) if use_async else compiled_graph
+        if Config().get_graph_profiling():
+            graph = ProfiledGraph(graph, usecase)
+        with_message_history = RunnableWithMessageHistory(
+            compiled_graph,
+            get_session_history,
+            input_messages_key="messages",
+            history_messages_key="messages"
+        )
 
         # Display chat history and process input
-        display = DisplayResultStreamlit(st.session_state.graph, st.session_state.with_message_history, config, usecase)
+        display = DisplayResultStreamlit(graph, with_message_history, config, usecase)
         display.display_chat_history()
         display.process_user_input()
+        if isinstance(graph, ProfiledGraph) and graph.last_profile is not None:
+            with st.expander("Graph profile of the last run"):
+                st.code(graph.last_profile.summary_table())
 
     except Exception as e:
         logger.error(f"Error initializing application: {e}")
@@ -4,14 +4,21 @@ from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from src.langgraphagenticai.logging.logging_utils import logger, log_entry_exit
 
 class BasicChatbotNode:
-    def __init__(self, model):
+    SYSTEM_PROMPT = "You are a helpful AI assistant."
+
+    def __init__(self, model, history=None):
+        """
+        Args:
+            model: Chat model answering the user.
+            history: Optional ChatHistoryManager bounding the context sent on each turn.
+        """
         self.llm = model
+        self.history = history
 
     def process(self, state: State) -> dict:
         messages = state["messages"]
         response = self.llm.invoke(messages)
-        state["messages"].append(response if isinstance(response, AIMessage) else AIMessage(content=str(response)))
-        return state
+        return {"messages": [response if isinstance(response, AIMessage) else AIMessage(content=str(response))]}
 
     def create_chatbot(self):
         """
@@ -25,15 +32,42 @@ class BasicChatbotNode:
 
                 # Get the last message
                 last_message = state["messages"][-1]
-                
+
+                if self.history is not None:
+                    messages, history_update = self.history.prepare(state, self.SYSTEM_PROMPT)
+                else:
+                    messages, history_update = [SystemMessage(content=self.SYSTEM_PROMPT), *state["messages"]], {}
+
                 # Process with LLM
-                response = self.llm.invoke([
-                    SystemMessage(content="You are a helpful AI assistant."),
-                    *state["messages"]
-                ])
+                response = self.llm.invoke(messages)
+
+                # Return only the reply; add_messages appends it to the history
+                return {"messages": [AIMessage(content=response.content)], **history_update}
+
+            except Exception as e:
+                logger.error(f"Error in chatbot processing: {e}")
+                return {"messages": [AIMessage(content=f"I encountered an error: {str(e)}")]}
+
+        return chatbot
+
+    def create_async_chatbot(self):
+        """
+        Async variant of create_chatbot; awaits the LLM so the graph can run on an event loop.
+        """
+        async def chatbot(state: State) -> dict:
+            try:
+                if not state.get("messages"):
+                    logger.warning("No messages found in state")
+                    return {"messages": [AIMessage(content="No input received. How can I help you?")]}
+
+                if self.history is not None:
+                    messages, history_update = await self.history.aprepare(state, self.SYSTEM_PROMPT)
+                else:
+                    messages, history_update = [SystemMessage(content=self.SYSTEM_PROMPT), *state["messages"]], {}
+
+                response = await self.llm.ainvoke(messages)
 
-                # Update state with response
-                return {"messages": [*state["messages"], AIMessage(content=response.content)]}
+                return {"messages": [AIMessage(content=response.content)], **history_update}
 
             except Exception as e:
                 logger.error(f"Error in chatbot processing: {e}")
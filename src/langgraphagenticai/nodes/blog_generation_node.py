@@ -1,6 +1,6 @@
 from langgraph.graph import StateGraph, START, END
 from langgraph.constants import Send
-from src.langgraphagenticai.state.state import BlogState as State, Sections, Section  # Import from state.py
+from src.langgraphagenticai.state.state import BlogState as State, Sections, Section, SectionDrafts, RevisionScope  # Import from state.py
 from langchain_core.messages import SystemMessage, HumanMessage
 import streamlit as st
 import json
@@ -8,35 +8,73 @@ from datetime import datetime
 from typing import List
 
 from src.langgraphagenticai.logging.logging_utils import logger, log_entry_exit
+from src.langgraphagenticai.LLMS.model_router import route_model
+from src.langgraphagenticai.LLMS.runtime_llm import RuntimeChatModel
+from src.langgraphagenticai.nodes.blog_section_cache import SectionCache, get_section_cache
+from src.langgraphagenticai.nodes.chat_history_manager import model_name_of
+from src.langgraphagenticai.ui.uiconfigfile import Config
 
 import functools
 import time
 
 class BlogGenerationNode:
-    def __init__(self, model):
-        """Initialize the BlogGenerationNode with an LLM."""
-        self.llm = model
-        self.planner = model.with_structured_output(Sections)
-
-    @log_entry_exit
-    def validate_and_standardize_structure(self, user_input: str) -> List[str]:
+    DEFAULT_STRUCTURE = ["Introduction", "Main Content", "Conclusion"]
+
+    STRUCTURE_SYSTEM_PROMPT = (
+        "You are an expert blog planner. Your task is to analyze the user's input and extract or infer a clear, concise structure "
+        "for a blog post as a list of section names. The input may explicitly list sections (e.g., 'Structure: Intro, Benefits, Summary') "
+        "or describe them implicitly (e.g., 'I want an intro, some benefits, and a conclusion'). "
+        "If the user provides a 'Structure' field (e.g., 'Structure: Intro, Benefits, Summary'), you MUST use those exact section names "
+        "without modification, except for capitalizing the first letter of each section. "
+        "If no structure is provided or it's unclear, propose a logical default structure based on the topic or context. "
+        "Return the result as a JSON object with a single key 'sections' containing the list of section names. "
+        "Capitalize each section name and avoid adding unnecessary sections beyond what’s indicated."
+    )
+
+    SECTION_SYSTEM_PROMPT = "Write a report section following the provided name and description. Include no preamble for each section. Use markdown formatting."
+
+    MULTI_SECTION_SYSTEM_PROMPT = (
+        "Write every report section listed by the user, in the given order, following each section's name and description. "
+        "Return one entry per section with its exact name and its markdown content. Include no preamble for each section."
+    )
+
+    REVISION_SYSTEM_PROMPT = (
+        "Revise the report section below according to the reviewer's feedback, keeping what the feedback does not ask to change. "
+        "Return only the revised section, with no preamble. Use markdown formatting."
+    )
+
+    REVISION_SCOPE_SYSTEM_PROMPT = (
+        "A reviewer rejected a blog draft with the feedback below. Decide which sections of the draft the feedback asks to change. "
+        "List the exact names of those sections only. Set replan to true if the feedback asks to add, remove, reorder or rename "
+        "sections, or to rework the whole post."
+    )
+
+    # Section writing modes, see blog_section_mode in uiconfigfile.ini
+    FANOUT, BATCH, MULTI = "fanout", "batch", "multi"
+
+    def __init__(self, model, router=None):
         """
-        Uses an LLM to interpret user input and generate a standardized list of blog section names.
-        Ensures the user's specified structure is respected if provided.
-
-        Args:
-            user_input (str): The full user input from the Streamlit form (e.g., "Topic: AI\nStructure: Intro, Benefits, Summary").
-
-        Returns:
-            List[str]: A list of standardized section names (e.g., ["Intro", "Benefits", "Summary"]).
+        Initialize the BlogGenerationNode with an LLM.
+        An optional ModelRouter picks the model per call site: "structure", "planner" and "section".
         """
-        # Default structure if all else fails
-        default_structure = ["Introduction", "Main Content", "Conclusion"]
-
+        self.llm = model
+        self.router = router
+        self.planner = route_model(model, router, "planner").with_structured_output(Sections)
+        config = Config()
+        self.section_mode_setting = config.get_blog_section_mode()
+        self.batch_min_sections = config.get_blog_batch_min_sections()
+        self.batch_max_concurrency = config.get_blog_batch_max_concurrency()
+        self.multi_section_budgets = config.get_blog_multi_section_max_tokens()
+        self.targeted_revision = config.get_blog_targeted_revision()
+        self.revision_scoper = route_model(model, router, "revision").with_structured_output(RevisionScope)
+        self.section_cache = get_section_cache()
+
+    def _extract_user_structure(self, user_input: str):
+        """Return the text after 'Structure:' in the user input, or None if the default structure should be used."""
         # If input is empty or whitespace-only, return default
         if not user_input or not user_input.strip():
             logger.info("Empty or whitespace-only input; returning default structure")
-            return default_structure
+            return None
 
         # Extract the user's structure if provided
         user_structure = None
@@ -47,63 +85,90 @@ class BlogGenerationNode:
 
         if not user_structure:
             logger.info("No structure provided; returning default structure")
-            return default_structure
-
-        # Define the prompt for the LLM
-        system_prompt = (
-            "You are an expert blog planner. Your task is to analyze the user's input and extract or infer a clear, concise structure "
-            "for a blog post as a list of section names. The input may explicitly list sections (e.g., 'Structure: Intro, Benefits, Summary') "
-            "or describe them implicitly (e.g., 'I want an intro, some benefits, and a conclusion'). "
-            "If the user provides a 'Structure' field (e.g., 'Structure: Intro, Benefits, Summary'), you MUST use those exact section names "
-            "without modification, except for capitalizing the first letter of each section. "
-            "If no structure is provided or it's unclear, propose a logical default structure based on the topic or context. "
-            "Return the result as a JSON object with a single key 'sections' containing the list of section names. "
-            "Capitalize each section name and avoid adding unnecessary sections beyond what’s indicated."
-        )
+        return user_structure
 
-        # Prepare messages for the LLM
-        messages = [
-            SystemMessage(content=system_prompt),
+    def _structure_messages(self, user_input: str) -> list:
+        return [
+            SystemMessage(content=self.STRUCTURE_SYSTEM_PROMPT),
             HumanMessage(content=f"User input: {user_input}")
         ]
 
+    def _parse_structure_response(self, response, user_structure: str) -> List[str]:
+        """Parse the LLM's JSON structure response, enforcing the user's explicit section names."""
+        default_structure = list(self.DEFAULT_STRUCTURE)
+        response_content = response.content if hasattr(response, "content") else str(response)
+        logger.info(f"LLM response for structure: {response_content}")
+
+        # Parse the JSON response
+        result = json.loads(response_content)
+        sections = result.get("sections", default_structure)
+
+        # Validate and standardize the output
+        if not isinstance(sections, list) or not sections:
+            logger.warning("LLM returned invalid sections; using default structure")
+            return default_structure
+
+        # Clean up section names: strip whitespace, capitalize, remove empty strings
+        cleaned_sections = [s.strip().capitalize() for s in sections if s.strip()]
+
+        # If user provided a structure, enforce it
+        if user_structure:
+            user_sections = [s.strip().capitalize() for s in user_structure.split(",") if s.strip()]
+            if len(cleaned_sections) == len(user_sections):
+                # Override LLM sections with user sections if lengths match
+                cleaned_sections = user_sections
+            else:
+                logger.warning(f"LLM section count ({len(cleaned_sections)}) doesn't match user section count ({len(user_sections)}); using user structure")
+                cleaned_sections = user_sections
+
+        return cleaned_sections if cleaned_sections else default_structure
+
+    @log_entry_exit
+    def validate_and_standardize_structure(self, user_input: str) -> List[str]:
+        """
+        Uses an LLM to interpret user input and generate a standardized list of blog section names.
+        Ensures the user's specified structure is respected if provided.
+
+        Args:
+            user_input (str): The full user input from the Streamlit form (e.g., "Topic: AI\nStructure: Intro, Benefits, Summary").
+
+        Returns:
+            List[str]: A list of standardized section names (e.g., ["Intro", "Benefits", "Summary"]).
+        """
+        user_structure = self._extract_user_structure(user_input)
+        if not user_structure:
+            return list(self.DEFAULT_STRUCTURE)
+
         try:
             # Invoke the LLM and expect a JSON response
-            response = self.llm.invoke(messages)
-            response_content = response.content if hasattr(response, "content") else str(response)
-            logger.info(f"LLM response for structure: {response_content}")
-
-            # Parse the JSON response
-            result = json.loads(response_content)
-            sections = result.get("sections", default_structure)
-
-            # Validate and standardize the output
-            if not isinstance(sections, list) or not sections:
-                logger.warning("LLM returned invalid sections; using default structure")
-                return default_structure
-
-            # Clean up section names: strip whitespace, capitalize, remove empty strings
-            cleaned_sections = [s.strip().capitalize() for s in sections if s.strip()]
-
-            # If user provided a structure, enforce it
-            if user_structure:
-                user_sections = [s.strip().capitalize() for s in user_structure.split(",") if s.strip()]
-                if len(cleaned_sections) == len(user_sections):
-                    # Override LLM sections with user sections if lengths match
-                    cleaned_sections = user_sections
-                else:
-                    logger.warning(f"LLM section count ({len(cleaned_sections)}) doesn't match user section count ({len(user_sections)}); using user structure")
-                    cleaned_sections = user_sections
+            response = route_model(self.llm, self.router, "structure").invoke(self._structure_messages(user_input))
+            return self._parse_structure_response(response, user_structure)
+        except Exception as e:
+            logger.error(f"Error in LLM structure generation: {e}")
+            return list(self.DEFAULT_STRUCTURE)
 
-            return cleaned_sections if cleaned_sections else default_structure
+    @log_entry_exit
+    async def avalidate_and_standardize_structure(self, user_input: str) -> List[str]:
+        """Async variant of validate_and_standardize_structure."""
+        user_structure = self._extract_user_structure(user_input)
+        if not user_structure:
+            return list(self.DEFAULT_STRUCTURE)
 
+        try:
+            response = await route_model(self.llm, self.router, "structure").ainvoke(self._structure_messages(user_input))
+            return self._parse_structure_response(response, user_structure)
         except Exception as e:
             logger.error(f"Error in LLM structure generation: {e}")
-            return default_structure
-    
-    @log_entry_exit
-    def user_input(self, state: State) -> dict:
-        """Handle user input, distinguishing between initial requirements and feedback."""
+            return list(self.DEFAULT_STRUCTURE)
+
+    def _parse_requirements(self, state: State):
+        """
+        Parse the latest message into blog requirements.
+
+        Returns:
+            tuple: (requirements, structure_input). `structure_input` is the text to standardize
+            into section names, or None when the requirements should be returned as they are.
+        """
         logger.info(f"Executing user_input with state: {state}")
         
         # Initialize requirements with existing state values to preserve them
@@ -124,7 +189,7 @@ class BlogGenerationNode:
         user_message = state["messages"][-1].content if state["messages"] else ""
         if not user_message:
             logger.warning("No user message provided; returning existing requirements with reset content")
-            return requirements
+            return requirements, None
 
         # Flag to track if the message is feedback
         is_feedback = False
@@ -135,6 +200,7 @@ class BlogGenerationNode:
             if isinstance(feedback_data, dict) and "approved" in feedback_data:
                 # This is a feedback message, update only the feedback field
                 requirements["feedback"] = feedback_data.get("comments", "No feedback provided.")
+                requirements["revision_picks"] = feedback_data.get("sections") or []
                 is_feedback = True
                 logger.info(f"Processed feedback message: {requirements['feedback']}")
                 
@@ -168,10 +234,12 @@ class BlogGenerationNode:
             # Return existing requirements to avoid crashing, but still clear content
             requirements["initial_draft"] = ""
             requirements["completed_sections"] = []
-            return requirements
+            return requirements, None
 
         structure_input = requirements["structure"] if is_feedback else user_message
-        standardized_structure = self.validate_and_standardize_structure(structure_input)
+        return requirements, structure_input
+
+    def _finalize_requirements(self, requirements: dict, standardized_structure: List[str]) -> dict:
         requirements["structure"] = ", ".join(standardized_structure)
 
         # Log the final state that will be returned
@@ -181,9 +249,29 @@ class BlogGenerationNode:
         
         return requirements
 
-    
-    @log_entry_exit        
-    def orchestrator(self, state: State) -> dict:
+    @log_entry_exit
+    def user_input(self, state: State) -> dict:
+        """Handle user input, distinguishing between initial requirements and feedback."""
+        requirements, structure_input = self._parse_requirements(state)
+        if structure_input is None:
+            return requirements
+        return self._finalize_requirements(requirements, self.validate_and_standardize_structure(structure_input))
+
+    @log_entry_exit
+    async def auser_input(self, state: State) -> dict:
+        """Async variant of user_input."""
+        requirements, structure_input = self._parse_requirements(state)
+        if structure_input is None:
+            return requirements
+        return self._finalize_requirements(requirements, await self.avalidate_and_standardize_structure(structure_input))
+
+    def _plan_request(self, state: State):
+        """
+        Build the planner call for the orchestrator.
+
+        Returns:
+            tuple: (return_state, messages) where `return_state` holds the defaults returned if planning fails.
+        """
         logger.info(f"Executing orchestrator with state: {state}")
         needs_revision = False
 
@@ -193,9 +281,10 @@ class BlogGenerationNode:
         return_state = {
             "sections": [],
             "completed_sections": [],
-            "initial_draft": ""
+            "initial_draft": "",
+            "revise_sections": [],
+            "cached_sections": []
         }
-        needs_revision=False
 
         if state.get("messages"):
             last_message_content = state["messages"][-1].content
@@ -227,13 +316,19 @@ class BlogGenerationNode:
             f"Incorporate {feedback} to enhance the quality of the content. "
             f"Please refrain from adding any extra sections or altering the section names unless {feedback} is provided."
         )
+        messages = [
+            SystemMessage(content=prompt),
+            HumanMessage(content=f"Topic: {state['topic']} with feedback {feedback}")
+        ]
+        return return_state, messages
 
+    @log_entry_exit        
+    def orchestrator(self, state: State) -> dict:
+        return_state, messages = self._plan_request(state)
         try:
-            report_sections = self.planner.invoke([
-                SystemMessage(content=prompt),
-                HumanMessage(content=f"Topic: {state['topic']} with feedback {feedback}")
-            ])
+            report_sections = self.planner.invoke(messages)
             return_state["sections"] = report_sections.sections
+            return_state["cached_sections"] = self._cached_sections(state, report_sections.sections)
             
         except Exception as e:
             logger.error(f"Error generating plan with LLM: {e}")
@@ -241,23 +336,178 @@ class BlogGenerationNode:
         
         logger.info(f"Orchestrator returning: {return_state}")
         return return_state
+
     @log_entry_exit
-    def llm_call(self, state: State) -> dict:
-        """Worker writes a section of the report."""
-        section = self.llm.invoke([
-            SystemMessage(content="Write a report section following the provided name and description. Include no preamble for each section. Use markdown formatting."),
-            HumanMessage(content=f"Here is the section name: {state['section'].name} and description: {state['section'].description}")
-        ])
+    async def aorchestrator(self, state: State) -> dict:
+        """Async variant of orchestrator."""
+        return_state, messages = self._plan_request(state)
+        try:
+            report_sections = await self.planner.ainvoke(messages)
+            return_state["sections"] = report_sections.sections
+            return_state["cached_sections"] = self._cached_sections(state, report_sections.sections)
+        except Exception as e:
+            logger.error(f"Error generating plan with LLM: {e}")
+
+        logger.info(f"Orchestrator returning: {return_state}")
+        return return_state
+
+    def _section_messages(self, section: Section) -> list:
+        return [
+            SystemMessage(content=self.SECTION_SYSTEM_PROMPT),
+            HumanMessage(content=f"Here is the section name: {section.name} and description: {section.description}")
+        ]
+
+    def _worker_messages(self, state: dict) -> list:
+        """Messages of an llm_call worker: a new section, or the revision of a drafted one (see assign_revisions)."""
+        section = state["section"]
+        if state.get("previous_content") is None:
+            return self._section_messages(section)
+        return [
+            SystemMessage(content=self.REVISION_SYSTEM_PROMPT),
+            HumanMessage(content=f"Section name: {section.name}\nDescription: {section.description}\n\n"
+                                 f"Current section:\n{state['previous_content']}\n\nReviewer feedback: {state.get('feedback', '')}")
+        ]
+
+    def _section_key(self, state: State, section: Section) -> str:
+        """Section cache key of a plan entry, for the writing model of the current run."""
+        writer = route_model(self.llm, self.router, "section")
+        if isinstance(writer, RuntimeChatModel):
+            writer = writer.resolve()
+        return SectionCache.make_key(section.name, section.description, state.get("topic", ""),
+                                     state.get("tone_style", ""), state.get("target_audience", ""), model_name_of(writer))
+
+    def _cached_sections(self, state: State, sections: List[Section]) -> List:
+        """Cached content of each planned section, None for the sections a worker has to write."""
+        if self.section_cache is None:
+            return []
+        cached = [self.section_cache.get(self._section_key(state, s)) for s in sections]
+        logger.info(f"Section cache: {sum(c is not None for c in cached)} of {len(sections)} planned sections cached")
+        return cached
+
+    def _sections_to_write(self, state: State) -> List[int]:
+        """Plan indices of the sections with no cached content."""
+        cached = state.get("cached_sections") or []
+        return [i for i in range(len(state.get("sections") or [])) if i >= len(cached) or cached[i] is None]
+
+    def _remember_section(self, key: str, content: str) -> None:
+        if self.section_cache is not None and key:
+            self.section_cache.put(key, content)
+
+    def _section_result(self, state: State, section) -> dict:
         logger.info(f"\n{'='*20}:llm_call output:{'='*20}\nGenerated section: {section.content}\n{'='*20}\n")
         logger.info(f"\n---------------------state[completed_sections]:---------------------------- \n{state.get('completed_sections', [])}")
 
         return {"completed_sections": state.get("completed_sections", []) + [section.content]}
+
+    @log_entry_exit
+    def llm_call(self, state: State) -> dict:
+        """Worker writes a section of the report."""
+        section = route_model(self.llm, self.router, "section").invoke(self._worker_messages(state))
+        self._remember_section(state.get("cache_key"), section.content)
+        return self._section_result(state, section)
+
+    @log_entry_exit
+    async def allm_call(self, state: State) -> dict:
+        """Async worker; many sections can be awaited concurrently on one event loop."""
+        section = await route_model(self.llm, self.router, "section").ainvoke(self._worker_messages(state))
+        self._remember_section(state.get("cache_key"), section.content)
+        return self._section_result(state, section)
     
+    def section_mode(self, state: State) -> str:
+        """
+        Pick how the planned sections are written.
+
+        In "auto" mode short plans keep one graph worker per section; longer ones are written in a
+        single structured call when the requested word count fits the section model's output token
+        budget (blog_multi_section_max_tokens), and with one batch call otherwise.
+        """
+        mode = self.section_mode_setting
+        if mode in (self.FANOUT, self.BATCH, self.MULTI):
+            return mode
+        section_count = len(state.get("sections") or [])
+        if section_count < self.batch_min_sections:
+            return self.FANOUT
+        writer = route_model(self.llm, self.router, "section")
+        budget = self.multi_section_budgets.get(model_name_of(writer), self.multi_section_budgets.get("default", 0))
+        # ~4/3 tokens per word, plus the JSON envelope around each section
+        estimated_tokens = int(state.get("word_count") or 1000) * 4 // 3 + 40 * section_count
+        return self.MULTI if estimated_tokens <= budget else self.BATCH
+
+    def _multi_section_messages(self, sections: List[Section]) -> list:
+        plan = "\n".join(f"{i}. {s.name}: {s.description}" for i, s in enumerate(sections, 1))
+        return [
+            SystemMessage(content=self.MULTI_SECTION_SYSTEM_PROMPT),
+            HumanMessage(content=f"Here are the sections to write:\n{plan}")
+        ]
+
+    def _multi_section_contents(self, sections: List[Section], drafts: SectionDrafts) -> List[str]:
+        """Order the drafts of a multi-section call by the plan; raises ValueError if any section is missing."""
+        by_name = {draft.name.strip().lower(): draft.content for draft in drafts.sections}
+        if all(s.name.strip().lower() in by_name for s in sections):
+            return [by_name[s.name.strip().lower()] for s in sections]
+        if len(drafts.sections) == len(sections):
+            return [draft.content for draft in drafts.sections]
+        raise ValueError(f"multi-section call returned {len(drafts.sections)} of {len(sections)} sections")
+
+    def _batch_result(self, state: State, sections: List[Section], mode: str, contents: List[str]) -> dict:
+        logger.info(f"Wrote {len(contents)} sections in '{mode}' mode")
+        if self.section_cache is not None:
+            for section, content in zip(sections, contents):
+                self._remember_section(self._section_key(state, section), content)
+        return {"completed_sections": contents}
+
+    @log_entry_exit
+    def batch_sections(self, state: State) -> dict:
+        """Write every planned section that is not cached with one multi-section call or one batch call, in plan order."""
+        sections = [state["sections"][i] for i in self._sections_to_write(state)]
+        writer = route_model(self.llm, self.router, "section")
+        mode = self.section_mode(state)
+        if mode == self.MULTI:
+            try:
+                drafts = writer.with_structured_output(SectionDrafts).invoke(self._multi_section_messages(sections))
+                return self._batch_result(state, sections, mode, self._multi_section_contents(sections, drafts))
+            except Exception as e:
+                logger.warning(f"Multi-section call failed, writing sections with a batch call instead: {e}")
+        responses = writer.batch([self._section_messages(s) for s in sections],
+                                 config={"max_concurrency": self.batch_max_concurrency})
+        return self._batch_result(state, sections, self.BATCH, [response.content for response in responses])
+
+    @log_entry_exit
+    async def abatch_sections(self, state: State) -> dict:
+        """Async variant of batch_sections."""
+        sections = [state["sections"][i] for i in self._sections_to_write(state)]
+        writer = route_model(self.llm, self.router, "section")
+        mode = self.section_mode(state)
+        if mode == self.MULTI:
+            try:
+                drafts = await writer.with_structured_output(SectionDrafts).ainvoke(self._multi_section_messages(sections))
+                return self._batch_result(state, sections, mode, self._multi_section_contents(sections, drafts))
+            except Exception as e:
+                logger.warning(f"Multi-section call failed, writing sections with a batch call instead: {e}")
+        responses = await writer.abatch([self._section_messages(s) for s in sections],
+                                        config={"max_concurrency": self.batch_max_concurrency})
+        return self._batch_result(state, sections, self.BATCH, [response.content for response in responses])
+
     @log_entry_exit
     def synthesizer(self, state: State) -> dict:
             """Synthesize full report from sections and clear the sections list."""
             # Safely get the list, defaulting to empty if it's None or missing
             completed_sections = state.get("completed_sections", []) 
+
+            cached_sections = state.get("cached_sections") or []
+            if any(content is not None for content in cached_sections) and not state.get("revise_sections"):
+                # Section cache hits: workers only wrote the missing sections, the last len(missing) entries in index order
+                missing = self._sections_to_write(state)
+                sections_to_use = list(cached_sections)
+                for index, content in zip(missing, completed_sections[-len(missing):] if missing else []):
+                    sections_to_use[index] = content
+                logger.info(f"Synthesizing draft from {len(sections_to_use) - len(missing)} cached and {len(missing)} written sections")
+                return {
+                    "initial_draft": "\n\n---\n\n".join(sections_to_use),
+                    "draft_sections": sections_to_use,
+                    "cached_sections": [],
+                    "completed_sections": []
+                }
             
             # Handle case where synthesizer might be called unexpectedly with no sections
             if not completed_sections:
@@ -265,6 +515,20 @@ class BlogGenerationNode:
                 # Return an empty draft and ensure the sections list is cleared in the state
                 return {"initial_draft": "", "completed_sections": []} 
             
+            revise_sections = state.get("revise_sections") or []
+            if revise_sections:
+                # Targeted revision: the last len(revise_sections) entries are the rewritten sections, in index order
+                sections_to_use = list(state.get("draft_sections") or [])
+                for index, content in zip(revise_sections, completed_sections[-len(revise_sections):]):
+                    sections_to_use[index] = content
+                logger.info(f"Synthesizing revised draft: rewrote sections {revise_sections}, reused {len(sections_to_use) - len(revise_sections)}")
+                return {
+                    "initial_draft": "\n\n---\n\n".join(sections_to_use),
+                    "draft_sections": sections_to_use,
+                    "revise_sections": [],
+                    "completed_sections": []
+                }
+
             # Determine the expected number of sections based on the current plan
             expected_section_count = len(state.get("sections", []))
 
@@ -297,6 +561,7 @@ class BlogGenerationNode:
             # for completed_sections to update the state, clearing the old sections.
             return {
                 "initial_draft": initial_draft,
+                "draft_sections": list(sections_to_use),
                 "completed_sections": []  # Explicitly clear the list in the returned state update
             }
     
@@ -325,7 +590,8 @@ class BlogGenerationNode:
                     collector_output = {
                         "feedback": comments,
                         "draft_approved": False,
-                        "final_report": ""
+                        "final_report": "",
+                        "revision_picks": feedback_data.get("sections") or []
                     }
                 logger.info(f"{'='*20}:feedback_collector output:{'='*20}\n{collector_output}") # Add this log
                 return collector_output
@@ -346,13 +612,24 @@ class BlogGenerationNode:
 
     @log_entry_exit # Conditional edge function to create llm_call workers
     def assign_workers(self, state: State):
-        """Assign a worker to each section in the plan."""
+        """
+        Assign a worker to each planned section that is not in the section cache, or hand them to
+        batch_sections; go straight to the synthesizer when every section is cached.
+        """
         logger.info(f"\n{'='*10} State before assigning workers {'='*10}")
         logger.info(f"  Current sections plan: {len(state.get('sections', []))} sections")
         # Log the completed_sections list specifically
         logger.info(f"  Completed Sections before dispatch: {state.get('completed_sections', [])}")
         logger.info(f"{'='*40}\n")
-        return [Send("llm_call", {"section": s}) for s in state["sections"]]
+        to_write = self._sections_to_write(state)
+        if not to_write:
+            logger.info("Every planned section is cached; skipping the workers")
+            return "synthesizer"
+        if self.section_mode(state) != self.FANOUT:
+            return "batch_sections"
+        sections = state["sections"]
+        cache_key = (lambda s: self._section_key(state, s)) if self.section_cache is not None else (lambda s: None)
+        return [Send("llm_call", {"section": sections[i], "cache_key": cache_key(sections[i])}) for i in to_write]
 
     @log_entry_exit# Conditional edge for feedback loop
     def route_feedback(self, state: State):
@@ -364,6 +641,88 @@ class BlogGenerationNode:
             logger.info("Draft approved; routing to file_generator")
             return "file_generator"
         else:
-            logger.info("Draft not approved; routing back to orchestrator for revision")
+            logger.info("Draft not approved; routing to revision")
+            return self.route_revision(state)
+
+    def _is_rejection(self, state: State) -> bool:
+        if not state.get("messages"):
+            return False
+        try:
+            feedback_data = json.loads(state["messages"][-1].content)
+        except (json.JSONDecodeError, TypeError):
+            return False
+        return isinstance(feedback_data, dict) and feedback_data.get("approved") is False
+
+    def route_revision(self, state: State) -> str:
+        """
+        Route rejection feedback to a targeted revision when the last draft can be revised section by
+        section (blog_targeted_revision), and everything else to a full replan by the orchestrator.
+        """
+        draft_sections = state.get("draft_sections") or []
+        if (self.targeted_revision and self._is_rejection(state) and draft_sections
+                and len(draft_sections) == len(state.get("sections") or [])):
+            return "plan_revision"
+        return "orchestrator"
+
+    def _picked_sections(self, state: State, names: List[str]) -> List[int]:
+        wanted = {name.strip().lower() for name in names}
+        return [i for i, s in enumerate(state["sections"]) if s.name.strip().lower() in wanted]
+
+    def _revision_scope_messages(self, state: State) -> list:
+        outline = "\n".join(
+            f"- {s.name}: {s.description}\n  Begins: {content[:200]!r}"
+            for s, content in zip(state["sections"], state["draft_sections"])
+        )
+        return [
+            SystemMessage(content=self.REVISION_SCOPE_SYSTEM_PROMPT),
+            HumanMessage(content=f"Sections of the draft:\n{outline}\n\nFeedback: {state.get('feedback', '')}")
+        ]
+
+    def _revision_result(self, state: State, scope: RevisionScope = None) -> dict:
+        if scope is None:
+            logger.info("No revision scope; replanning the whole draft")
+            return {"revise_sections": []}
+        if scope.replan:
+            logger.info("Feedback changes the plan; replanning the whole draft")
+            return {"revise_sections": []}
+        indices = self._picked_sections(state, scope.sections)
+        logger.info(f"Feedback concerns sections {[state['sections'][i].name for i in indices]}")
+        return {"revise_sections": indices}
+
+    @log_entry_exit
+    def plan_revision(self, state: State) -> dict:
+        """Pick the sections a rejection concerns: the reviewer's explicit picks, or a classifier call on the feedback."""
+        picks = self._picked_sections(state, state.get("revision_picks") or [])
+        if picks:
+            logger.info(f"Revising the sections picked by the reviewer: {picks}")
+            return {"revise_sections": picks, "revision_picks": []}
+        try:
+            return self._revision_result(state, self.revision_scoper.invoke(self._revision_scope_messages(state)))
+        except Exception as e:
+            logger.warning(f"Could not scope the revision, replanning the whole draft: {e}")
+            return self._revision_result(state)
+
+    @log_entry_exit
+    async def aplan_revision(self, state: State) -> dict:
+        """Async variant of plan_revision."""
+        picks = self._picked_sections(state, state.get("revision_picks") or [])
+        if picks:
+            logger.info(f"Revising the sections picked by the reviewer: {picks}")
+            return {"revise_sections": picks, "revision_picks": []}
+        try:
+            return self._revision_result(state, await self.revision_scoper.ainvoke(self._revision_scope_messages(state)))
+        except Exception as e:
+            logger.warning(f"Could not scope the revision, replanning the whole draft: {e}")
+            return self._revision_result(state)
+
+    def assign_revisions(self, state: State):
+        """Send each section picked by plan_revision to a worker with its current content, or replan if none was picked."""
+        revise_sections = state.get("revise_sections") or []
+        if not revise_sections:
             return "orchestrator"
+        feedback = state.get("feedback", "")
+        # No cache_key: a rewrite follows one reviewer's feedback, so it must not replace the shared plan-entry section
+        return [Send("llm_call", {"section": state["sections"][i], "previous_content": state["draft_sections"][i],
+                                  "feedback": feedback})
+                for i in revise_sections]
 
@@ -0,0 +1,165 @@
+# src/langgraphagenticai/nodes/blog_section_cache.py
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+
+def _normalize(text: Any) -> str:
+    """Case-, whitespace- and trailing-punctuation-insensitive form of a spec field."""
+    return re.sub(r"\s+", " ", str(text or "")).strip().rstrip(".!;:").lower()
+
+
+class SectionCache:
+    """
+    Memo cache of written blog sections, shared by every session of the process.
+
+    A section is keyed on its normalized plan entry (name and description) together with the
+    post's topic, tone and audience and the writing model, so the same plan entry planned again
+    on a revision, or by another user writing on the same topic, reuses the section instead of
+    sending it to a worker. Entries live in an in-memory LRU with a TTL and, when `db_path` is
+    set, in a SQLite table that keeps the `max_disk_entries` most recently used sections.
+
+    Args:
+        db_path (str): SQLite file of the persistent tier, or None for memory only.
+        max_entries (int): Sections kept in memory.
+        max_disk_entries (int): Sections kept on disk; the least recently used are evicted.
+        ttl (float): Seconds a section stays reusable.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: int = 256,
+                 max_disk_entries: int = 5000, ttl: float = 7 * 24 * 3600.0):
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.ttl = ttl
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._conn = None
+        if db_path:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS blog_section_cache "
+                "(key TEXT PRIMARY KEY, content TEXT NOT NULL, created_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS blog_section_cache_last_used ON blog_section_cache (last_used)")
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(name: str, description: str, topic: str, tone_style: str, target_audience: str, model: str = "") -> str:
+        """Cache key of a plan entry written for a post with the given topic, tone and audience."""
+        fields = (name, description, topic, tone_style, target_audience, model)
+        return hashlib.sha256("\x00".join(_normalize(f) for f in fields).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created_at, content = entry
+                if now - created_at <= self.ttl:
+                    self._memory.move_to_end(key)
+                    self.hits += 1
+                    return content
+                del self._memory[key]
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT content, created_at FROM blog_section_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] <= self.ttl:
+                    self._conn.execute("UPDATE blog_section_cache SET last_used = ? WHERE key = ?", (now, key))
+                    self._conn.commit()
+                    self._remember(key, row[0], row[1])
+                    self.hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, content: str) -> None:
+        if not content or not content.strip():
+            return
+        now = time.time()
+        with self._lock:
+            self._remember(key, content, now)
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO blog_section_cache (key, content, created_at, last_used) VALUES (?, ?, ?, ?)",
+                        (key, content, now, now),
+                    )
+                    self._evict_disk(now)
+                    self._conn.commit()
+                except Exception as e:
+                    logger.warning(f"Could not persist blog section to cache: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM blog_section_cache")
+                self._conn.commit()
+
+    def _remember(self, key: str, content: str, created_at: float) -> None:
+        self._memory[key] = (created_at, content)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self, now: float) -> None:
+        """Delete expired rows and the least recently used ones beyond max_disk_entries."""
+        deleted = self._conn.execute("DELETE FROM blog_section_cache WHERE created_at < ?", (now - self.ttl,)).rowcount
+        deleted += self._conn.execute(
+            "DELETE FROM blog_section_cache WHERE key IN (SELECT key FROM blog_section_cache "
+            "ORDER BY last_used DESC LIMIT -1 OFFSET ?)", (self.max_disk_entries,)
+        ).rowcount
+        self.evictions += max(deleted, 0)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return hit/miss/eviction counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "memory_entries": len(self._memory),
+            }
+
+
+_section_cache: Optional[SectionCache] = None
+_section_cache_lock = threading.Lock()
+
+
+def get_section_cache() -> Optional[SectionCache]:
+    """Return the process-wide blog section cache, or None when it is disabled in uiconfigfile.ini."""
+    global _section_cache
+    config = Config()
+    if not config.get_blog_section_cache():
+        return None
+    with _section_cache_lock:
+        if _section_cache is None:
+            db_path = config.get_blog_section_cache_path()
+            if db_path and not os.path.isabs(db_path):
+                db_path = str(Path(__file__).resolve().parents[3] / db_path)
+            _section_cache = SectionCache(
+                db_path=db_path or None,
+                max_entries=config.get_blog_section_cache_max_entries(),
+                max_disk_entries=config.get_blog_section_cache_max_disk_entries(),
+                ttl=config.get_blog_section_cache_ttl(),
+            )
+        return _section_cache
@@ -0,0 +1,168 @@
+# src/langgraphagenticai/nodes/chat_history_manager.py
+import json
+from typing import List, Optional, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
+
+from src.langgraphagenticai.LLMS.model_router import route_model
+from src.langgraphagenticai.LLMS.rate_limiter import estimate_tokens
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.state.state import State
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+
+def model_name_of(model) -> str:
+    """Name of the provider model behind the wrapper layers built by build_model_pipeline."""
+    while hasattr(model, "inner") or hasattr(model, "models"):
+        model = model.inner if hasattr(model, "inner") else model.models[0]
+    return getattr(model, "model_name", None) or getattr(model, "model", "") or ""
+
+
+class ChatHistoryManager:
+    """
+    Keeps the chat context sent to the LLM within a token budget.
+
+    The last `keep_turns` turns (a turn starts at a HumanMessage, so tool calls stay with their
+    results) are sent verbatim; fewer if they alone exceed `max_tokens`. Older turns are folded
+    into a running summary stored in the graph state as `summary`, with `summarized_count`
+    recording how many leading messages it covers.
+
+    Folding is done with hysteresis so that a long chat does not pay a summarizer round trip
+    before every reply: the verbatim history may grow to `keep_turns + fold_turns - 1` turns,
+    and only when it reaches `keep_turns + fold_turns` turns, or exceeds the token budget, are
+    all turns before the last `keep_turns` folded into the summary in one call.
+
+    Args:
+        summarizer: Chat model used to update the summary.
+        max_tokens (int): Estimated token budget for the history sent with each call.
+        keep_turns (int): Number of recent turns kept verbatim after a fold.
+        fold_turns (int): Turns allowed to accumulate past `keep_turns` before the next fold.
+    """
+
+    SUMMARY_SYSTEM_PROMPT = (
+        "You maintain a running summary of a conversation between a user and an AI assistant. "
+        "Update the current summary with the new messages. Keep facts, names, numbers, decisions, "
+        "user preferences and open questions; drop pleasantries. Reply with the updated summary only."
+    )
+
+    # Keep summary calls out of LangGraph's message stream so they are not rendered as chat replies.
+    SUMMARY_CALL_CONFIG = {"tags": ["nostream"]}
+
+    def __init__(self, summarizer, max_tokens: int = 6000, keep_turns: int = 6, fold_turns: int = 4):
+        self.summarizer = summarizer
+        self.max_tokens = max_tokens
+        self.keep_turns = keep_turns
+        self.fold_turns = max(1, fold_turns)
+
+    def _window_start(self, messages: List[BaseMessage], summary: str) -> int:
+        """Index of the first message sent verbatim."""
+        turn_starts = [i for i, message in enumerate(messages) if isinstance(message, HumanMessage)]
+        if not turn_starts:
+            return 0
+        candidates = turn_starts[-self.keep_turns:] if self.keep_turns > 0 else turn_starts[-1:]
+        summary_tokens = len(summary) // 4
+        for start in candidates:
+            if summary_tokens + estimate_tokens(messages[start:], 0) <= self.max_tokens:
+                return start
+        # Even the latest turn is over budget; it is still sent whole.
+        return candidates[-1]
+
+    def _plan(self, state: State) -> Tuple[List[BaseMessage], str, int, int]:
+        messages = list(state.get("messages") or [])
+        summary = state.get("summary") or ""
+        summarized = min(state.get("summarized_count") or 0, len(messages))
+        if not self._fold_due(messages, summary, summarized):
+            return messages, summary, summarized, summarized
+        window_start = max(self._window_start(messages, summary), summarized)
+        return messages, summary, summarized, window_start
+
+    def _fold_due(self, messages: List[BaseMessage], summary: str, summarized: int) -> bool:
+        """Whether the unsummarized history has grown enough turns, or tokens, to fold it now."""
+        turns = sum(1 for message in messages[summarized:] if isinstance(message, HumanMessage))
+        if turns >= max(self.keep_turns, 1) + self.fold_turns:
+            return True
+        return len(summary) // 4 + estimate_tokens(messages[summarized:], 0) > self.max_tokens
+
+    def _transcript(self, messages: List[BaseMessage]) -> str:
+        lines = []
+        for message in messages:
+            if isinstance(message, HumanMessage):
+                lines.append(f"User: {message.content}")
+            elif isinstance(message, ToolMessage):
+                lines.append(f"Tool result: {str(message.content)[:1000]}")
+            elif isinstance(message, AIMessage):
+                for call in message.tool_calls:
+                    lines.append(f"Assistant called {call['name']} with {json.dumps(call['args'])}")
+                if message.content:
+                    lines.append(f"Assistant: {message.content}")
+        return "\n".join(lines)
+
+    def _summary_messages(self, summary: str, new_messages: List[BaseMessage]) -> list:
+        return [
+            SystemMessage(content=self.SUMMARY_SYSTEM_PROMPT),
+            HumanMessage(content=f"Current summary:\n{summary or '(none)'}\n\nNew messages:\n{self._transcript(new_messages)}"),
+        ]
+
+    def _compose(self, messages: List[BaseMessage], summary: str, start: int,
+                 system_prompt: Optional[str]) -> List[BaseMessage]:
+        system_parts = [system_prompt] if system_prompt else []
+        if summary:
+            system_parts.append(f"Summary of the earlier conversation:\n{summary}")
+        prefix = [SystemMessage(content="\n\n".join(system_parts))] if system_parts else []
+        return prefix + messages[start:]
+
+    def prepare(self, state: State, system_prompt: Optional[str] = None) -> Tuple[List[BaseMessage], dict]:
+        """
+        Build the messages for the next LLM call.
+
+        Returns:
+            tuple: (messages, state_update) where `state_update` carries the new `summary` and
+            `summarized_count` when the window slid, and is empty otherwise.
+        """
+        messages, summary, summarized, window_start = self._plan(state)
+        if window_start <= summarized:
+            return self._compose(messages, summary, summarized, system_prompt), {}
+        try:
+            response = self.summarizer.invoke(self._summary_messages(summary, messages[summarized:window_start]),
+                                              config=self.SUMMARY_CALL_CONFIG)
+        except Exception as e:
+            logger.error(f"Error updating conversation summary; sending unsummarized history: {e}")
+            return self._compose(messages, summary, summarized, system_prompt), {}
+        return self._finish(messages, response, window_start, system_prompt)
+
+    async def aprepare(self, state: State, system_prompt: Optional[str] = None) -> Tuple[List[BaseMessage], dict]:
+        """Async variant of prepare."""
+        messages, summary, summarized, window_start = self._plan(state)
+        if window_start <= summarized:
+            return self._compose(messages, summary, summarized, system_prompt), {}
+        try:
+            response = await self.summarizer.ainvoke(self._summary_messages(summary, messages[summarized:window_start]),
+                                                     config=self.SUMMARY_CALL_CONFIG)
+        except Exception as e:
+            logger.error(f"Error updating conversation summary; sending unsummarized history: {e}")
+            return self._compose(messages, summary, summarized, system_prompt), {}
+        return self._finish(messages, response, window_start, system_prompt)
+
+    def _finish(self, messages: List[BaseMessage], response, window_start: int,
+                system_prompt: Optional[str]) -> Tuple[List[BaseMessage], dict]:
+        summary = response.content if hasattr(response, "content") else str(response)
+        logger.info(f"Folded conversation up to message {window_start} into the summary ({len(summary)} chars)")
+        update = {"summary": summary, "summarized_count": window_start}
+        return self._compose(messages, summary, window_start, system_prompt), update
+
+
+def build_history_manager(model, router=None) -> Optional[ChatHistoryManager]:
+    """
+    Create the history manager for a chat graph from uiconfigfile.ini, or None if it is disabled.
+    The token budget is looked up by the selected model's name; summaries use the "summary" call site.
+    """
+    config = Config()
+    if not config.get_chat_history_enabled():
+        return None
+    budgets = config.get_chat_history_token_budgets()
+    return ChatHistoryManager(
+        summarizer=route_model(model, router, "summary"),
+        max_tokens=budgets.get(model_name_of(model), budgets.get("default", 6000)),
+        keep_turns=config.get_chat_history_keep_turns(),
+        fold_turns=config.get_chat_history_fold_turns(),
+    )
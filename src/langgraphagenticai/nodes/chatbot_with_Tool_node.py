@@ -5,8 +5,14 @@ class ChatbotWithToolNode:
     """
     Chatbot logic enhanced with tool integration.
     """
-    def __init__(self,model):
+    def __init__(self, model, history=None):
+        """
+        Args:
+            model: Chat model answering the user.
+            history: Optional ChatHistoryManager bounding the context sent on each call.
+        """
         self.llm = model
+        self.history = history
 
     def process(self, state: State) -> dict:
         """
@@ -30,7 +36,24 @@ class ChatbotWithToolNode:
             """
             Chatbot logic for processing the input state and returning a response.
             """
-            return {"messages": [llm_with_tools.invoke(state["messages"])]}
+            if self.history is None:
+                return {"messages": [llm_with_tools.invoke(state["messages"])]}
+            messages, history_update = self.history.prepare(state)
+            return {"messages": [llm_with_tools.invoke(messages)], **history_update}
+
+        return chatbot_node
+
+    def create_async_chatbot(self, tools):
+        """
+        Returns an async chatbot node function for graphs run with astream.
+        """
+        llm_with_tools = self.llm.bind_tools(tools)
+
+        async def chatbot_node(state: State):
+            if self.history is None:
+                return {"messages": [await llm_with_tools.ainvoke(state["messages"])]}
+            messages, history_update = await self.history.aprepare(state)
+            return {"messages": [await llm_with_tools.ainvoke(messages)], **history_update}
 
         return chatbot_node
 
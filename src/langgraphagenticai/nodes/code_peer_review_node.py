@@ -27,28 +27,18 @@ class CodeReviewerNode:
             ("human", "Review this code:\n```python\n{code}\n```")
         ])
 
-    def review_code(self, state: State) -> dict:
-        """Review the provided code, provide feedback, and return a corrected version, integrating with chat history.
-
-        Args:
-            state (State): The current state containing 'messages' (list of messages) and optionally 'code_input' (str).
-
-        Returns:
-            dict: A dictionary with 'review_output' (feedback), 'corrected_code' (corrected version), and 'output' (combined).
-        """
+    def _code_to_review(self, state: State) -> str:
         # Safely get code input, with fallback to last message or empty string
-        code = state.get("code_input", state["messages"][-1].content if state.get("messages", []) else "")
-        
+        return state.get("code_input", state["messages"][-1].content if state.get("messages", []) else "")
+
+    def _build_review_result(self, state: State, code: str, review=None) -> dict:
+        """Split the LLM review into feedback and corrected code and record it in the chat history."""
         # Validate input
-        if not code.strip():
+        if review is None:
             feedback = "## No Code Provided\nPlease provide code to review."
             corrected_code = ""
             combined_output = feedback
         else:
-            # Generate review and corrected code with structured prompt
-            review = self.llm.invoke(
-                self.review_prompt.format_prompt(code=code).to_messages()
-            )
             review_content = review.content if hasattr(review, "content") else str(review)
             
             # Ensure markdown formatting for feedback
@@ -76,4 +66,28 @@ class CodeReviewerNode:
             "review_output": feedback,        # Feedback text
             "corrected_code": corrected_code, # Corrected code block
             "output": combined_output         # Combined for compatibility
-        }
\ No newline at end of file
+        }
+
+    def review_code(self, state: State) -> dict:
+        """Review the provided code, provide feedback, and return a corrected version, integrating with chat history.
+
+        Args:
+            state (State): The current state containing 'messages' (list of messages) and optionally 'code_input' (str).
+
+        Returns:
+            dict: A dictionary with 'review_output' (feedback), 'corrected_code' (corrected version), and 'output' (combined).
+        """
+        code = self._code_to_review(state)
+        if not code.strip():
+            return self._build_review_result(state, code)
+        # Generate review and corrected code with structured prompt
+        review = self.llm.invoke(self.review_prompt.format_prompt(code=code).to_messages())
+        return self._build_review_result(state, code, review)
+
+    async def areview_code(self, state: State) -> dict:
+        """Async variant of review_code."""
+        code = self._code_to_review(state)
+        if not code.strip():
+            return self._build_review_result(state, code)
+        review = await self.llm.ainvoke(self.review_prompt.format_prompt(code=code).to_messages())
+        return self._build_review_result(state, code, review)
@@ -6,18 +6,43 @@ import json
 from datetime import datetime
 from typing import List
 from src.langgraphagenticai.logging.logging_utils import logger, log_entry_exit
+from src.langgraphagenticai.LLMS.model_router import route_model
+from src.langgraphagenticai.LLMS.runtime_llm import RuntimeChatModel
+from src.langgraphagenticai.nodes.sdlc_speculation import get_speculation_manager
+from langgraph.config import get_config
+import asyncio
 from src.langgraphagenticai.prompt_library import prompt 
-from typing import Dict, Any
-from tenacity import retry, stop_after_attempt, wait_exponential
+from src.langgraphagenticai.ui.uiconfigfile import Config
+from typing import Dict, Any, Optional
+import string
 import functools
 import time
 import re
 
 
+class _InputTags(string.Formatter):
+    """Formats a prompt template with every placeholder replaced by a <tag> naming the input it refers to."""
+
+    # Placeholder spellings used across prompt_library for the same input
+    ALIASES = {"feedback_input": "feedback", "user_feedback": "feedback", "Feedback": "feedback"}
+
+    def canonical(self, name: str) -> str:
+        return self.ALIASES.get(name, name)
+
+    def get_field(self, field_name, args, kwargs):
+        return f"<{self.canonical(field_name)}>", field_name
+
+
 class SdlcNode:
-    def __init__(self, model):
-        """Initialize the SdlcNode with an LLM."""
+    def __init__(self, model, router=None):
+        """
+        Initialize the SdlcNode with an LLM.
+        An optional ModelRouter picks the model per stage; call sites are the STAGE_SPECS keys.
+        """
         self.llm = model
+        self.router = router
+        self.cache_friendly = Config().get_sdlc_cache_friendly_prompts()
+        self.speculation = get_speculation_manager()
 
     @log_entry_exit
     def user_input(self, state: State) -> dict:
@@ -39,437 +64,347 @@ class SdlcNode:
         
         return {"user_input": "captured"}
 
-    @log_entry_exit
-    def generate_requirements(self, state: State) -> dict:
-        """Generate requirements based on user input."""
-        logger.info(f"Generating requirements with state: {state}")
+    # Output field, input field it is derived from, message stored when that input is missing,
+    # and the label used in log and error messages, per generation stage.
+    STAGE_SPECS = {
+        "generate_requirements": ("generated_requirements", None, None, "requirements"),
+        "generate_user_stories": ("user_stories", "generated_requirements", "No requirements generated yet.", "user stories"),
+        "design_documents": ("design_documents", "user_stories", "No user stories provided for design document generation.", "design documents"),
+        "development_artifact": ("development_artifact", "design_documents", "No design documents generated yet.", "development artifacts"),
+        "testing_artifact": ("testing_artifact", "development_artifact", "No development artifacts generated yet.", "testing artifacts"),
+        "deployment_artifact": ("deployment_artifact", "testing_artifact", "No testing artifacts generated yet.", "deployment artifacts"),
+    }
+
+    # Stage the graph runs next when the user accepts a reviewed stage unchanged (see sdlc_speculation.py).
+    NEXT_REVIEWED_STAGE = {
+        "generate_user_stories": "design_documents",
+        "design_documents": "development_artifact",
+        "development_artifact": "testing_artifact",
+        "testing_artifact": "deployment_artifact",
+    }
+
+    @staticmethod
+    def _escape(value) -> str:
+        """Escape braces in a value that is substituted into a prompt template."""
+        return str(value).replace('{', '{{').replace('}', '}}')
+
+    def _prepare_stage(self, stage: str, state: State):
+        """
+        Build the LLM messages for a generation stage.
+
+        Returns:
+            tuple: (messages, None) when the stage is ready to call the LLM, or (None, result) when
+            it cannot run, where `result` is the state update to return from the node.
+        """
+        output_field, input_field, missing_message, label = self.STAGE_SPECS[stage]
+        if input_field and not str(getattr(state, input_field) or "").strip():
+            setattr(state, output_field, missing_message)
+            logger.warning(f"Cannot generate {label} without {input_field.replace('_', ' ')}.")
+            return None, {output_field: missing_message}
+
         try:
-            requirements_input = {
-                "project_name": state.project_name if state.project_name is not None else "No project name provided",
-                "project_description": state.project_description if state.project_description is not None else "No project description provided",
-                "project_goals": state.project_goals if state.project_goals is not None else "No project goals provided",
-                "project_scope": state.project_scope if state.project_scope is not None else "No project scope provided",
-                "project_objectives": state.project_objectives if state.project_objectives is not None else "No project objectives provided",
-            }
-            requirements_input_json = json.dumps(requirements_input, indent=2)
-
-            prompt_string = prompt.REQUIREMENTS_PROMPT_STRING.format(requirements_input=requirements_input_json)
-            # Assuming REQUIREMENTS_sys_prompt does not need .format() or is formatted elsewhere if needed
-            sys_prompt_content = prompt.REQUIREMENTS_sys_prompt 
-            
-            messages = [
-                SystemMessage(content=sys_prompt_content),
-                HumanMessage(content=prompt_string)
-            ]
-           
-            response = self.llm.invoke(messages)
-            state.generated_requirements = response.content if hasattr(response, 'content') else str(response)  
-            return {"generated_requirements": state.generated_requirements}
+            return getattr(self, f"_{stage}_messages")(state), None
+        except KeyError as ke:
+            error_msg = f"KeyError during {label} prompt formatting: {str(ke)}. Review prompt placeholders."
+            logger.error(error_msg)
+            setattr(state, output_field, error_msg)
+            return None, {output_field: error_msg}
+
+    def _finish_stage(self, stage: str, state: State, response=None, error: Exception = None) -> dict:
+        """Store the LLM response (or the error) for a generation stage and return the state update."""
+        output_field, _, _, label = self.STAGE_SPECS[stage]
+        if error is not None:
+            logger.error(f"Error generating {label}: {error}")
+            value = f"Error generating {label}: {str(error)}"
+        else:
+            value = response.content if hasattr(response, 'content') else str(response)
+            usage = getattr(response, "usage_metadata", None) or {}
+            cached = (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+            logger.info(f"{label.capitalize()} generated successfully "
+                        f"({cached}/{usage.get('input_tokens', 0)} input tokens from the provider's prompt cache).")
+        setattr(state, output_field, value)
+
+        if stage == "generate_user_stories" and error is None:
+            st.session_state["user_stories"] = value # Update session state
+            logger.info(f"--- RAW state.user_stories after generation ---")
+            logger.info(value)
+            logger.info(f"--- END RAW state.user_stories ---")
+        return {output_field: value}
+
+    def _take_speculation(self, stage: str, messages: list):
+        """The speculative response future for this stage and prompt, if one was started."""
+        if self.speculation is None:
+            return None
+        thread_id = get_config().get("configurable", {}).get("thread_id")
+        return self.speculation.take(str(thread_id), stage, messages) if thread_id is not None else None
+
+    def _speculate_next(self, stage: str, state: State) -> None:
+        """
+        Start generating the stage that follows `stage` if the user accepts its artifact as is,
+        while the graph waits for their review.
+        """
+        next_stage = self.NEXT_REVIEWED_STAGE.get(stage)
+        if self.speculation is None or next_stage is None:
+            return
+        config = get_config()
+        thread_id = config.get("configurable", {}).get("thread_id")
+        if thread_id is None:
+            return
+        try:
+            messages, result = self._prepare_stage(next_stage, state.model_copy(deep=True))
+            if result is not None:
+                return
+            model = route_model(self.llm, self.router, next_stage)
+            if isinstance(model, RuntimeChatModel):
+                # The background call runs outside this graph run, so pin the session's model now
+                model = model.resolve()
+            metadata = {key: value for key, value in (config.get("metadata") or {}).items()
+                        if key in ("session_id", "usecase", "thread_id")}
+            self.speculation.start(str(thread_id), state.session_id, next_stage, messages, model,
+                                   {**metadata, "langgraph_node": f"speculative:{next_stage}"})
         except Exception as e:
-            logger.error(f"Error generating requirements: {e}")
-            state.generated_requirements = f"Error generating requirements: {str(e)}"
-            return {"generated_requirements": state.generated_requirements}
+            logger.warning(f"Could not start speculative {next_stage}: {e}")
 
-    @log_entry_exit
-    def generate_user_stories(self, state: State) -> dict:
-        """Generate user stories based on the requirements."""
-        logger.info("Generating user stories")
-        if not state.generated_requirements:
-            state.user_stories = "No requirements generated yet."
-            logger.warning("Cannot generate user stories without requirements.")
-            return {"user_stories": state.user_stories}
+    def _run_stage(self, stage: str, state: State) -> dict:
+        messages, result = self._prepare_stage(stage, state)
+        if result is not None:
+            return result
+        speculative = self._take_speculation(stage, messages)
+        try:
+            response = None
+            if speculative is not None:
+                try:
+                    response = speculative.result()
+                except Exception as e:
+                    logger.warning(f"Speculative {stage} failed, generating it again: {e}")
+            if response is None:
+                response = route_model(self.llm, self.router, stage).invoke(messages)
+        except Exception as e:
+            return self._finish_stage(stage, state, error=e)
+        update = self._finish_stage(stage, state, response)
+        self._speculate_next(stage, state)
+        return update
+
+    async def _arun_stage(self, stage: str, state: State) -> dict:
+        messages, result = self._prepare_stage(stage, state)
+        if result is not None:
+            return result
+        speculative = self._take_speculation(stage, messages)
+        try:
+            response = None
+            if speculative is not None:
+                try:
+                    response = await asyncio.wrap_future(speculative)
+                except Exception as e:
+                    logger.warning(f"Speculative {stage} failed, generating it again: {e}")
+            if response is None:
+                response = await route_model(self.llm, self.router, stage).ainvoke(messages)
+        except Exception as e:
+            return self._finish_stage(stage, state, error=e)
+        update = self._finish_stage(stage, state, response)
+        self._speculate_next(stage, state)
+        return update
 
-        formatted_requirements = str(state.generated_requirements).replace('{', '{{').replace('}', '}}')
+    def _stage_messages(self, system_template: str, user_template: str,
+                        system_args: Optional[Dict[str, Any]], user_args: Dict[str, Any]) -> list:
+        """
+        Build the system and human messages of a stage from prompt_library templates.
+
+        By default the inputs are substituted into the templates. In cache-friendly mode the
+        templates are formatted with tag references only, so the long system prompt and the stage
+        instructions form a prefix that is identical on every call, and the inputs follow in a
+        final message as tagged blocks; providers that cache prompt prefixes then only bill the
+        inputs at full price on regenerations. `system_args=None` uses the system prompt as is.
+        """
+        if not self.cache_friendly:
+            system = system_template.format(**{k: self._escape(v) for k, v in system_args.items()}) \
+                if system_args is not None else system_template
+            return [SystemMessage(content=system),
+                    HumanMessage(content=user_template.format(**{k: self._escape(v) for k, v in user_args.items()}))]
+
+        tags = _InputTags()
+        system = tags.format(system_template) if system_args is not None else system_template
+        inputs = {}
+        for name, value in {**(system_args or {}), **user_args}.items():
+            inputs.setdefault(tags.canonical(name), value)
+        blocks = "\n\n".join(f"<{name}>\n{value}\n</{name}>" for name, value in inputs.items())
+        return [
+            SystemMessage(content=system),
+            HumanMessage(content=tags.format(user_template)),
+            HumanMessage(content=f"Inputs referenced above:\n\n{blocks}"),
+        ]
+
+    def _generate_requirements_messages(self, state: State) -> list:
+        logger.info(f"Generating requirements with state: {state}")
+        requirements_input = {
+            "project_name": state.project_name if state.project_name is not None else "No project name provided",
+            "project_description": state.project_description if state.project_description is not None else "No project description provided",
+            "project_goals": state.project_goals if state.project_goals is not None else "No project goals provided",
+            "project_scope": state.project_scope if state.project_scope is not None else "No project scope provided",
+            "project_objectives": state.project_objectives if state.project_objectives is not None else "No project objectives provided",
+        }
+        requirements_input_json = json.dumps(requirements_input, indent=2)
+
+        # REQUIREMENTS_sys_prompt is used as is, without .format()
+        return self._stage_messages(prompt.REQUIREMENTS_sys_prompt, prompt.REQUIREMENTS_PROMPT_STRING,
+                                    None, {"requirements_input": requirements_input_json})
+
+    def _generate_user_stories_messages(self, state: State) -> list:
+        logger.info("Generating user stories")
+        project_name = state.project_name or 'N/A'
 
         feedback = state.get_last_feedback_for_stage(SDLCStages.PLANNING)
         logger.info(f"Feedback for user stories: {feedback}")
+        if feedback:
+            return self._stage_messages(
+                prompt.USER_STORIES_FEEDBACK_SYS_PROMPT, prompt.USER_STORIES_FEEDBACK_PROMPT_STRING,
+                {"generated_requirements": state.generated_requirements, "project_name": project_name, "feedback": feedback},
+                {"generated_requirements": state.generated_requirements, "feedback": feedback},
+            )
+        return self._stage_messages(
+            prompt.USER_STORIES_NO_FEEDBACK_SYS_PROMPT, prompt.USER_STORIES_NO_FEEDBACK_PROMPT_STRING,
+            {"generated_requirements": state.generated_requirements, "project_name": project_name},
+            {"generated_requirements": state.generated_requirements, "project_name": project_name},
+        )
+
+    def _design_documents_messages(self, state: State) -> list:
+        state.feedback_decision = None
+        logger.info("Generating design documents")
+        user_stories = str(state.user_stories)
+        project_name = state.project_name or 'N/A'
 
-        project_name_val = state.project_name or 'N/A'
-        project_name_formatted = str(project_name_val).replace('{', '{{').replace('}', '}}')
-
+        logger.info(f"--- User Stories for TDD Prompt ---")
+        logger.info(user_stories[:1000] + "..." if len(user_stories) > 1000 else user_stories) # Log a snippet
+        logger.info(f"--- END User Stories for TDD Prompt ---")
 
+        feedback = state.get_last_feedback_for_stage(SDLCStages.DESIGN)
+        logger.info(f"Feedback for design documents: {feedback or 'None'}")
         if feedback:
-            formatted_feedback = str(feedback).replace('{', '{{').replace('}', '}}')
-            try:
-                prompt_string = prompt.USER_STORIES_FEEDBACK_PROMPT_STRING.format(
-                                    generated_requirements=formatted_requirements,
-                                    feedback=formatted_feedback
-                )
-                sys_prompt_content = prompt.USER_STORIES_FEEDBACK_SYS_PROMPT.format(
-                                    generated_requirements=formatted_requirements,
-                                    project_name=project_name_formatted,
-                                    feedback=formatted_feedback
-                                )
-            except KeyError as e:
-                logger.error(f"KeyError during formatting USER_STORIES_FEEDBACK prompts: {e}")
-                logger.error(f"Available keys: generated_requirements, project_name, feedback")
-                state.user_stories = f"Error formatting user story prompt: {e}"
-                return {"user_stories": state.user_stories}
-        else:
-            try:
-                prompt_string = prompt.USER_STORIES_NO_FEEDBACK_PROMPT_STRING.format(
-                                    generated_requirements=formatted_requirements,
-                                    project_name=project_name_formatted
-                                )
-                sys_prompt_content = prompt.USER_STORIES_NO_FEEDBACK_SYS_PROMPT.format(
-                                    generated_requirements=formatted_requirements,
-                                    project_name=project_name_formatted
-                                )
-            except KeyError as e:
-                logger.error(f"KeyError during formatting USER_STORIES_NO_FEEDBACK prompts: {e}")
-                logger.error(f"Available keys: generated_requirements, project_name")
-                state.user_stories = f"Error formatting user story prompt: {e}"
-                return {"user_stories": state.user_stories}
-        
-        try:
-            messages = [
-                SystemMessage(content=sys_prompt_content),
-                HumanMessage(content=prompt_string)
-            ]
-            response = self.llm.invoke(messages)
-            state.user_stories = response.content if hasattr(response, 'content') else str(response)
-            st.session_state["user_stories"] = state.user_stories # Update session state
-            logger.info(f"--- RAW state.user_stories after generation ---")
-            logger.info(state.user_stories)
-            logger.info(f"--- END RAW state.user_stories ---")
+            logger.info(f"Feedback for design documents: {str(feedback)[:200]}...")
+            return self._stage_messages(
+                prompt.DESIGN_DOCUMENTS_FEEDBACK_SYS_PROMPT, prompt.DESIGN_DOCUMENTS_FEEDBACK_PROMPT_STRING,
+                {"user_stories": user_stories, "feedback": feedback, "project_name": project_name},
+                {"user_stories": user_stories, "user_feedback": feedback, "project_name": project_name},
+            )
+        return self._stage_messages(
+            prompt.DESIGN_DOCUMENTS_NO_FEEDBACK_SYS_PROMPT, prompt.DESIGN_DOCUMENTS_NO_FEEDBACK_PROMPT_STRING,
+            {"user_stories": user_stories, "project_name": project_name},
+            {"user_stories": user_stories, "project_name": project_name},
+        )
+
+    def _development_artifact_messages(self, state: State) -> list:
+        logger.info("Generating development artifacts")
+        project_name = state.project_name or 'N/A'
 
-            return {"user_stories": state.user_stories}
-        except Exception as e:
-            logger.error(f"Error generating user stories: {e}")
-            state.user_stories = f"Error generating user stories: {str(e)}"
-            return {"user_stories": state.user_stories}
+        if feedback := state.get_last_feedback_for_stage(SDLCStages.DEVELOPMENT):
+            logger.info(f"Feedback for development artifacts: {str(feedback)[:200]}...")  # Log a snippet
+            return self._stage_messages(
+                prompt.DEVELOPMENT_ARTIFACT_FEEDBACK_SYS_PROMPT, prompt.DEVELOPMENT_ARTIFACT_FEEDBACK_PROMPT_STRING,
+                {"design_documents": state.design_documents, "project_name": project_name, "feedback": feedback},
+                {"design_documents": state.design_documents, "feedback": feedback},
+            )
+        return self._stage_messages(
+            prompt.DEVELOPMENT_ARTIFACT_NO_FEEDBACK_SYS_PROMPT, prompt.DEVELOPMENT_ARTIFACT_NO_FEEDBACK_PROMPT_STRING,
+            {"project_name": project_name},
+            {"design_documents": state.design_documents, "project_name": project_name},
+        )
+
+    def _testing_artifact_messages(self, state: State) -> list:
+        logger.info("Generating testing artifacts")
+        project_name = state.project_name or 'N/A'
+
+        if feedback := state.get_last_feedback_for_stage(SDLCStages.TESTING):
+            logger.info(f"Feedback for testing artifacts: {str(feedback)[:200]}...")  # Log a snippet
+            return self._stage_messages(
+                prompt.TESTING_ARTIFACT_FEEDBACK_SYS_PROMPT, prompt.TESTING_ARTIFACT_FEEDBACK_PROMPT_STRING,
+                {"project_name": project_name, "feedback": feedback},
+                {"user_stories": state.user_stories, "development_artifact": state.development_artifact,
+                 "testing_artifact": state.testing_artifact, "feedback": feedback},
+            )
+        return self._stage_messages(
+            prompt.TESTING_ARTIFACT_NO_FEEDBACK_SYS_PROMPT, prompt.TESTING_ARTIFACT_NO_FEEDBACK_PROMPT_STRING,
+            {"project_name": project_name},
+            {"user_stories": state.user_stories, "development_artifact": state.development_artifact},
+        )
+
+    def _deployment_artifact_messages(self, state: State) -> list:
+        logger.info("Generating deployment artifacts")
+        project_name = state.project_name or 'N/A'
+
+        if feedback := state.get_last_feedback_for_stage(SDLCStages.DEPLOYMENT):
+            logger.info(f"Feedback for deployment artifacts: {str(feedback)[:200]}...")  # Log a snippet
+            return self._stage_messages(
+                prompt.DEPLOYMENT_ARTIFACT_FEEDBACK_SYS_PROMPT, prompt.DEPLOYMENT_ARTIFACT_FEEDBACK_PROMPT_STRING,
+                {"project_name": project_name, "feedback": feedback},
+                {"testing_artifact": state.testing_artifact, "deployment_artifact": state.deployment_artifact,
+                 "feedback": feedback},
+            )
+        return self._stage_messages(
+            prompt.DEPLOYMENT_ARTIFACT_NO_FEEDBACK_SYS_PROMPT, prompt.DEPLOYMENT_ARTIFACT_NO_FEEDBACK_PROMPT_STRING,
+            {"project_name": project_name},
+            {"testing_artifact": state.testing_artifact},
+        )
 
     @log_entry_exit
-    def design_documents(self, state: State) -> dict[str, str]:
-        """Generate design documents based on user stories with robust validation."""
-        state.feedback_decision = None
-        logger.info("Generating design documents")
+    def generate_requirements(self, state: State) -> dict:
+        """Generate requirements based on user input."""
+        return self._run_stage("generate_requirements", state)
 
-        if not state.user_stories or not str(state.user_stories).strip():
-            state.design_documents = "No user stories provided for design document generation."
-            logger.warning("Cannot generate design documents without user stories.")
-            return {"design_documents": state.design_documents}
+    @log_entry_exit
+    async def agenerate_requirements(self, state: State) -> dict:
+        """Async variant of generate_requirements."""
+        return await self._arun_stage("generate_requirements", state)
 
-        
-        user_stories_for_prompt = str(state.user_stories).replace('{', '{{').replace('}', '}}')
-        
-        project_name_val = state.project_name or 'N/A'
-        project_name_for_prompt = str(project_name_val).replace('{', '{{').replace('}', '}}')
+    @log_entry_exit
+    def generate_user_stories(self, state: State) -> dict:
+        """Generate user stories based on the requirements."""
+        return self._run_stage("generate_user_stories", state)
 
-        logger.info(f"--- User Stories for TDD Prompt (escaped) ---")
-        logger.info(user_stories_for_prompt[:1000] + "..." if len(user_stories_for_prompt) > 1000 else user_stories_for_prompt) # Log a snippet
-        logger.info(f"--- END User Stories for TDD Prompt ---")
+    @log_entry_exit
+    async def agenerate_user_stories(self, state: State) -> dict:
+        """Async variant of generate_user_stories."""
+        return await self._arun_stage("generate_user_stories", state)
 
+    @log_entry_exit
+    def design_documents(self, state: State) -> dict[str, str]:
+        """Generate design documents based on user stories."""
+        return self._run_stage("design_documents", state)
 
-       
-        feedback = state.get_last_feedback_for_stage(SDLCStages.DESIGN)
-        logger.info(f"Feedback for design documents: {feedback or 'None'}")
-        if feedback:
-            formatted_feedback = str(feedback).replace('{', '{{').replace('}', '}}')
-            logger.info(f"Formatted feedback for design documents: {formatted_feedback[:200]}...")
-            try:
-                prompt_string_content = prompt.DESIGN_DOCUMENTS_FEEDBACK_PROMPT_STRING.format(
-                    user_stories=user_stories_for_prompt,
-                    user_feedback=formatted_feedback,
-                    project_name=project_name_for_prompt
-                )
-                sys_prompt_content = prompt.DESIGN_DOCUMENTS_FEEDBACK_SYS_PROMPT.format(
-                    user_stories=user_stories_for_prompt,
-                    feedback=formatted_feedback,
-                    project_name=project_name_for_prompt
-                )
-                messages = [
-                    SystemMessage(content=sys_prompt_content),
-                    HumanMessage(content=prompt_string_content)
-                ]
-                response = self.llm.invoke(messages)
-                state.design_documents = response.content if hasattr(response, 'content') else str(response)
-                logger.info("Design documents generated successfully with feedback.")
-                return {"design_documents": state.design_documents}
-            except KeyError as ke:
-                error_msg = f"KeyError during TDD prompt formatting with feedback: {str(ke)}. This means a placeholder in your DESIGN_DOCUMENTS_FEEDBACK prompts was not found in the .format() call."
-                logger.error(error_msg)
-                logger.error(f"User stories (snippet): {user_stories_for_prompt[:200]}")
-                logger.error(f"Project name: {project_name_for_prompt}")
-                state.design_documents = error_msg
-                return {"design_documents": state.design_documents}
-            except Exception as e:
-                error_msg = f"Error generating design documents with feedback: {type(e).__name__} - {str(e)}"
-                state.design_documents = error_msg
-                logger.error(f"{error_msg}, Input User Stories (snippet): {user_stories_for_prompt[:200]}...")
-                return {"design_documents": state.design_documents}
-         
+    @log_entry_exit
+    async def adesign_documents(self, state: State) -> dict[str, str]:
+        """Async variant of design_documents."""
+        return await self._arun_stage("design_documents", state)
 
-        else:
-            try:
-                            
-                sys_prompt_content = prompt.DESIGN_DOCUMENTS_NO_FEEDBACK_SYS_PROMPT.format(
-                    user_stories=user_stories_for_prompt,
-                    project_name=project_name_for_prompt
-                )
-                prompt_string_content = prompt.DESIGN_DOCUMENTS_NO_FEEDBACK_PROMPT_STRING.format(
-                    user_stories=user_stories_for_prompt,
-                    project_name=project_name_for_prompt # Assuming this is also needed here
-                )
-                
-                logger.debug(f"--- Formatted System Prompt for TDD (first 500 chars) ---")
-                logger.debug(sys_prompt_content[:500] + "...")
-                logger.debug(f"--- Formatted Human Prompt for TDD (first 500 chars) ---")
-                logger.debug(prompt_string_content[:500] + "...")
-
-                messages = [
-                    SystemMessage(content=sys_prompt_content),
-                    HumanMessage(content=prompt_string_content)
-                ]
-            
-                response = self.llm.invoke(messages)
-                state.design_documents = response.content if hasattr(response, 'content') else str(response)
-                logger.info("Design documents generated successfully.")
-                return {"design_documents": state.design_documents}
-
-            except KeyError as ke:
-                error_msg = f"KeyError during TDD prompt formatting: {str(ke)}. This means a placeholder in your DESIGN_DOCUMENTS_... prompts was not found in the .format() call."
-                logger.error(error_msg)
-                logger.error(f"User stories (snippet): {user_stories_for_prompt[:200]}")
-                logger.error(f"Project name: {project_name_for_prompt}")
-                state.design_documents = error_msg
-                return {"design_documents": state.design_documents}
-            except Exception as e:
-                error_msg = f"Error generating design documents: {type(e).__name__} - {str(e)}"
-                state.design_documents = error_msg
-                logger.error(f"{error_msg}, Input User Stories (snippet): {user_stories_for_prompt[:200]}...")
-                return {"design_documents": state.design_documents}
-      
     @log_entry_exit
     def development_artifact(self, state: State) -> dict:
         """Generate development artifacts based on design documents."""
-        logger.info("Generating development artifacts")
-        if not state.design_documents:
-            state.development_artifact = "No design documents generated yet."
-            logger.warning("Cannot generate development artifacts without design documents.")
-            return {"development_artifact": state.development_artifact}
-        
-        # Escape design_documents and project_name for .format()
-        design_documents_for_prompt = str(state.design_documents).replace('{', '{{').replace('}', '}}')
-        project_name_val = state.project_name or 'N/A'
-        project_name_for_prompt = str(project_name_val).replace('{', '{{').replace('}', '}}')
+        return self._run_stage("development_artifact", state)
+
+    @log_entry_exit
+    async def adevelopment_artifact(self, state: State) -> dict:
+        """Async variant of development_artifact."""
+        return await self._arun_stage("development_artifact", state)
 
-        if feedback := state.get_last_feedback_for_stage(SDLCStages.DEVELOPMENT):
-            feedback_for_prompt = str(feedback).replace('{', '{{').replace('}', '}}')
-            logger.info(f"Feedback for development artifacts: {feedback_for_prompt[:200]}...")  # Log a snippet
-            try:
-                prompt_string = prompt.DEVELOPMENT_ARTIFACT_FEEDBACK_PROMPT_STRING.format(
-                    design_documents=design_documents_for_prompt,
-                    feedback=feedback_for_prompt
-                )
-                sys_prompt_content = prompt.DEVELOPMENT_ARTIFACT_FEEDBACK_SYS_PROMPT.format(
-                    design_documents=design_documents_for_prompt,
-                    project_name=project_name_for_prompt,
-                    feedback=feedback_for_prompt
-                )
-                messages = [
-                    SystemMessage(content=sys_prompt_content),
-                    HumanMessage(content=prompt_string)
-                ]
-                response = self.llm.invoke(messages)
-                state.development_artifact = response.content if hasattr(response, 'content') else str(response)
-                return {"development_artifact": state.development_artifact}
-            except KeyError as ke:
-                error_msg = f"KeyError during DEVELOPMENT_ARTIFACT_FEEDBACK prompt formatting: {str(ke)}."
-                logger.error(error_msg)
-                logger.error(f"Design documents (snippet): {design_documents_for_prompt[:200]}")
-        else: 
-
-            try:
-                prompt_string = prompt.DEVELOPMENT_ARTIFACT_NO_FEEDBACK_PROMPT_STRING.format(
-                    design_documents=design_documents_for_prompt,
-                    project_name=project_name_for_prompt
-                    
-                )
-                sys_prompt_content = prompt.DEVELOPMENT_ARTIFACT_NO_FEEDBACK_SYS_PROMPT.format(
-                    project_name=project_name_for_prompt
-                )
-                messages = [
-                    SystemMessage(content=sys_prompt_content),
-                    HumanMessage(content=prompt_string)
-                ]
-                response = self.llm.invoke(messages)
-                state.development_artifact = response.content if hasattr(response, 'content') else str(response)
-                return {"development_artifact": state.development_artifact}
-            except KeyError as ke:
-                error_msg = f"KeyError during DEVELOPMENT_ARTIFACT prompt formatting: {str(ke)}."
-                logger.error(error_msg)
-                state.development_artifact = error_msg
-                return {"development_artifact": state.development_artifact}
-            except Exception as e:
-                logger.error(f"Error generating development artifacts: {e}")
-                state.development_artifact = f"Error generating development artifacts: {str(e)}"
-                return {"development_artifact": state.development_artifact}
-    
     @log_entry_exit
     def testing_artifact(self, state: State) -> dict:
         """Generate testing artifacts based on development artifacts."""
-        logger.info("Generating testing artifacts")
-        if not state.development_artifact:
-            state.testing_artifact = "No development artifacts generated yet."
-            logger.warning("Cannot generate testing artifacts without development artifacts.")
-            return {"testing_artifact": state.testing_artifact}
+        return self._run_stage("testing_artifact", state)
 
-        # Escape inputs for .format()
-        user_stories_for_prompt = str(state.user_stories).replace('{', '{{').replace('}', '}}')
-        development_artifact_for_prompt = str(state.development_artifact).replace('{', '{{').replace('}', '}}')
-        project_name_val = state.project_name or 'N/A'
-        project_name_for_prompt = str(project_name_val).replace('{', '{{').replace('}', '}}')
+    @log_entry_exit
+    async def atesting_artifact(self, state: State) -> dict:
+        """Async variant of testing_artifact."""
+        return await self._arun_stage("testing_artifact", state)
 
-        if feedback := state.get_last_feedback_for_stage(SDLCStages.TESTING):
-            feedback_for_prompt = str(feedback).replace('{', '{{').replace('}', '}}')
-            logger.info(f"Feedback for testing artifacts: {feedback_for_prompt[:200]}...")  # Log a snippet
-            try:
-                prompt_string = prompt.TESTING_ARTIFACT_FEEDBACK_PROMPT_STRING.format(
-                    user_stories=user_stories_for_prompt,
-                    development_artifact=development_artifact_for_prompt,
-                    feedback=feedback_for_prompt
-                )
-                sys_prompt_content = prompt.TESTING_ARTIFACT_FEEDBACK_SYS_PROMPT.format(
-                    project_name=project_name_for_prompt,
-                    feedback=feedback_for_prompt
-                )
-                messages = [
-                    SystemMessage(content=sys_prompt_content),
-                    HumanMessage(content=prompt_string)
-                ]
-                response = self.llm.invoke(messages)
-                state.testing_artifact = response.content if hasattr(response, 'content') else str(response)
-                return {"testing_artifact": state.testing_artifact}
-            except KeyError as ke:
-                error_msg = f"KeyError during TESTING_ARTIFACT_FEEDBACK prompt formatting: {str(ke)}."
-                logger.error(error_msg)
-                logger.error(f"User stories (snippet): {user_stories_for_prompt[:200]}")
-                logger.error(f"Development artifact (snippet): {development_artifact_for_prompt[:200]}")
-                state.testing_artifact = error_msg
-                return {"testing_artifact": state.testing_artifact}
-            except Exception as e:
-                error_msg = f"Error generating testing artifacts with feedback: {type(e).__name__} - {str(e)}"
-                state.testing_artifact = error_msg
-                logger.error(f"{error_msg}, Input User Stories (snippet): {user_stories_for_prompt[:200]}...")
-                return {"testing_artifact": state.testing_artifact}
-         
-         # No feedback case
-        else:
-            
-            try:
-                prompt_string = prompt.TESTING_ARTIFACT_NO_FEEDBACK_PROMPT_STRING.format(
-                    user_stories=user_stories_for_prompt,
-                    development_artifact=development_artifact_for_prompt
-                )
-                sys_prompt_content = prompt.TESTING_ARTIFACT_NO_FEEDBACK_SYS_PROMPT.format(
-                    project_name=project_name_for_prompt
-                )
-                messages = [
-                    SystemMessage(content=sys_prompt_content),
-                    HumanMessage(content=prompt_string)
-                ]
-                response = self.llm.invoke(messages)
-                state.testing_artifact = response.content if hasattr(response, 'content') else str(response)
-                return {"testing_artifact": state.testing_artifact}
-            except KeyError as ke:
-                error_msg = f"KeyError during TESTING_ARTIFACT prompt formatting: {str(ke)}."
-                logger.error(error_msg)
-                state.testing_artifact = error_msg
-                return {"testing_artifact": state.testing_artifact}
-            except Exception as e:
-                logger.error(f"Error generating testing artifacts: {e}")
-                state.testing_artifact = f"Error generating testing artifacts: {str(e)}"
-                return {"testing_artifact": state.testing_artifact}
-    
     @log_entry_exit
     def deployment_artifact(self, state: State) -> dict:
         """Generate deployment artifacts based on testing artifacts."""
-        logger.info("Generating deployment artifacts")
-        if not state.testing_artifact:
-            state.deployment_artifact = "No testing artifacts generated yet."
-            logger.warning("Cannot generate deployment artifacts without testing artifacts.")
-            return {"deployment_artifact": state.deployment_artifact}
-
-  
-        testing_artifact_for_prompt = str(state.testing_artifact).replace('{', '{{').replace('}', '}}')
-        project_name_val = state.project_name or 'N/A'
-        project_name_for_prompt = str(project_name_val).replace('{', '{{').replace('}', '}}')
+        return self._run_stage("deployment_artifact", state)
 
-        if feedback := state.get_last_feedback_for_stage(SDLCStages.DEPLOYMENT):
-            feedback_for_prompt = str(feedback).replace('{', '{{').replace('}', '}}')
-            logger.info(f"Feedback for deployment artifacts: {feedback_for_prompt[:200]}...")  # Log a snippet
-            try:
-                prompt_string_content = prompt.DEPLOYMENT_ARTIFACT_FEEDBACK_PROMPT_STRING.format(
-                    testing_artifact=testing_artifact_for_prompt,
-                    feedback=feedback_for_prompt
-                )
-                sys_prompt_content = prompt.DEPLOYMENT_ARTIFACT_FEEDBACK_SYS_PROMPT.format(
-                    project_name=project_name_for_prompt,
-                    feedback=feedback_for_prompt
-                )
-                messages = [
-                    SystemMessage(content=sys_prompt_content), 
-                    HumanMessage(content=prompt_string_content)
-                ]
-                response = self.llm.invoke(messages)
-                state.deployment_artifact = response.content if hasattr(response, 'content') else str(response)
-                return {"deployment_artifact": state.deployment_artifact}
-            except KeyError as ke:
-                error_msg = f"KeyError during DEPLOYMENT_ARTIFACT_FEEDBACK prompt formatting: {str(ke)}. Review prompt placeholders."
-                logger.error(error_msg)
-                logger.error(f"Prompt string might be: {prompt.DEPLOYMENT_ARTIFACT_FEEDBACK_PROMPT_STRING}")
-                state.deployment_artifact = error_msg
-                return {"deployment_artifact": state.deployment_artifact}
-            except Exception as e:
-                logger.error(f"Error generating deployment artifacts with feedback: {e}")
-                state.deployment_artifact = f"Error generating deployment artifacts: {str(e)}"
-                return {"deployment_artifact": state.deployment_artifact}
-        
-        else:
+    @log_entry_exit
+    async def adeployment_artifact(self, state: State) -> dict:
+        """Async variant of deployment_artifact."""
+        return await self._arun_stage("deployment_artifact", state)
 
-            try:
-                
-                try:
-                    prompt_string_content = prompt.DEPLOYMENT_ARTIFACT_NO_FEEDBACK_PROMPT_STRING.format(
-                        testing_artifact=testing_artifact_for_prompt 
-                        
-                    )
-                    
-                    sys_prompt_content = prompt.DEPLOYMENT_ARTIFACT_NO_FEEDBACK_SYS_PROMPT.format(
-                        project_name=project_name_for_prompt
-                    )
-                except KeyError as ke:
-                    # Fallback if the prompt string uses {state.testing_artifact} directly (less common for general prompts)
-                    if 'state.testing_artifact' in str(ke): # Check if the error is about 'state.testing_artifact'
-                        prompt_string_content = prompt.DEPLOYMENT_ARTIFACT_NO_FEEDBACK_PROMPT_STRING.format(
-                            state=state # Pass the whole state object if the prompt needs it this way
-                        )
-                        sys_prompt_content = prompt.DEPLOYMENT_ARTIFACT_NO_FEEDBACK_SYS_PROMPT.format(
-                            project_name=project_name_for_prompt # This part is likely fine
-                        )
-                    else: # Re-raise if it's a different KeyError
-                        raise ke
-
-
-                messages = [
-                    SystemMessage(content=sys_prompt_content), 
-                    HumanMessage(content=prompt_string_content)
-                ]
-                response = self.llm.invoke(messages)
-                state.deployment_artifact = response.content if hasattr(response, 'content') else str(response)
-                return {"deployment_artifact": state.deployment_artifact}
-            except KeyError as ke:
-                error_msg = f"KeyError during DEPLOYMENT_ARTIFACT prompt formatting: {str(ke)}. Review prompt placeholders."
-                logger.error(error_msg)
-                logger.error(f"Prompt string might be: {prompt.DEPLOYMENT_ARTIFACT_NO_FEEDBACK_PROMPT_STRING}")
-                state.deployment_artifact = error_msg
-                return {"deployment_artifact": state.deployment_artifact}
-            except Exception as e:
-                logger.error(f"Error generating deployment artifacts: {e}")
-                state.deployment_artifact = f"Error generating deployment artifacts: {str(e)}"
-                return {"deployment_artifact": state.deployment_artifact}
-            
     @log_entry_exit
     def process_feedback(self, state: State) -> dict:
         """
@@ -0,0 +1,152 @@
+# src/langgraphagenticai/nodes/sdlc_speculation.py
+import hashlib
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from src.langgraphagenticai.logging.logging_utils import logger
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+
+def messages_digest(messages: List[Any]) -> str:
+    """Hash of a prompt's message types and contents; equal digests mean the same LLM request."""
+    digest = hashlib.sha256()
+    for message in messages:
+        digest.update(getattr(message, "type", "").encode("utf-8"))
+        digest.update(b"\x00")
+        digest.update(str(getattr(message, "content", message)).encode("utf-8"))
+        digest.update(b"\x01")
+    return digest.hexdigest()
+
+
+def response_tokens(response: Any, messages: List[Any]) -> int:
+    """Tokens a call consumed: its reported usage, or about four characters per token."""
+    usage = getattr(response, "usage_metadata", None) or {}
+    if usage.get("total_tokens"):
+        return usage["total_tokens"]
+    prompt_chars = sum(len(str(getattr(m, "content", m))) for m in messages)
+    return (prompt_chars + len(str(getattr(response, "content", response or "")))) // 4
+
+
+class _Speculation:
+    __slots__ = ("stage", "digest", "session_id", "messages", "future")
+
+    def __init__(self, stage: str, digest: str, session_id: str, messages: List[Any], future: Future):
+        self.stage = stage
+        self.digest = digest
+        self.session_id = session_id
+        self.messages = messages
+        self.future = future
+
+
+class SpeculationManager:
+    """
+    Generates the next SDLC stage's artifact in the background while the user reviews the current one.
+
+    SdlcNode starts a speculation when a reviewed stage finishes (the graph then interrupts for
+    feedback), with the prompt the next stage will build if the current artifact is accepted as
+    is. When the next stage runs it takes the speculation back: if its prompt is the same (the
+    user accepted without changes), the speculative response is used - already complete, or still
+    in flight and joined - instead of a new LLM call. Otherwise, and whenever the stage is
+    regenerated after a rejection, the speculation is discarded and its tokens are charged to the
+    session. A session that has wasted `token_budget` tokens gets no more speculations.
+
+    At most one speculation is kept per graph thread.
+
+    Args:
+        token_budget (int): Tokens of discarded speculations allowed per session.
+        max_workers (int): Speculative LLM calls running at once across all sessions.
+    """
+
+    def __init__(self, token_budget: int = 30000, max_workers: int = 4):
+        self.token_budget = token_budget
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sdlc-speculation")
+        self._pending: Dict[str, _Speculation] = {}
+        self._wasted: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"started": 0, "committed": 0, "discarded": 0, "skipped_over_budget": 0, "wasted_tokens": 0}
+
+    def start(self, thread_id: str, session_id: str, stage: str, messages: List[Any], model,
+              metadata: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Start generating `stage` of `thread_id` from `messages` with `model` (a concrete session
+        model, not a runtime stand-in). Returns False when the session is over its waste budget.
+        """
+        with self._lock:
+            previous = self._pending.pop(thread_id, None)
+            over_budget = self._wasted.get(session_id, 0) >= self.token_budget
+            if over_budget:
+                self._stats["skipped_over_budget"] += 1
+        if previous is not None:
+            self._discard(previous)
+        if over_budget:
+            logger.info(f"Not speculating {stage}: session {session_id} used its speculation token budget")
+            return False
+        config = {"metadata": {**(metadata or {}), "speculative": True}, "tags": ["speculative"]}
+        future = self._executor.submit(model.invoke, messages, config)
+        with self._lock:
+            self._pending[thread_id] = _Speculation(stage, messages_digest(messages), session_id, messages, future)
+            self._stats["started"] += 1
+        logger.info(f"Speculatively generating {stage} for thread {thread_id}")
+        return True
+
+    def take(self, thread_id: str, stage: str, messages: List[Any]) -> Optional[Future]:
+        """
+        The speculative response future for `stage` if one was started with the same prompt. A
+        speculation of `stage` with another prompt is discarded; one of another stage stays
+        pending (it is replaced, and charged, when the next speculation of the thread starts).
+        """
+        with self._lock:
+            speculation = self._pending.get(thread_id)
+            if speculation is None or speculation.stage != stage:
+                return None
+            del self._pending[thread_id]
+        if speculation.digest == messages_digest(messages):
+            with self._lock:
+                self._stats["committed"] += 1
+            logger.info(f"Using speculative {stage} for thread {thread_id}")
+            return speculation.future
+        self._discard(speculation)
+        return None
+
+    def _discard(self, speculation: _Speculation) -> None:
+        with self._lock:
+            self._stats["discarded"] += 1
+        if speculation.future.cancel():
+            return
+        speculation.future.add_done_callback(lambda future: self._charge(speculation, future))
+
+    def _charge(self, speculation: _Speculation, future: Future) -> None:
+        response = None if future.exception() else future.result()
+        tokens = response_tokens(response, speculation.messages)
+        with self._lock:
+            self._wasted[speculation.session_id] = self._wasted.get(speculation.session_id, 0) + tokens
+            self._stats["wasted_tokens"] += tokens
+        logger.info(f"Discarded speculative {speculation.stage} ({tokens} tokens) of session {speculation.session_id}")
+
+    def wasted_tokens(self, session_id: str) -> int:
+        with self._lock:
+            return self._wasted.get(session_id, 0)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending)}
+
+
+_speculation_manager: Optional[SpeculationManager] = None
+_speculation_manager_lock = threading.Lock()
+
+
+def get_speculation_manager() -> Optional[SpeculationManager]:
+    """Return the process-wide speculation manager, or None when speculation is disabled in uiconfigfile.ini."""
+    global _speculation_manager
+    config = Config()
+    if not config.get_sdlc_speculation():
+        return None
+    with _speculation_manager_lock:
+        if _speculation_manager is None:
+            _speculation_manager = SpeculationManager(
+                token_budget=config.get_sdlc_speculation_token_budget(),
+                max_workers=config.get_sdlc_speculation_workers(),
+            )
+        return _speculation_manager
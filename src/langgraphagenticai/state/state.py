@@ -1,12 +1,40 @@
 from typing import Annotated, List, TypedDict, Optional, Dict, Any
 from datetime import datetime
+from functools import lru_cache
 import operator
 from pydantic import BaseModel, Field
+from langgraph.channels import DeltaChannel
 from langgraph.graph.message import add_messages
 from enum import Enum
 class State(TypedDict):
 
     messages: Annotated[list, add_messages] # Chat history including user inputs and AI responses
+    summary: str # Rolling summary of the turns folded out of the context window
+    summarized_count: int # Number of leading messages covered by `summary`
+
+def append_message_batches(messages: list, batches: list) -> list:
+    """Batch reducer for the message log: applies several `add_messages` updates in one pass."""
+    updates = [message for batch in batches for message in (batch if isinstance(batch, list) else [batch])]
+    return add_messages(messages, updates)
+
+@lru_cache(maxsize=None)
+def message_log_state(snapshot_every: int = 40) -> type:
+    """
+    Chat state whose `messages` are stored as an append-only log.
+
+    With `State`, every checkpoint holds the whole conversation, so a long chat costs O(n²) to
+    serialize and store. Here checkpoints only record the messages each step appended (the
+    channel's writes); the list is rebuilt when a checkpoint is read by replaying the writes
+    since the last full snapshot, which is taken every `snapshot_every` updates.
+
+    Args:
+        snapshot_every (int): Message updates between full snapshots; bounds the replay on read.
+    """
+    return TypedDict("MessageLogState", {
+        "messages": Annotated[list, DeltaChannel(append_message_batches, snapshot_frequency=snapshot_every)],
+        "summary": str,
+        "summarized_count": int,
+    })
 
 # Schema for structured output to use in planning
 class Section(BaseModel):
@@ -16,6 +44,19 @@ class Section(BaseModel):
 class Sections(BaseModel):
     sections: List[Section] = Field(description="Sections of the report.")
 
+# Schema for writing every planned section in one structured call
+class SectionDraft(BaseModel):
+    name: str = Field(description="Exact name of the section as given in the plan.")
+    content: str = Field(description="Full markdown content of the section.")
+
+class SectionDrafts(BaseModel):
+    sections: List[SectionDraft] = Field(description="Written sections, in plan order.")
+
+# Schema for mapping reviewer feedback to the sections of a draft it concerns
+class RevisionScope(BaseModel):
+    sections: List[str] = Field(description="Exact names of the sections the feedback asks to change.")
+    replan: bool = Field(description="True if the feedback asks to add, remove, reorder or rename sections, or to rework the whole post.")
+
 # Graph state
 class BlogState(TypedDict):
 
@@ -38,6 +79,14 @@ class BlogState(TypedDict):
     final_report: str  # Final report
     draft_approved: bool  # Whether the draft is approved
 
+    #for the section cache
+    cached_sections: List[Optional[str]]  # Cached content per planned section, None where a worker writes it
+
+    #for targeted revisions
+    draft_sections: List[str]  # Content of each planned section in the last draft
+    revision_picks: List[str]  # Section names the reviewer picked for revision
+    revise_sections: List[int]  # Plan indices rewritten by the current targeted revision
+
 
 
 class SDLCStages(Enum):
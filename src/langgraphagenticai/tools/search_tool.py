@@ -1,14 +1,36 @@
 # src/langgraphagenticai/search_tool.py
 from langchain_community.tools.tavily_search import TavilySearchResults
+from langchain_core.tools import StructuredTool
 from langgraph.prebuilt import ToolNode
+import hashlib
 import os
 import streamlit as st
 
+def create_offline_search_tool(max_results=3):
+    """
+    Returns a deterministic stand-in for the Tavily search tool, with the same name and
+    arguments, so tool-calling graphs run without network access.
+    """
+    def offline_search(query: str) -> list:
+        """A search engine optimized for comprehensive, accurate, and trusted results. Input should be a search query."""
+        digest = hashlib.sha256(query.encode("utf-8")).hexdigest()
+        return [
+            {
+                "url": f"https://example.com/{digest[:8]}/{index}",
+                "content": f"Offline result {index + 1} for '{query}' (reference {digest[index * 6:index * 6 + 6]}).",
+            }
+            for index in range(max_results)
+        ]
+
+    return StructuredTool.from_function(offline_search, name="tavily_search_results_json")
+
 def get_tools(max_results=3):
     """
     Returns a list of tools with configurable max_results.
     """
     try:
+        if st.session_state.get("offline_tools"):
+            return [create_offline_search_tool(max_results)]
         tavily_api_key = os.getenv("TAVILY_API_KEY", st.session_state.get("TAVILY_API_KEY", ""))
         if not tavily_api_key:
             st.error("Error: Tavily API key not provided")
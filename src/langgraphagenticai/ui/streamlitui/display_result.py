@@ -1,5 +1,5 @@
 import streamlit as st
-from langchain_core.messages import HumanMessage, AIMessage
+from langchain_core.messages import HumanMessage, AIMessage, AIMessageChunk, ToolMessage
 import logging
 import json
 from datetime import datetime
@@ -9,8 +9,48 @@ from src.langgraphagenticai.ui.streamlitui.display_result_sdlc import DisplaySdl
 import logging
 import functools
 import time
+from collections import deque
 
 from src.langgraphagenticai.logging.logging_utils import logger, log_entry_exit
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+# Streamed-turn metrics kept per session; older turns are dropped so long chats don't grow session state.
+STREAM_METRICS_KEPT = 50
+
+
+class StreamMetrics:
+    """Time-to-first-token and throughput for a single streamed response."""
+
+    def __init__(self):
+        self.start_time = time.perf_counter()
+        self.first_token_time = None
+        self.end_time = None
+        self.chunk_count = 0
+        self.output_tokens = None
+
+    def on_token(self, chunk):
+        if self.first_token_time is None:
+            self.first_token_time = time.perf_counter()
+        self.chunk_count += 1
+        usage = getattr(chunk, "usage_metadata", None)
+        if usage and usage.get("output_tokens"):
+            self.output_tokens = (self.output_tokens or 0) + usage["output_tokens"]
+
+    def finish(self):
+        self.end_time = time.perf_counter()
+
+    def to_dict(self) -> dict:
+        end_time = self.end_time or time.perf_counter()
+        ttft = (self.first_token_time - self.start_time) if self.first_token_time else None
+        tokens = self.output_tokens if self.output_tokens is not None else self.chunk_count
+        generation_time = (end_time - self.first_token_time) if self.first_token_time else 0.0
+        return {
+            "ttft_seconds": ttft,
+            "total_seconds": end_time - self.start_time,
+            "tokens": tokens,
+            "tokens_per_second": tokens / generation_time if generation_time > 0 else None,
+        }
+
 
 class DisplayResultStreamlit:
     def __init__(self, graph, with_message_history, config, usecase):
@@ -68,7 +108,10 @@ class DisplayResultStreamlit:
             self.session_history.add_user_message(user_message)
             with st.chat_message("user"):
                 st.markdown(user_message, unsafe_allow_html=True)
-            self._process_graph_stream(HumanMessage(content=user_message))
+            if Config().get_chat_streaming():
+                self._process_graph_token_stream(HumanMessage(content=user_message))
+            else:
+                self._process_graph_stream(HumanMessage(content=user_message))
 
     @log_entry_exit
     def _process_graph_stream(self, input_message=None):
@@ -85,4 +128,56 @@ class DisplayResultStreamlit:
                             self.session_history.add_ai_message(content)
             except Exception as e:
                 logger.error(f"Error in graph streaming: {e}")
-                st.error(f"Error processing workflow: {e}")
\ No newline at end of file
+                st.error(f"Error processing workflow: {e}")
+
+    @log_entry_exit
+    def _process_graph_token_stream(self, input_message):
+        """
+        Stream the chatbot reply token by token using LangGraph's "messages" stream mode.
+
+        Chunks carrying only tool-call deltas are not rendered; tool results are shown as a short
+        caption and the follow-up answer keeps streaming into the same chat bubble. A complete
+        AIMessage is only rendered for a step that produced no chunks (e.g. a cached response).
+        """
+        metrics = StreamMetrics()
+        streamed_steps = set()
+        response_text = ""
+        try:
+            with st.chat_message("assistant"):
+                placeholder = st.empty()
+                for message, metadata in self.graph.stream(
+                    {"messages": [input_message]}, self.config, stream_mode="messages"
+                ):
+                    step = (metadata.get("langgraph_node"), metadata.get("langgraph_step"))
+                    if isinstance(message, ToolMessage):
+                        st.caption(f"Used tool `{message.name}`")
+                        if response_text:
+                            response_text += "\n\n"
+                        continue
+                    if isinstance(message, AIMessageChunk):
+                        if message.tool_call_chunks and not message.content:
+                            continue
+                        if isinstance(message.content, str) and message.content:
+                            streamed_steps.add(step)
+                            metrics.on_token(message)
+                            response_text += message.content
+                            placeholder.markdown(response_text + "▌")
+                    elif isinstance(message, AIMessage) and step not in streamed_steps and message.content:
+                        metrics.on_token(message)
+                        response_text += str(message.content)
+                metrics.finish()
+                placeholder.markdown(response_text)
+
+                stats = metrics.to_dict()
+                st.session_state.setdefault("stream_metrics", deque(maxlen=STREAM_METRICS_KEPT)).append(stats)
+                logger.info(f"Streamed response metrics: {stats}")
+                if stats["ttft_seconds"] is not None:
+                    caption = f"TTFT {stats['ttft_seconds']:.2f}s"
+                    if stats["tokens_per_second"]:
+                        caption += f" · {stats['tokens_per_second']:.1f} tokens/s"
+                    st.caption(caption)
+            if response_text:
+                self.session_history.add_ai_message(response_text)
+        except Exception as e:
+            logger.error(f"Error in graph token streaming: {e}")
+            st.error(f"Error processing workflow: {e}")
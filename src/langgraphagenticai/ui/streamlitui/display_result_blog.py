@@ -5,6 +5,7 @@ import markdown
 import json
 from pydantic import BaseModel, Field
 from datetime import datetime
+from typing import List
 import logging
 import functools
 import time
@@ -15,6 +16,7 @@ from src.langgraphagenticai.ui.uiconfigfile import Config
 class ReviewFeedback(BaseModel):
     approved: bool = Field(description="Approval status: True for approved, False for rejected")
     comments: str = Field(description="Reviewer comments")
+    sections: List[str] = Field(default_factory=list, description="Sections to revise; empty to let the graph decide")
 
 class DisplayBlogResult:
     def __init__(self, graph, config):
@@ -138,7 +140,8 @@ class DisplayBlogResult:
     
         print("\n\n----Revised button ON_CLICK call back executed----\n\n")
         logger.info("----Revised button ON_CLICK call back executed----")
-        st.session_state['feedback_result'] = ReviewFeedback(approved=False, comments=st.session_state.get('feedback'))
+        st.session_state['feedback_result'] = ReviewFeedback(approved=False, comments=st.session_state.get('feedback'),
+                                                             sections=st.session_state.get('revision_sections_picked') or [])
         st.session_state["feedback_submitted"]=True
         print(f"\n\n----------feedback_submitted: {st.session_state['feedback_submitted']} & Exiting _handle_revised_click function with {st.session_state['feedback_result']}---------------\n\n")
    
@@ -261,6 +264,15 @@ class DisplayBlogResult:
             )
             st.session_state["feedback"] = feedback_text  
 
+            section_names = self._draft_section_names()
+            if section_names:
+                st.multiselect(
+                    "Sections to revise (optional):",
+                    section_names,
+                    key="revision_sections_picked",
+                    help="Only these sections are rewritten. Leave empty to let the feedback decide.",
+                )
+
             col1, col2 = st.columns(2)
             with col1:
                 st.button("✅ Approve Content", on_click=self._handle_approved_click, key="blog_feedback_approve_button")
@@ -269,6 +281,33 @@ class DisplayBlogResult:
         
         return st.session_state.get('feedback_result')
     
+    def _resume_with_approval(self, comments: str) -> None:
+        """
+        Finish the graph run with the approval: feedback_collector records draft_approved and
+        file_generator completes the thread, so the checkpoint reflects the accepted draft (and
+        checkpoint_compact_on_accept can drop the review history).
+        """
+        approval = HumanMessage(content=json.dumps({"approved": True, "comments": comments or ""}))
+        try:
+            self.graph.update_state(self.config, {"messages": [approval]})
+            for event in self.graph.stream(None, self.config):
+                logger.info(f"Approval resume event: {list(event.keys())[0]}")
+        except Exception as e:
+            logger.warning(f"Could not record the blog approval in the graph: {e}")
+
+    def _draft_section_names(self) -> List[str]:
+        """Section names of the draft under review, when targeted revisions are enabled."""
+        if not Config().get_blog_targeted_revision():
+            return []
+        try:
+            values = self.graph.get_state(self.config).values
+        except Exception as e:
+            logger.warning(f"Could not read the draft's sections: {e}")
+            return []
+        if not values.get("draft_sections"):
+            return []
+        return [section.name for section in values.get("sections") or []]
+
     @log_entry_exit
     def _download_blog_content(self, blog_content):
         """Create a download link for the blog content."""
@@ -327,6 +366,7 @@ class DisplayBlogResult:
                 if feedback_result:
                     if feedback_result.approved:
                         logger.info("Feedback: Approved")
+                        self._resume_with_approval(feedback_result.comments)
                         st.session_state["blog_content"] = st.session_state.get("generated_draft")
                         st.session_state["generated_draft"] = None
                         st.session_state.current_stage = "complete"
@@ -335,6 +375,7 @@ class DisplayBlogResult:
                     else:
                         logger.info(f"Feedback: Revision requested - comments: {feedback_result.comments}")
                         st.session_state["feedback"] = feedback_result.comments
+                        st.session_state["revision_sections"] = feedback_result.sections
                         st.session_state.current_stage = "processing_feedback"
                         st.session_state['feedback_result'] = None
                         st.session_state["generated_draft"] = None
@@ -351,7 +392,8 @@ class DisplayBlogResult:
             if feedback_comment is not None:
                 feedback_message = HumanMessage(content=json.dumps({
                     "approved": False,
-                    "comments": feedback_comment
+                    "comments": feedback_comment,
+                    "sections": st.session_state.pop("revision_sections", None) or []
                 }))
                 input_data = {"messages": [feedback_message]}
                 logger.info(f"Resuming graph with feedback message: {feedback_message.content}")
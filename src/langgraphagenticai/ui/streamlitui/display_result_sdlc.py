@@ -29,6 +29,7 @@ class DisplaySdlcResult:
         self.graph = graph
         self.config = config
         self._initialize_session_state()
+        self._restore_from_checkpoint()
 
     def _initialize_session_state(self):
         """Initialize session state variables if they don't exist."""
@@ -69,6 +70,54 @@ class DisplaySdlcResult:
             if key not in st.session_state:
                 st.session_state[key] = value
 
+    # Graph state field -> (session state key, generated flag, approval flag, UI stage) per reviewed artifact
+    RESTORED_ARTIFACTS = [
+        ("user_stories", "generated_user_stories", "user_stories_generated_flag", "user_stories_approved", "planning"),
+        ("design_documents", "generated_design_documents", "design_documents_generated_flag", "design_documents_approved", "design"),
+        ("development_artifact", "generated_development_artifact", "development_artifact_generated_flag", "development_artifact_approved", "development"),
+        ("testing_artifact", "generated_testing_artifact", "testing_artifact_generated_flag", "testing_artifact_approved", "testing"),
+        ("deployment_artifact", "generated_deployment_artifact", "deployment_artifact_generated_flag", "deployment_artifact_approved", "deployment"),
+    ]
+
+    def _restore_from_checkpoint(self):
+        """
+        Rebuild the workflow view of a new browser session from the thread's last checkpoint.
+
+        With a persistent checkpointer a workflow paused for review survives a restart; the thread
+        ID comes back through the URL, but the session state that drives this page does not. The
+        artifacts and the stage under review are read back from the paused graph so the review
+        form, and the resume that follows it, continue where the workflow stopped.
+        """
+        if st.session_state.get("sdlc_checkpoint_checked"):
+            return
+        st.session_state["sdlc_checkpoint_checked"] = True
+        if st.session_state.get("requirements_generated"):
+            return
+        try:
+            snapshot = self.graph.get_state(self.config)
+        except Exception as e:
+            logger.warning(f"Could not read SDLC checkpoint: {e}")
+            return
+        values = snapshot.values or {}
+        if not snapshot.next or not values.get("generated_requirements"):
+            return
+
+        for field in ["project_name", "project_description", "project_goals", "project_scope", "project_objectives"]:
+            st.session_state[field] = values.get(field) or ""
+        st.session_state["generated_requirements"] = values["generated_requirements"]
+        st.session_state["requirements_generated"] = True
+        restored = [spec for spec in self.RESTORED_ARTIFACTS if values.get(spec[0])]
+        for index, (field, session_key, generated_flag, approved_flag, stage) in enumerate(restored):
+            st.session_state[session_key] = values[field]
+            st.session_state[generated_flag] = True
+            # Every artifact before the last one was accepted, or the workflow would not have moved on
+            st.session_state[approved_flag] = index < len(restored) - 1
+        if restored:
+            st.session_state["sdlc_stage"] = restored[-1][4]
+        if values.get("user_stories"):
+            st.session_state["user_stories"] = values["user_stories"]
+        logger.info(f"Restored SDLC workflow at stage '{st.session_state['sdlc_stage']}' from checkpoint (next: {snapshot.next})")
+
     @log_entry_exit
     def handle_sdlc_workflow(self):
         """Manages the overall SDLC workflow display and interaction in Streamlit."""
@@ -212,6 +261,8 @@ class DisplaySdlcResult:
         for key in keys_to_reset:
             if not key.startswith("_"):
                 del st.session_state[key]
+        # Start a new thread instead of rejoining the checkpointed one named in the URL
+        st.query_params.clear()
         self._initialize_session_state()
 
     @log_entry_exit
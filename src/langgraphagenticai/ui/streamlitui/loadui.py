@@ -65,10 +65,11 @@ class LoadStreamlitUI:
             dot.edge("tools", "chatbot", label="return"); dot.edge("chatbot", "END", label="no tools", style="dashed", constraint="false")
         elif usecase == "Blog Generation":
             dot.node("START", "START"); dot.node("user_input", "User Input"); dot.node("orchestrator", "Orchestrator")
-            dot.node("llm_call", "LLM Call"); dot.node("synthesizer", "Synthesizer"); dot.node("feedback_collector", "Feedback Collector", shape="diamond")
+            dot.node("llm_call", "LLM Call"); dot.node("batch_sections", "Batch Sections"); dot.node("synthesizer", "Synthesizer"); dot.node("feedback_collector", "Feedback Collector", shape="diamond")
             dot.node("file_generator", "File Generator"); dot.node("END", "END")
             dot.edge("START", "user_input"); dot.edge("user_input", "orchestrator"); dot.edge("orchestrator", "llm_call", label="assign_workers", style="dashed")
-            dot.edge("llm_call", "synthesizer"); dot.edge("synthesizer", "feedback_collector")
+            dot.edge("orchestrator", "batch_sections", label="long plans", style="dashed")
+            dot.edge("llm_call", "synthesizer"); dot.edge("batch_sections", "synthesizer"); dot.edge("synthesizer", "feedback_collector")
             dot.edge("feedback_collector", "orchestrator", label="revise", style="dashed", color="orange")
             dot.edge("feedback_collector", "file_generator", label="accept", style="dashed", color="green")
             dot.edge("file_generator", "END")
@@ -245,6 +246,11 @@ class LoadStreamlitUI:
                 self.user_controls["OPENAI_API_KEY"] = st.session_state.OPENAI_API_KEY
                 if not self.user_controls["OPENAI_API_KEY"]: st.warning("⚠️ Please enter your OpenAI API key.")
 
+            elif self.user_controls["selected_llm"] == "Fake":
+                model_options = self.config.get_fake_model_options()
+                self.user_controls["selected_fake_model"] = st.selectbox("Select Mode", model_options)
+                st.caption("Offline provider: no API keys needed; web search returns synthetic results.")
+
 
             # --- Use Case Selection ---
             self.user_controls["selected_usecase"] = st.selectbox(
@@ -26,5 +26,274 @@ class Config:
     def get_openai_model_options(self):
         return self.config["DEFAULT"].get("OPENAI_MODEL_OPTIONS").split(", ")
 
+    def get_fake_model_options(self):
+        return self.config["DEFAULT"].get("FAKE_MODEL_OPTIONS", fallback="synthetic").split(", ")
+
     def get_page_title(self):
-        return self.config["DEFAULT"].get("PAGE_TITLE")
\ No newline at end of file
+        return self.config["DEFAULT"].get("PAGE_TITLE")
+
+    def get_llm_client_idle_ttl(self):
+        return self.config["DEFAULT"].getfloat("LLM_CLIENT_IDLE_TTL", fallback=1800.0)
+
+    def get_response_cache_usecases(self):
+        value = self.config["DEFAULT"].get("RESPONSE_CACHE_USECASES", fallback="")
+        return [usecase for usecase in value.split(", ") if usecase]
+
+    def get_response_cache_path(self):
+        return self.config["DEFAULT"].get("RESPONSE_CACHE_PATH", fallback="")
+
+    def get_response_cache_max_entries(self):
+        return self.config["DEFAULT"].getint("RESPONSE_CACHE_MAX_ENTRIES", fallback=512)
+
+    def get_response_cache_ttl(self):
+        return self.config["DEFAULT"].getfloat("RESPONSE_CACHE_TTL", fallback=3600.0)
+
+    def get_response_cache_disk_ttl(self):
+        return self.config["DEFAULT"].getfloat("RESPONSE_CACHE_DISK_TTL", fallback=604800.0)
+
+    def get_response_cache_max_disk_entries(self):
+        return self.config["DEFAULT"].getint("RESPONSE_CACHE_MAX_DISK_ENTRIES", fallback=10000)
+
+    def get_chat_streaming(self):
+        return self.config["DEFAULT"].getboolean("CHAT_STREAMING", fallback=True)
+
+    def get_async_execution(self):
+        return self.config["DEFAULT"].getboolean("ASYNC_EXECUTION", fallback=False)
+
+    def get_llm_max_concurrency(self):
+        value = self.config["DEFAULT"].get("LLM_MAX_CONCURRENCY", fallback="")
+        limits = {}
+        for item in value.split(", "):
+            if ":" in item:
+                provider, limit = item.split(":", 1)
+                limits[provider.strip()] = int(limit)
+        return limits
+
+    def get_rate_limits(self):
+        value = self.config["DEFAULT"].get("RATE_LIMITS", fallback="")
+        limits = {}
+        for item in value.split(", "):
+            if ":" in item and "/" in item:
+                provider, budget = item.split(":", 1)
+                rpm, tpm = budget.split("/", 1)
+                limits[provider.strip()] = (float(rpm), float(tpm))
+        return limits
+
+    def get_rate_limit_completion_tokens(self):
+        return self.config["DEFAULT"].getint("RATE_LIMIT_COMPLETION_TOKENS", fallback=512)
+
+    def get_rate_limit_max_retries(self):
+        return self.config["DEFAULT"].getint("RATE_LIMIT_MAX_RETRIES", fallback=4)
+
+    def get_http_max_connections(self):
+        return self.config["DEFAULT"].getint("HTTP_MAX_CONNECTIONS", fallback=20)
+
+    def get_http_max_keepalive(self):
+        return self.config["DEFAULT"].getint("HTTP_MAX_KEEPALIVE", fallback=10)
+
+    def get_http_keepalive_expiry(self):
+        return self.config["DEFAULT"].getfloat("HTTP_KEEPALIVE_EXPIRY", fallback=120.0)
+
+    def get_http_warmup_providers(self):
+        value = self.config["DEFAULT"].get("HTTP_WARMUP_PROVIDERS", fallback="")
+        return [provider.strip() for provider in value.split(",") if provider.strip()]
+
+    def get_http_keepalive_ping_interval(self):
+        return self.config["DEFAULT"].getfloat("HTTP_KEEPALIVE_PING_INTERVAL", fallback=0.0)
+
+    def get_graph_profiling(self):
+        if os.getenv("AGENTICAI_GRAPH_PROFILING"):
+            return os.getenv("AGENTICAI_GRAPH_PROFILING").lower() in ("1", "true", "yes")
+        return self.config["DEFAULT"].getboolean("GRAPH_PROFILING", fallback=False)
+
+    def get_checkpointer_backend(self):
+        return os.getenv("AGENTICAI_CHECKPOINTER") or self.config["DEFAULT"].get("CHECKPOINTER", fallback="memory")
+
+    def get_checkpoint_db_path(self):
+        return self.config["DEFAULT"].get("CHECKPOINT_DB_PATH", fallback="")
+
+    def get_checkpoint_serde(self):
+        return self.config["DEFAULT"].get("CHECKPOINT_SERDE", fallback="jsonplus").strip().lower()
+
+    def get_checkpoint_blob_min_size(self):
+        return self.config["DEFAULT"].getint("CHECKPOINT_BLOB_MIN_SIZE", fallback=0)
+
+    def get_checkpoint_blob_codec(self):
+        return self.config["DEFAULT"].get("CHECKPOINT_BLOB_CODEC", fallback="zstd")
+
+    def get_checkpoint_keep_last(self):
+        return self.config["DEFAULT"].getint("CHECKPOINT_KEEP_LAST", fallback=0)
+
+    def get_checkpoint_idle_ttl(self):
+        return self.config["DEFAULT"].getfloat("CHECKPOINT_IDLE_TTL", fallback=0.0)
+
+    def get_checkpoint_max_bytes(self):
+        return self.config["DEFAULT"].getint("CHECKPOINT_MAX_BYTES", fallback=0)
+
+    def get_checkpoint_compact_on_accept(self):
+        return self.config["DEFAULT"].getboolean("CHECKPOINT_COMPACT_ON_ACCEPT", fallback=False)
+
+    def get_graph_template_cache(self):
+        return self.config["DEFAULT"].getboolean("GRAPH_TEMPLATE_CACHE", fallback=True)
+
+    def get_request_coalescing(self):
+        return self.config["DEFAULT"].getboolean("REQUEST_COALESCING", fallback=False)
+
+    def get_hedging_enabled(self):
+        return self.config["DEFAULT"].getboolean("HEDGING_ENABLED", fallback=False)
+
+    def get_hedge_models(self):
+        value = self.config["DEFAULT"].get("HEDGE_MODELS", fallback="")
+        models = {}
+        for item in value.split(", "):
+            if ":" in item:
+                provider, model = item.split(":", 1)
+                models[provider.strip()] = model.strip()
+        return models
+
+    def get_hedge_percentile(self):
+        return self.config["DEFAULT"].getfloat("HEDGE_PERCENTILE", fallback=95.0)
+
+    def get_hedge_initial_delay(self):
+        return self.config["DEFAULT"].getfloat("HEDGE_INITIAL_DELAY", fallback=2.0)
+
+    def get_circuit_breaker_failures(self):
+        return self.config["DEFAULT"].getint("CIRCUIT_BREAKER_FAILURES", fallback=3)
+
+    def get_circuit_breaker_reset(self):
+        return self.config["DEFAULT"].getfloat("CIRCUIT_BREAKER_RESET", fallback=60.0)
+
+    def get_llm_retry_max_attempts(self):
+        return self.config["DEFAULT"].getint("LLM_RETRY_MAX_ATTEMPTS", fallback=1)
+
+    def get_llm_retry_base_delay(self):
+        return self.config["DEFAULT"].getfloat("LLM_RETRY_BASE_DELAY", fallback=0.5)
+
+    def get_llm_retry_max_delay(self):
+        return self.config["DEFAULT"].getfloat("LLM_RETRY_MAX_DELAY", fallback=8.0)
+
+    def get_llm_step_deadline(self):
+        return self.config["DEFAULT"].getfloat("LLM_STEP_DEADLINE", fallback=0.0)
+
+    def get_llm_provider_override(self):
+        return os.getenv("AGENTICAI_LLM_PROVIDER") or self.config["DEFAULT"].get("LLM_PROVIDER", fallback="")
+
+    def get_fake_llm_mode(self):
+        return os.getenv("AGENTICAI_FAKE_MODE") or self.config["DEFAULT"].get("FAKE_LLM_MODE", fallback="synthetic")
+
+    def get_fake_llm_latency(self):
+        return self.config["DEFAULT"].get("FAKE_LLM_LATENCY", fallback="lognormal:0.6:0.4")
+
+    def get_fake_llm_tokens_per_second(self):
+        return self.config["DEFAULT"].getfloat("FAKE_LLM_TOKENS_PER_SECOND", fallback=80.0)
+
+    def get_fake_llm_seed(self):
+        return self.config["DEFAULT"].getint("FAKE_LLM_SEED", fallback=0)
+
+    def get_llm_cassette_path(self):
+        return os.getenv("AGENTICAI_LLM_CASSETTE") or self.config["DEFAULT"].get("LLM_CASSETTE_PATH", fallback="")
+
+    def get_llm_record(self):
+        if os.getenv("AGENTICAI_LLM_RECORD"):
+            return os.getenv("AGENTICAI_LLM_RECORD").lower() in ("1", "true", "yes")
+        return self.config["DEFAULT"].getboolean("LLM_RECORD", fallback=False)
+
+    def get_llm_pricing(self):
+        value = self.config["DEFAULT"].get("LLM_PRICING", fallback="")
+        pricing = {}
+        for item in value.split(", "):
+            if ":" in item and "/" in item:
+                model, prices = item.rsplit(":", 1)
+                input_price, output_price = prices.split("/", 1)
+                pricing[model.strip()] = (float(input_price), float(output_price))
+        return pricing
+
+    def get_model_tier(self, tier):
+        value = self.config["DEFAULT"].get(f"MODEL_TIER_{tier.upper()}", fallback="")
+        models = {}
+        for item in value.split(", "):
+            if ":" in item:
+                provider, model = item.split(":", 1)
+                models[provider.strip()] = model.strip()
+        return models
+
+    def get_model_routes(self, usecase):
+        value = self.config["DEFAULT"].get(f"MODEL_ROUTES_{usecase.upper().replace(' ', '_')}", fallback="")
+        routes = {}
+        for item in value.split(", "):
+            if ":" in item:
+                call_site, tier = item.split(":", 1)
+                routes[call_site.strip()] = tier.strip()
+        return routes
+
+    def get_chat_history_enabled(self):
+        return self.config["DEFAULT"].getboolean("CHAT_HISTORY_ENABLED", fallback=False)
+
+    def get_chat_history_keep_turns(self):
+        return self.config["DEFAULT"].getint("CHAT_HISTORY_KEEP_TURNS", fallback=6)
+
+    def get_chat_history_fold_turns(self):
+        return self.config["DEFAULT"].getint("CHAT_HISTORY_FOLD_TURNS", fallback=4)
+
+    def get_chat_history_token_budgets(self):
+        value = self.config["DEFAULT"].get("CHAT_HISTORY_TOKEN_BUDGETS", fallback="")
+        budgets = {}
+        for item in value.split(", "):
+            if ":" in item:
+                model, budget = item.rsplit(":", 1)
+                budgets[model.strip()] = int(budget)
+        return budgets
+
+    def get_chat_message_log(self):
+        return self.config["DEFAULT"].getboolean("CHAT_MESSAGE_LOG", fallback=False)
+
+    def get_chat_message_log_snapshot_every(self):
+        return self.config["DEFAULT"].getint("CHAT_MESSAGE_LOG_SNAPSHOT_EVERY", fallback=40)
+
+    def get_sdlc_cache_friendly_prompts(self):
+        return self.config["DEFAULT"].getboolean("SDLC_CACHE_FRIENDLY_PROMPTS", fallback=False)
+
+    def get_blog_targeted_revision(self):
+        return self.config["DEFAULT"].getboolean("BLOG_TARGETED_REVISION", fallback=False)
+
+    def get_blog_section_cache(self):
+        return self.config["DEFAULT"].getboolean("BLOG_SECTION_CACHE", fallback=False)
+
+    def get_blog_section_cache_path(self):
+        return self.config["DEFAULT"].get("BLOG_SECTION_CACHE_PATH", fallback="")
+
+    def get_blog_section_cache_max_entries(self):
+        return self.config["DEFAULT"].getint("BLOG_SECTION_CACHE_MAX_ENTRIES", fallback=256)
+
+    def get_blog_section_cache_max_disk_entries(self):
+        return self.config["DEFAULT"].getint("BLOG_SECTION_CACHE_MAX_DISK_ENTRIES", fallback=5000)
+
+    def get_blog_section_cache_ttl(self):
+        return self.config["DEFAULT"].getfloat("BLOG_SECTION_CACHE_TTL", fallback=604800.0)
+
+    def get_sdlc_speculation(self):
+        return self.config["DEFAULT"].getboolean("SDLC_SPECULATION", fallback=False)
+
+    def get_sdlc_speculation_token_budget(self):
+        return self.config["DEFAULT"].getint("SDLC_SPECULATION_TOKEN_BUDGET", fallback=30000)
+
+    def get_sdlc_speculation_workers(self):
+        return self.config["DEFAULT"].getint("SDLC_SPECULATION_WORKERS", fallback=4)
+
+    def get_blog_section_mode(self):
+        return self.config["DEFAULT"].get("BLOG_SECTION_MODE", fallback="fanout").strip().lower()
+
+    def get_blog_batch_min_sections(self):
+        return self.config["DEFAULT"].getint("BLOG_BATCH_MIN_SECTIONS", fallback=6)
+
+    def get_blog_batch_max_concurrency(self):
+        return self.config["DEFAULT"].getint("BLOG_BATCH_MAX_CONCURRENCY", fallback=8)
+
+    def get_blog_multi_section_max_tokens(self):
+        value = self.config["DEFAULT"].get("BLOG_MULTI_SECTION_MAX_TOKENS", fallback="")
+        budgets = {}
+        for item in value.split(", "):
+            if ":" in item:
+                model, budget = item.rsplit(":", 1)
+                budgets[model.strip()] = int(budget)
+        return budgets
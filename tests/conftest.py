@@ -0,0 +1,90 @@
+# tests/conftest.py
+import asyncio
+import re
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.outputs import ChatGeneration, ChatGenerationChunk, ChatResult
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    Chat model for wrapper tests: every call is recorded, waits `delay` seconds, raises
+    `error()` while it is one of the first `failures` calls, and otherwise answers `content`
+    ("{prompt}" is replaced by the last message). Streams split the answer at word boundaries.
+    `bind_tools` records the names of the tools it was given in `bound_tools`.
+    """
+
+    content: str = "ok"
+    delay: float = 0.0
+    failures: int = 0
+    error: Optional[Callable[[], BaseException]] = None
+    usage: Optional[Dict[str, int]] = None
+    calls: List[str] = []
+    cancelled: List[str] = []
+    bound_tools: List[List[str]] = []
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted-test"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any):
+        names = [getattr(tool, "name", None) or getattr(tool, "__name__", str(tool)) for tool in tools]
+        self.bound_tools.append(names)
+        return self.bind(**kwargs)
+
+    def _start(self, messages) -> str:
+        prompt = str(messages[-1].content)
+        self.calls.append(prompt)
+        return prompt
+
+    def _answer(self, prompt: str, attempt: int) -> str:
+        if attempt <= self.failures:
+            raise self.error() if self.error else RuntimeError("scripted failure")
+        return self.content.replace("{prompt}", prompt)
+
+    def _result(self, text: str) -> ChatResult:
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=text, usage_metadata=self.usage))])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        prompt = self._start(messages)
+        attempt = len(self.calls)
+        time.sleep(self.delay)
+        return self._result(self._answer(prompt, attempt))
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs: Any) -> ChatResult:
+        prompt = self._start(messages)
+        attempt = len(self.calls)
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(prompt)
+            raise
+        return self._result(self._answer(prompt, attempt))
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        prompt = self._start(messages)
+        attempt = len(self.calls)
+        time.sleep(self.delay)
+        for part in re.findall(r"\S+|\s+", self._answer(prompt, attempt)):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=part))
+
+    async def _astream(self, messages, stop=None, run_manager=None, **kwargs: Any):
+        prompt = self._start(messages)
+        attempt = len(self.calls)
+        await asyncio.sleep(self.delay)
+        for part in re.findall(r"\S+|\s+", self._answer(prompt, attempt)):
+            yield ChatGenerationChunk(message=AIMessageChunk(content=part))
+
+
+@pytest.fixture
+def fake_model():
+    """Factory of ScriptedChatModel instances, each with its own call log."""
+
+    def make(**kwargs) -> ScriptedChatModel:
+        return ScriptedChatModel(calls=[], cancelled=[], bound_tools=[], **kwargs)
+
+    return make
@@ -0,0 +1,109 @@
+# tests/test_blog_revision.py
+import json
+import uuid
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+from langgraph.types import Send
+
+from src.langgraphagenticai.LLMS.fakellm import FakeChatModel
+from src.langgraphagenticai.graph.graph_builder_blog import BlogGraphBuilder
+from src.langgraphagenticai.nodes.blog_generation_node import BlogGenerationNode
+from src.langgraphagenticai.state.state import Section
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+REQUIREMENTS = "Topic: Caching\nObjective: Informative\nTarget Audience: Engineers\nTone & Style: Casual\nWord Count: 600"
+
+
+@pytest.fixture(autouse=True)
+def targeted_revisions(monkeypatch):
+    monkeypatch.setattr(Config, "get_blog_targeted_revision", lambda self: True)
+    monkeypatch.setattr(Config, "get_blog_section_cache", lambda self: False)
+    monkeypatch.setattr(Config, "get_blog_section_mode", lambda self: "fanout")
+
+
+def fake_llm() -> FakeChatModel:
+    return FakeChatModel(latency="fixed:0", tokens_per_second=1e9)
+
+
+def feedback(comments: str, sections=None, approved=False) -> HumanMessage:
+    return HumanMessage(content=json.dumps({"approved": approved, "comments": comments, "sections": sections or []}))
+
+
+def draft_state(**extra) -> dict:
+    sections = [Section(name=name, description=f"About {name}") for name in ("Introduction", "Main Content", "Conclusion")]
+    return {"sections": sections, "draft_sections": ["intro v1", "main v1", "conclusion v1"], "feedback": "Tighten it",
+            "messages": [feedback("Tighten it")], **extra}
+
+
+@pytest.fixture
+def blog():
+    graph = BlogGraphBuilder(fake_llm(), memory=InMemorySaver()).build_graph()
+    config = {"configurable": {"thread_id": uuid.uuid4().hex}}
+    graph.invoke({"messages": [HumanMessage(content=REQUIREMENTS)]}, config)
+    return graph, config
+
+
+def test_only_the_picked_sections_are_rewritten(blog):
+    graph, config = blog
+    before = graph.get_state(config).values["draft_sections"]
+
+    graph.invoke({"messages": [feedback("More depth please", ["Main Content", "conclusion"])]}, config)
+    state = graph.get_state(config)
+    after = state.values["draft_sections"]
+
+    assert state.next == ("feedback_collector",)
+    assert after[0] == before[0]
+    assert after[1] != before[1] and after[2] != before[2]
+    assert state.values["initial_draft"] == "\n\n---\n\n".join(after)
+    assert state.values["revise_sections"] == [] and state.values["revision_picks"] == []
+
+
+def test_unpicked_feedback_is_scoped_by_the_classifier(blog):
+    graph, config = blog
+    before = graph.get_state(config).values["draft_sections"]
+
+    graph.invoke({"messages": [feedback("The conclusion is weak")]}, config)
+    after = graph.get_state(config).values["draft_sections"]
+
+    assert after[:2] == before[:2]
+    assert after[2] != before[2]
+
+
+def test_route_revision():
+    node = BlogGenerationNode(fake_llm())
+    assert node.route_revision(draft_state()) == "plan_revision"
+    assert node.route_revision(draft_state(messages=[feedback("ok", approved=True)])) == "orchestrator"
+    assert node.route_revision(draft_state(messages=[HumanMessage(content=REQUIREMENTS)])) == "orchestrator"
+    # The plan changed since the draft: its sections no longer line up
+    assert node.route_revision(draft_state(draft_sections=["intro v1"])) == "orchestrator"
+    node.targeted_revision = False
+    assert node.route_revision(draft_state()) == "orchestrator"
+
+
+def test_plan_revision_prefers_the_reviewers_picks():
+    node = BlogGenerationNode(fake_llm())
+    assert node.plan_revision(draft_state(revision_picks=[" conclusion ", "Introduction", "Unknown"])) == {
+        "revise_sections": [0, 2], "revision_picks": []}
+
+
+def test_assign_revisions_sends_the_current_content_of_each_pick():
+    node = BlogGenerationNode(fake_llm())
+    state = draft_state(revise_sections=[0, 2])
+    sends = node.assign_revisions(state)
+
+    assert [send.node for send in sends] == ["llm_call", "llm_call"]
+    assert [send.arg["previous_content"] for send in sends] == ["intro v1", "conclusion v1"]
+    assert all(send.arg["feedback"] == "Tighten it" and "cache_key" not in send.arg for send in sends)
+    assert isinstance(sends[0], Send)
+    assert node.assign_revisions(draft_state(revise_sections=[])) == "orchestrator"
+
+
+def test_synthesizer_splices_rewritten_sections_in_plan_order():
+    node = BlogGenerationNode(fake_llm())
+    result = node.synthesizer(draft_state(revise_sections=[0, 2], completed_sections=["intro v2", "conclusion v2"]))
+
+    assert result["draft_sections"] == ["intro v2", "main v1", "conclusion v2"]
+    assert result["initial_draft"] == "intro v2\n\n---\n\nmain v1\n\n---\n\nconclusion v2"
+    assert result["revise_sections"] == [] and result["completed_sections"] == []
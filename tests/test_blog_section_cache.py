@@ -0,0 +1,125 @@
+# tests/test_blog_section_cache.py
+import uuid
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langgraph.checkpoint.memory import InMemorySaver
+
+from src.langgraphagenticai.LLMS.fakellm import FakeChatModel
+from src.langgraphagenticai.LLMS.runtime_llm import RuntimeChatModel, runtime_configurable
+from src.langgraphagenticai.graph.graph_builder_blog import BlogGraphBuilder
+from src.langgraphagenticai.nodes import blog_section_cache
+from src.langgraphagenticai.nodes.blog_generation_node import BlogGenerationNode
+from src.langgraphagenticai.nodes.blog_section_cache import SectionCache
+from src.langgraphagenticai.state.state import Section
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+REQUIREMENTS = "Topic: Caching\nObjective: Informative\nTarget Audience: Engineers\nTone & Style: Casual\nWord Count: 600"
+POST = {"topic": "Caching", "tone_style": "Casual", "target_audience": "Engineers"}
+PLAN = [Section(name=name, description=f"About {name}") for name in ("Introduction", "Main Content", "Conclusion")]
+
+
+@pytest.fixture(autouse=True)
+def section_cache(monkeypatch):
+    """Enable a fresh, memory-only process-wide section cache."""
+    monkeypatch.setattr(Config, "get_blog_section_cache", lambda self: True)
+    monkeypatch.setattr(Config, "get_blog_section_cache_path", lambda self: "")
+    monkeypatch.setattr(Config, "get_blog_section_mode", lambda self: "fanout")
+    monkeypatch.setattr(blog_section_cache, "_section_cache", None)
+    return blog_section_cache.get_section_cache()
+
+
+def fake_llm() -> FakeChatModel:
+    return FakeChatModel(latency="fixed:0", tokens_per_second=1e9)
+
+
+def test_make_key_normalizes_the_spec():
+    key = SectionCache.make_key("Introduction", "About caching.", "Caching", "Casual", "Engineers", "gpt-4o")
+    assert SectionCache.make_key(" introduction", "about  caching", "CACHING!", "casual", "engineers ", "gpt-4o") == key
+    assert SectionCache.make_key("Introduction", "About caching.", "Caching", "Casual", "Engineers", "gpt-4.1") != key
+    assert SectionCache.make_key("Introduction", "About caching.", "Queues", "Casual", "Engineers", "gpt-4o") != key
+
+
+def test_memory_tier_is_lru_with_ttl(monkeypatch):
+    cache = SectionCache(max_entries=2, ttl=60)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.get("a")
+    cache.put("c", "C")
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == ("A", None, "C")
+
+    cache.put("blank", "  ")
+    assert cache.get("blank") is None
+
+    now = blog_section_cache.time.time()
+    monkeypatch.setattr(blog_section_cache.time, "time", lambda: now + 61)
+    assert cache.get("a") is None
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (3, 3)
+
+
+def test_disk_tier_survives_restarts_and_keeps_the_most_recently_used(tmp_path):
+    db_path = str(tmp_path / "sections.sqlite")
+    cache = SectionCache(db_path=db_path, max_entries=1, max_disk_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    cache.put("c", "C")
+    assert cache.stats()["evictions"] == 1
+
+    reopened = SectionCache(db_path=db_path)
+    assert (reopened.get("a"), reopened.get("b"), reopened.get("c")) == (None, "B", "C")
+
+
+def test_section_key_follows_topic_and_the_runs_model():
+    node = BlogGenerationNode(RuntimeChatModel())
+
+    def key_for(model, **state):
+        run = RunnableLambda(lambda state: node._section_key(state, PLAN[0]))
+        return run.invoke({**POST, **state}, {"configurable": runtime_configurable(model)})
+
+    key = key_for(SimpleNamespace(model_name="gpt-4o"))
+    assert key_for(SimpleNamespace(model_name="gpt-4o")) == key
+    assert key_for(SimpleNamespace(model_name="gemini-2.0-flash")) != key
+    assert key_for(SimpleNamespace(model_name="gpt-4o"), topic="Queues") != key
+
+
+def test_fully_cached_plan_skips_the_workers(section_cache):
+    node = BlogGenerationNode(fake_llm())
+    for section in PLAN:
+        section_cache.put(node._section_key(POST, section), f"cached {section.name}")
+
+    state = {**POST, "sections": PLAN}
+    state["cached_sections"] = node._cached_sections(state, PLAN)
+    assert node.assign_workers(state) == "synthesizer"
+    assert node.synthesizer(state)["draft_sections"] == ["cached Introduction", "cached Main Content", "cached Conclusion"]
+
+
+def test_partially_cached_plan_writes_only_the_missing_sections(section_cache):
+    node = BlogGenerationNode(fake_llm())
+    section_cache.put(node._section_key(POST, PLAN[1]), "cached main")
+
+    state = {**POST, "sections": PLAN}
+    state["cached_sections"] = node._cached_sections(state, PLAN)
+    sends = node.assign_workers(state)
+    assert [send.arg["section"].name for send in sends] == ["Introduction", "Conclusion"]
+    assert sends[0].arg["cache_key"] == node._section_key(POST, PLAN[0])
+
+    result = node.synthesizer({**state, "completed_sections": ["new intro", "new conclusion"]})
+    assert result["draft_sections"] == ["new intro", "cached main", "new conclusion"]
+
+
+def test_second_post_on_the_same_topic_reuses_every_section():
+    graph = BlogGraphBuilder(fake_llm(), memory=InMemorySaver()).build_graph()
+
+    def write_post():
+        config = {"configurable": {"thread_id": uuid.uuid4().hex}}
+        nodes = [node for update in graph.stream({"messages": [HumanMessage(content=REQUIREMENTS)]}, config,
+                                                 stream_mode="updates") for node in update]
+        return nodes, graph.get_state(config).values["draft_sections"]
+
+    first_nodes, first_draft = write_post()
+    second_nodes, second_draft = write_post()
+    assert first_nodes.count("llm_call") == 3
+    assert "llm_call" not in second_nodes
+    assert second_draft == first_draft
@@ -0,0 +1,109 @@
+# tests/test_blog_section_mode.py
+import asyncio
+import uuid
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langgraph.checkpoint.memory import InMemorySaver
+
+from src.langgraphagenticai.LLMS.fakellm import FakeChatModel
+from src.langgraphagenticai.graph.graph_builder_blog import BlogGraphBuilder
+from src.langgraphagenticai.nodes.blog_generation_node import BlogGenerationNode
+from src.langgraphagenticai.state.state import Section, SectionDraft, SectionDrafts
+from src.langgraphagenticai.ui.uiconfigfile import Config
+
+REQUIREMENTS = "Topic: Caching\nObjective: Informative\nTarget Audience: Engineers\nTone & Style: Casual\nWord Count: 600"
+
+
+@pytest.fixture(autouse=True)
+def no_section_cache(monkeypatch):
+    monkeypatch.setattr(Config, "get_blog_section_cache", lambda self: False)
+
+
+def fake_llm() -> FakeChatModel:
+    return FakeChatModel(latency="fixed:0", tokens_per_second=1e9)
+
+
+def plan(count: int):
+    return [Section(name=f"Part {i}", description=f"About part {i}") for i in range(1, count + 1)]
+
+
+def node_with(model=None, mode="auto", min_sections=6, budget=0) -> BlogGenerationNode:
+    node = BlogGenerationNode(model or fake_llm())
+    node.section_mode_setting = mode
+    node.batch_min_sections = min_sections
+    node.multi_section_budgets = {"default": budget}
+    return node
+
+
+@pytest.mark.parametrize("mode", ["fanout", "batch", "multi"])
+def test_explicit_mode_is_used_for_any_plan(mode):
+    assert node_with(mode=mode).section_mode({"sections": plan(1)}) == mode
+
+
+def test_auto_mode_picks_by_plan_length_and_output_budget():
+    state = {"sections": plan(6), "word_count": 1200}
+    assert node_with(min_sections=7).section_mode(state) == "fanout"
+    # 1200 words is about 1600 tokens, plus 40 per section for the JSON envelope
+    assert node_with(budget=1840).section_mode(state) == "multi"
+    assert node_with(budget=1839).section_mode(state) == "batch"
+
+
+def test_assign_workers_fans_out_or_hands_over_to_batch_sections():
+    state = {"sections": plan(3)}
+    sends = node_with(mode="fanout").assign_workers(state)
+    assert [send.arg["section"].name for send in sends] == ["Part 1", "Part 2", "Part 3"]
+    assert node_with(mode="batch").assign_workers(state) == "batch_sections"
+    assert node_with(mode="multi").assign_workers(state) == "batch_sections"
+
+
+def test_batch_mode_writes_sections_in_plan_order(fake_model):
+    model = fake_model(content="{prompt}")
+    result = node_with(model, mode="batch").batch_sections({"sections": plan(4)})
+    assert [content.split(": ", 1)[1].split(" and")[0] for content in result["completed_sections"]] == [
+        "Part 1", "Part 2", "Part 3", "Part 4"]
+
+
+def test_async_batch_mode_writes_sections_in_plan_order(fake_model):
+    model = fake_model(content="{prompt}", delay=0.01)
+    result = asyncio.run(node_with(model, mode="batch").abatch_sections({"sections": plan(3)}))
+    assert len(result["completed_sections"]) == 3
+    assert all(f"Part {i}" in content for i, content in enumerate(result["completed_sections"], 1))
+
+
+def test_multi_mode_parses_one_structured_call_into_sections():
+    result = node_with(mode="multi").batch_sections({"sections": plan(3)})
+    assert [content.splitlines()[0] for content in result["completed_sections"]] == ["## Part 1", "## Part 2", "## Part 3"]
+
+
+def test_multi_section_drafts_are_ordered_by_the_plan():
+    node = node_with()
+    sections = plan(2)
+    drafts = SectionDrafts(sections=[SectionDraft(name="part 2 ", content="two"), SectionDraft(name="Part 1", content="one")])
+    assert node._multi_section_contents(sections, drafts) == ["one", "two"]
+    # Renamed sections are matched by position when the counts agree
+    renamed = SectionDrafts(sections=[SectionDraft(name="Intro", content="one"), SectionDraft(name="Body", content="two")])
+    assert node._multi_section_contents(sections, renamed) == ["one", "two"]
+    with pytest.raises(ValueError):
+        node._multi_section_contents(sections, SectionDrafts(sections=[SectionDraft(name="Part 1", content="one")]))
+
+
+def test_multi_mode_falls_back_to_a_batch_call(fake_model):
+    # The scripted model answers text, so the structured multi-section call fails to parse
+    model = fake_model(content="{prompt}")
+    result = node_with(model, mode="multi").batch_sections({"sections": plan(2)})
+    assert len(result["completed_sections"]) == 2
+    assert "Part 2" in result["completed_sections"][1]
+
+
+@pytest.mark.parametrize("mode, node_name", [("fanout", "llm_call"), ("batch", "batch_sections"), ("multi", "batch_sections")])
+def test_graph_routes_sections_by_mode(monkeypatch, mode, node_name):
+    monkeypatch.setattr(Config, "get_blog_section_mode", lambda self: mode)
+    graph = BlogGraphBuilder(fake_llm(), memory=InMemorySaver()).build_graph()
+    config = {"configurable": {"thread_id": uuid.uuid4().hex}}
+    nodes = [node for update in graph.stream({"messages": [HumanMessage(content=REQUIREMENTS)]}, config,
+                                             stream_mode="updates") for node in update]
+
+    other = "batch_sections" if node_name == "llm_call" else "llm_call"
+    assert node_name in nodes and other not in nodes
+    assert len(graph.get_state(config).values["draft_sections"]) == 3
@@ -0,0 +1,90 @@
+# tests/test_checkpoint_blobs.py
+import pytest
+
+from src.langgraphagenticai.graph.checkpoint_blobs import (BLOB_MARKER, BLOB_TYPE, BlobStoreSerializer, CasBlobStore,
+                                                          referenced_blobs, zstandard)
+
+CODECS = ["zlib", pytest.param("zstd", marks=pytest.mark.skipif(zstandard is None, reason="zstandard not installed"))]
+
+
+@pytest.fixture
+def store(tmp_path):
+    return CasBlobStore(str(tmp_path / "checkpoints.sqlite"), codec="zlib")
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_put_get_round_trip(tmp_path, codec):
+    store = CasBlobStore(str(tmp_path / "checkpoints.sqlite"), codec=codec)
+    text = "design document\n" * 500 + "é✓"
+    digest = store.put(text)
+    store._cache.clear()
+    assert store.get(digest) == text
+    assert store.stats()["codec"] == codec
+
+
+def test_identical_text_is_stored_once(store):
+    text = "artifact " * 1000
+    assert store.put(text) == store.put(text)
+    stats = store.stats()
+    assert stats["stored"] == 1
+    assert stats["reused"] == 1
+    assert stats["stored_bytes"] < stats["raw_bytes"]
+
+
+def test_blob_written_with_one_codec_reads_with_another(tmp_path):
+    db_path = str(tmp_path / "checkpoints.sqlite")
+    digest = CasBlobStore(db_path, codec="zlib").put("x" * 5000)
+    assert CasBlobStore(db_path, codec="zstd").get(digest) == "x" * 5000
+
+
+def test_serializer_round_trip_keeps_checkpoints_small(store):
+    serde = BlobStoreSerializer(store, min_size=100)
+    artifact = "requirements " * 100
+    checkpoint = {"v": 1, "channel_values": {"artifact": artifact, "stage": "design", "count": 3}}
+    type_, data = serde.dumps_typed(checkpoint)
+    assert artifact.encode() not in data
+    assert serde.loads_typed((type_, data)) == checkpoint
+
+
+def test_large_write_is_stored_as_hash(store):
+    serde = BlobStoreSerializer(store, min_size=100)
+    type_, data = serde.dumps_typed("draft " * 100)
+    assert type_ == BLOB_TYPE
+    assert len(data) == 64
+    assert serde.loads_typed((type_, data)) == "draft " * 100
+    assert serde.loads_typed(serde.dumps_typed("short")) == "short"
+
+
+def test_referenced_blobs_finds_checkpoint_and_write_hashes(store):
+    serde = BlobStoreSerializer(store, min_size=100)
+    in_checkpoint = serde.dumps_typed({"channel_values": {"a": "a" * 200, "b": "b" * 200}})
+    in_write = serde.dumps_typed("c" * 200)
+    live = referenced_blobs([in_checkpoint, in_write, (None, None), serde.dumps_typed("small")])
+    assert live == {store.put("a" * 200), store.put("b" * 200), store.put("c" * 200)}
+
+
+def test_collect_deletes_unreferenced_blobs(store):
+    kept = store.put("kept " * 1000)
+    dropped = store.put("dropped " * 1000)
+    assert store.collect({kept}, grace=0) == 1
+    assert store.get(kept) == "kept " * 1000
+    with pytest.raises(KeyError):
+        store.get(dropped)
+    assert store.stats()["collected"] == 1
+
+
+def test_collect_spares_recently_written_blobs(store):
+    digest = store.put("just serialized " * 1000)
+    # Its checkpoint may not be committed yet, so it is not live but must survive the grace period.
+    assert store.collect(set(), grace=60.0) == 0
+    assert store.get(digest)
+
+
+def test_checkpoint_placeholder_loads_after_read_cache_eviction(tmp_path):
+    store = CasBlobStore(str(tmp_path / "checkpoints.sqlite"), codec="zlib", read_cache_size=1)
+    serde = BlobStoreSerializer(store, min_size=10)
+    values = {f"k{i}": f"value {i} " * 10 for i in range(3)}
+    data = serde.dumps_typed({"channel_values": values})
+    assert BLOB_MARKER.encode() in data[1]
+    assert serde.loads_typed(data)["channel_values"] == values
+    assert len(store._cache) == 1
@@ -0,0 +1,91 @@
+# tests/test_checkpoint_retention.py
+import operator
+from typing import Annotated, TypedDict
+
+import pytest
+from langgraph.graph import END, START, StateGraph
+
+from src.langgraphagenticai.graph.checkpoint_retention import RetentionPolicy
+from src.langgraphagenticai.graph.checkpointer import RetainingMemorySaver, SqliteCheckpointer
+
+
+class State(TypedDict, total=False):
+    log: Annotated[list, operator.add]
+    draft_approved: bool
+
+
+def build_graph(saver, approve_on=None):
+    def write(state):
+        update = {"log": [len(state.get("log", []))]}
+        if approve_on is not None and len(state.get("log", [])) + 1 == approve_on:
+            update["draft_approved"] = True
+        return update
+
+    builder = StateGraph(State)
+    builder.add_node("write", write)
+    builder.add_edge(START, "write")
+    builder.add_edge("write", END)
+    return builder.compile(checkpointer=saver)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_saver(request, tmp_path):
+    def make(policy):
+        if request.param == "memory":
+            return RetainingMemorySaver(policy)
+        return SqliteCheckpointer.from_path(str(tmp_path / "checkpoints.sqlite"), retention=policy)
+    return make
+
+
+def run(graph, thread_id, turns):
+    config = {"configurable": {"thread_id": thread_id}}
+    for _ in range(turns):
+        graph.invoke({"log": []}, config)
+    return config
+
+
+def checkpoints_per_turn():
+    saver = RetainingMemorySaver()
+    config = run(build_graph(saver), "t", 1)
+    return len(list(saver.list(config)))
+
+
+def test_keep_last_prunes_older_checkpoints(make_saver):
+    saver = make_saver(RetentionPolicy(keep_last=3))
+    graph = build_graph(saver)
+    config = run(graph, "t", 5)
+    assert len(list(saver.list(config))) == 3
+    assert saver.retention_stats()["pruned"] == 5 * checkpoints_per_turn() - 3
+    # The state is still complete after pruning.
+    assert graph.get_state(config).values["log"] == [0, 1, 2, 3, 4]
+
+
+def test_no_limit_keeps_every_checkpoint(make_saver):
+    saver = make_saver(RetentionPolicy())
+    config = run(build_graph(saver), "t", 4)
+    assert len(list(saver.list(config))) == 4 * checkpoints_per_turn()
+    assert saver.retention_stats()["pruned"] == 0
+
+
+def test_acceptance_compacts_to_one_checkpoint(make_saver):
+    saver = make_saver(RetentionPolicy(keep_last=10, compact_on_accept=True))
+    graph = build_graph(saver, approve_on=3)
+    config = run(graph, "t", 3)
+    stats = saver.retention_stats()
+    assert stats["compactions"] == 1
+    assert stats["pruned"] == 3 * checkpoints_per_turn() - 1
+    assert len(list(saver.list(config))) == 1
+    assert graph.get_state(config).values == {"log": [0, 1, 2], "draft_approved": True}
+
+
+def test_max_bytes_evicts_least_recently_written_threads(make_saver):
+    saver = make_saver(RetentionPolicy(max_bytes=1))
+    graph = build_graph(saver)
+    for thread_id in ("a", "b", "c"):
+        run(graph, thread_id, 1)
+    stats = saver.retention_stats()
+    assert stats["evicted_threads"] == 2
+    assert stats["threads"] == 1
+    assert not list(saver.list({"configurable": {"thread_id": "a"}}))
+    assert list(saver.list({"configurable": {"thread_id": "c"}}))
+
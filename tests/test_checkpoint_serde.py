@@ -0,0 +1,72 @@
+# tests/test_checkpoint_serde.py
+import datetime
+import uuid
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage, SystemMessage, ToolMessage
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from src.langgraphagenticai.graph.checkpoint_serde import COMPACT_TYPE, CompactSerializer, build_serde
+from src.langgraphagenticai.state.state import SDLCStages, Section, SectionDraft
+
+MESSAGES = [
+    SystemMessage(content="You are a planner."),
+    HumanMessage(content="Write a blog on caching", id="h1"),
+    AIMessage(content="", id="a1", tool_calls=[{"name": "search", "args": {"q": "cache"}, "id": "call-1"}],
+              usage_metadata={"input_tokens": 10, "output_tokens": 5, "total_tokens": 15}),
+    ToolMessage(content="results", tool_call_id="call-1", name="search"),
+    AIMessage(content=[{"type": "text", "text": "Done"}], response_metadata={"model_name": "fake"}),
+    RemoveMessage(id="h1"),
+]
+
+
+@pytest.fixture
+def serde():
+    return CompactSerializer()
+
+
+def test_messages_round_trip(serde):
+    type_, data = serde.dumps_typed({"messages": MESSAGES})
+    assert type_ == COMPACT_TYPE
+    assert serde.loads_typed((type_, data))["messages"] == MESSAGES
+
+
+def test_models_and_enums_round_trip(serde):
+    state = {
+        "sections": [Section(name="Intro", description="Why caching")],
+        "completed_sections": [SectionDraft(name="Intro", content="# Intro\ntext")],
+        "stage": SDLCStages.DESIGN,
+    }
+    loaded = serde.loads_typed(serde.dumps_typed(state))
+    assert loaded == state
+    assert type(loaded["stage"]) is SDLCStages
+
+
+def test_other_types_use_default_encoding(serde):
+    value = {"tags": {"a", "b"}, "id": uuid.uuid4(),
+             "at": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc), 1: ["int key", 2]}
+    assert serde.loads_typed(serde.dumps_typed(value)) == value
+
+
+def test_compact_is_smaller_than_jsonplus(serde):
+    state = {"messages": MESSAGES * 10, "sections": [Section(name=f"s{i}", description="d") for i in range(10)]}
+    assert len(serde.dumps_typed(state)[1]) < len(JsonPlusSerializer().dumps_typed(state)[1])
+
+
+def test_reads_checkpoints_written_by_jsonplus(serde):
+    state = {"messages": MESSAGES, "stage": SDLCStages.TESTING, "sections": [Section(name="a", description="b")]}
+    assert serde.loads_typed(JsonPlusSerializer().dumps_typed(state)) == state
+
+
+@pytest.mark.parametrize("value", [None, b"raw bytes"])
+def test_none_and_bytes_fall_through(serde, value):
+    type_, data = serde.dumps_typed(value)
+    assert type_ != COMPACT_TYPE
+    assert serde.loads_typed((type_, data)) == value
+
+
+def test_build_serde():
+    assert isinstance(build_serde("compact"), CompactSerializer)
+    assert type(build_serde("jsonplus")) is JsonPlusSerializer
+    with pytest.raises(ValueError):
+        build_serde("pickle")
@@ -0,0 +1,135 @@
+# tests/test_coalescing_llm.py
+import asyncio
+import threading
+import time
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.langgraphagenticai.LLMS.coalescing_llm import CoalescingChatModel, coalescing_stats
+
+
+@pytest.fixture
+def inner(fake_model):
+    return fake_model(content="answer to {prompt}", delay=0.3)
+
+
+def run_in_thread(target):
+    thread = threading.Thread(target=target)
+    thread.start()
+    return thread
+
+
+def test_concurrent_async_calls_share_one_upstream_call(inner):
+    model = CoalescingChatModel(inner=inner)
+
+    async def main():
+        return await asyncio.gather(*(model.ainvoke([HumanMessage(content="same")]) for _ in range(3)))
+
+    before = coalescing_stats()
+    answers = asyncio.run(main())
+    after = coalescing_stats()
+    assert inner.calls == ["same"]
+    assert [a.content for a in answers] == ["answer to same"] * 3
+    assert after["coalesced"] - before["coalesced"] == 2
+    # Each waiter gets its own copy.
+    assert answers[1] is not answers[2]
+
+
+def test_concurrent_sync_calls_share_one_upstream_call(inner):
+    model = CoalescingChatModel(inner=inner)
+    answers = []
+    threads = [run_in_thread(lambda: answers.append(model.invoke([HumanMessage(content="sync")])))
+               for _ in range(3)]
+    for thread in threads:
+        thread.join()
+    assert inner.calls == ["sync"]
+    assert [a.content for a in answers] == ["answer to sync"] * 3
+
+
+def test_different_requests_are_not_coalesced(inner):
+    model = CoalescingChatModel(inner=inner, key_scope="key-a")
+    other_key = CoalescingChatModel(inner=inner, key_scope="key-b")
+
+    async def main():
+        await asyncio.gather(model.ainvoke([HumanMessage(content="one")]), model.ainvoke([HumanMessage(content="two")]),
+                             other_key.ainvoke([HumanMessage(content="one")]))
+
+    asyncio.run(main())
+    assert sorted(inner.calls) == ["one", "one", "two"]
+
+
+def test_leader_cancelled_on_its_own_loop_does_not_fail_other_waiters(inner):
+    model = CoalescingChatModel(inner=inner)
+    outcome = {}
+
+    def leader():
+        async def main():
+            task = asyncio.ensure_future(model.ainvoke([HumanMessage(content="shared")]))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            outcome["leader"] = "cancelled"
+        # The leader's loop is closed right after, as a finished graph run's loop would be.
+        asyncio.run(main())
+
+    def follower():
+        time.sleep(0.02)
+        answer = asyncio.run(asyncio.wait_for(model.ainvoke([HumanMessage(content="shared")]), timeout=3))
+        outcome["follower"] = answer.content
+
+    for thread in [run_in_thread(leader), run_in_thread(follower)]:
+        thread.join()
+    assert outcome == {"leader": "cancelled", "follower": "answer to shared"}
+    assert inner.calls == ["shared"]
+    assert inner.cancelled == []
+
+
+def test_upstream_call_is_cancelled_when_every_waiter_is(inner):
+    model = CoalescingChatModel(inner=inner, key_scope="cancel-all")
+
+    async def main():
+        tasks = [asyncio.ensure_future(model.ainvoke([HumanMessage(content="abandoned")])) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    before = coalescing_stats()
+    asyncio.run(main())
+    deadline = time.monotonic() + 2
+    while not inner.cancelled and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert inner.calls == ["abandoned"]
+    assert inner.cancelled == ["abandoned"]
+    stats = coalescing_stats()
+    assert stats["cancelled"] - before["cancelled"] == 1
+    assert stats["in_flight"] == 0
+
+
+def test_upstream_error_reaches_every_waiter(fake_model):
+    inner = fake_model(delay=0.3, failures=1, error=lambda: RuntimeError("upstream failed"))
+    model = CoalescingChatModel(inner=inner, key_scope="errors")
+
+    async def main():
+        return await asyncio.gather(*(model.ainvoke([HumanMessage(content="boom")]) for _ in range(2)),
+                                    return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert [str(r) for r in results] == ["upstream failed"] * 2
+    assert inner.calls == ["boom"]
+    assert coalescing_stats()["in_flight"] == 0
+
+
+def test_requests_differing_only_in_message_ids_share_one_call(inner):
+    model = CoalescingChatModel(inner=inner, key_scope="ids")
+
+    async def main():
+        # Each session's graph state assigns its own ids to otherwise identical messages.
+        return await asyncio.gather(*(model.ainvoke([HumanMessage(content="hello", id=f"session-{n}")])
+                                      for n in range(2)))
+
+    answers = asyncio.run(main())
+    assert inner.calls == ["hello"]
+    assert [a.content for a in answers] == ["answer to hello"] * 2
@@ -0,0 +1,150 @@
+# tests/test_hedged_llm.py
+import asyncio
+import time
+import uuid
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.langgraphagenticai.LLMS.hedged_llm import CircuitBreaker, HedgedChatModel, LatencyTracker, hedge_stats
+
+PROMPT = [HumanMessage(content="hi")]
+
+
+def hedged(*backends, **kwargs) -> HedgedChatModel:
+    # Breakers and latency windows are process-wide per label, so every test gets fresh labels.
+    labels = [f"backend{index}-{uuid.uuid4().hex[:8]}" for index in range(len(backends))]
+    return HedgedChatModel(models=list(backends), labels=labels, initial_hedge_delay=0.1, **kwargs)
+
+
+@pytest.fixture
+def backend(fake_model):
+    """A backend answering "from <name>"; `fail=True` makes every call raise ConnectionError."""
+
+    def make(name: str, delay: float = 0.0, fail: bool = False):
+        return fake_model(content=f"from {name}", delay=delay, failures=10 ** 6 if fail else 0,
+                          error=lambda: ConnectionError(f"{name} is down"))
+
+    return make
+
+
+def collect_stream(model: HedgedChatModel) -> str:
+    return "".join(chunk.content for chunk in model.stream(PROMPT))
+
+
+async def acollect_stream(model: HedgedChatModel) -> str:
+    return "".join([chunk.content async for chunk in model.astream(PROMPT)])
+
+
+def stats_delta(before, after):
+    return {key: after[key] - before[key] for key in ("calls", "hedges", "failovers", "secondary_wins")}
+
+
+CALLS = {
+    "invoke": lambda model: model.invoke(PROMPT).content,
+    "ainvoke": lambda model: asyncio.run(model.ainvoke(PROMPT)).content,
+    "stream": collect_stream,
+    "astream": lambda model: asyncio.run(acollect_stream(model)),
+}
+
+
+@pytest.mark.parametrize("call", CALLS)
+def test_fast_primary_answers_without_hedging(call, backend):
+    before = hedge_stats()
+    assert CALLS[call](hedged(backend("primary"), backend("secondary"))) == "from primary"
+    assert stats_delta(before, hedge_stats()) == {"calls": 1, "hedges": 0, "failovers": 0, "secondary_wins": 0}
+
+
+@pytest.mark.parametrize("call", CALLS)
+def test_slow_primary_is_hedged_and_secondary_wins(call, backend):
+    before = hedge_stats()
+    model = hedged(backend("primary", delay=1.0), backend("secondary"))
+    started = time.monotonic()
+    assert CALLS[call](model) == "from secondary"
+    assert time.monotonic() - started < 0.8
+    assert stats_delta(before, hedge_stats()) == {"calls": 1, "hedges": 1, "failovers": 0, "secondary_wins": 1}
+
+
+@pytest.mark.parametrize("call", CALLS)
+def test_failing_primary_fails_over(call, backend):
+    before = hedge_stats()
+    assert CALLS[call](hedged(backend("primary", fail=True), backend("secondary"))) == "from secondary"
+    assert stats_delta(before, hedge_stats()) == {"calls": 1, "hedges": 0, "failovers": 1, "secondary_wins": 1}
+
+
+@pytest.mark.parametrize("call", CALLS)
+def test_error_is_raised_when_every_backend_fails(call, backend):
+    with pytest.raises(ConnectionError):
+        CALLS[call](hedged(backend("primary", fail=True), backend("secondary", fail=True)))
+
+
+def test_open_breaker_takes_backend_out_of_rotation(backend):
+    model = hedged(backend("primary", fail=True), backend("secondary"), failure_threshold=2)
+    for _ in range(2):
+        assert model.invoke(PROMPT).content == "from secondary"
+    assert hedge_stats()["backends"][model.labels[0]]["breaker"] == "open"
+    before = hedge_stats()
+    assert model.invoke(PROMPT).content == "from secondary"
+    # The primary was skipped, so there was nothing to fail over from.
+    assert stats_delta(before, hedge_stats())["failovers"] == 0
+
+
+def test_breaker_opens_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60.0)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed" and breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_probe_decides():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+    breaker.opened_at -= 60.0
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    # Only one probe per period.
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == "open" and not breaker.allow()
+
+    breaker.opened_at -= 60.0
+    breaker.probe_started -= 60.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed" and breaker.failures == 0
+
+
+def test_unsent_probe_expires_after_one_period():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60.0)
+    breaker.record_failure()
+    breaker.opened_at -= 120.0
+    assert breaker.allow()
+    breaker.probe_started -= 60.0
+    assert breaker.allow()
+
+
+def test_latency_percentile_needs_enough_samples():
+    tracker = LatencyTracker(window=100)
+    for sample in range(1, 11):
+        tracker.record(sample / 10)
+    assert tracker.percentile(95) is None
+    assert tracker.percentile(50, min_samples=10) == pytest.approx(0.5)
+    assert tracker.percentile(95, min_samples=10) == pytest.approx(1.0)
+    for _ in range(200):
+        tracker.record(0.01)
+    # The window only keeps recent samples.
+    assert tracker.percentile(95) == pytest.approx(0.01)
+
+
+def test_hedge_delay_follows_observed_latency(backend):
+    model = hedged(backend("primary"), backend("secondary"), min_hedge_delay=0.05)
+    assert model._hedge_delay(0) == 0.1
+    for _ in range(20):
+        model._record(0, time.monotonic() - 0.3, None)
+    assert model._hedge_delay(0) == pytest.approx(0.3, abs=0.05)
@@ -0,0 +1,101 @@
+# tests/test_llm_registry.py
+from types import SimpleNamespace
+
+import pytest
+
+from src.langgraphagenticai.LLMS import llm_registry as registry_module
+from src.langgraphagenticai.LLMS.llm_registry import LLMClientRegistry, hash_api_key
+
+
+class Client:
+    def __init__(self):
+        self.closed = 0
+
+    def close(self):
+        self.closed += 1
+
+
+class AsyncClient(Client):
+    def close(self):
+        async def aclose():
+            self.closed += 1
+        return aclose()
+
+
+def make_model():
+    """Stand-in for a chat model: ChatOpenAI-style root clients and a ChatGroq-style wrapped client."""
+    return SimpleNamespace(root_client=Client(), root_async_client=AsyncClient(), client=SimpleNamespace(_client=Client()))
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(registry_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_api_keys_are_hashed():
+    fingerprint = hash_api_key("sk-secret")
+    assert len(fingerprint) == 16 and "secret" not in fingerprint
+    assert hash_api_key("sk-secret") == fingerprint
+    assert hash_api_key("sk-other") != fingerprint
+    assert hash_api_key(None) == hash_api_key("")
+
+
+def test_clients_are_shared_per_provider_model_and_key():
+    registry = LLMClientRegistry()
+    first = registry.get_or_create("groq", "llama", "key a", make_model)
+    assert registry.get_or_create("groq", "llama", "key a", make_model) is first
+    assert registry.get_or_create("groq", "llama", "key b", make_model) is not first
+    assert registry.get_or_create("groq", "mixtral", "key a", make_model) is not first
+    assert registry.get_or_create("openai", "llama", "key a", make_model) is not first
+    assert all("key a" not in key for entry in registry._entries for key in entry)
+    assert registry.stats() == {"hits": 1, "misses": 4, "evictions": 0, "size": 4, "hit_rate": 0.2}
+
+
+def test_idle_clients_are_closed_on_the_next_lookup(clock):
+    registry = LLMClientRegistry(idle_ttl=60)
+    idle = registry.get_or_create("groq", "llama", "key", make_model)
+    clock[0] += 30
+    busy = registry.get_or_create("groq", "mixtral", "key", make_model)
+    clock[0] += 40
+    assert registry.get_or_create("groq", "mixtral", "key", make_model) is busy
+
+    assert registry.stats()["evictions"] == 1
+    assert (idle.root_client.closed, idle.root_async_client.closed, idle.client._client.closed) == (1, 0, 1)
+    assert busy.root_client.closed == 0
+    assert registry.get_or_create("groq", "llama", "key", make_model) is not idle
+
+
+def test_zero_idle_ttl_never_evicts(clock):
+    registry = LLMClientRegistry(idle_ttl=0)
+    model = registry.get_or_create("groq", "llama", "key", make_model)
+    clock[0] += 10 ** 6
+    assert registry.get_or_create("groq", "llama", "key", make_model) is model
+    assert registry.evict_idle() == 0
+
+
+def test_close_and_close_all_release_every_client():
+    registry = LLMClientRegistry()
+    one = registry.get_or_create("groq", "llama", "key", make_model)
+    two = registry.get_or_create("openai", "gpt-4o", "key", make_model)
+
+    assert registry.close("groq", "llama", "key")
+    assert not registry.close("groq", "llama", "key")
+    assert one.root_client.closed == 1
+
+    registry.close_all()
+    assert (two.root_client.closed, two.client._client.closed) == (1, 1)
+    assert one.root_client.closed == 1
+    assert registry.stats()["size"] == 0
+
+
+def test_close_errors_do_not_stop_the_shutdown():
+    class Broken(Client):
+        def close(self):
+            raise RuntimeError("already closed")
+
+    registry = LLMClientRegistry()
+    broken = registry.get_or_create("groq", "llama", "key", lambda: SimpleNamespace(root_client=Broken(), client=Client()))
+    registry.close_all()
+    assert broken.client.closed == 1
@@ -0,0 +1,92 @@
+# tests/test_message_log.py
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, RemoveMessage
+from langgraph.graph import END, START, StateGraph
+
+from src.langgraphagenticai.graph.checkpoint_retention import CheckpointRetentionMixin, RetentionPolicy
+from src.langgraphagenticai.graph.checkpointer import RetainingMemorySaver, SqliteCheckpointer
+from src.langgraphagenticai.state.state import append_message_batches, message_log_state
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_saver(request, tmp_path):
+    def make(policy=None):
+        policy = policy or RetentionPolicy()
+        if request.param == "memory":
+            return RetainingMemorySaver(policy)
+        return SqliteCheckpointer.from_path(str(tmp_path / "checkpoints.sqlite"), retention=policy)
+    return make
+
+
+def build_chat(saver, snapshot_every=4):
+    builder = StateGraph(message_log_state(snapshot_every=snapshot_every))
+    builder.add_node("reply", lambda state: {"messages": [AIMessage(content=f"reply {len(state['messages'])}")]})
+    builder.add_edge(START, "reply")
+    builder.add_edge("reply", END)
+    return builder.compile(checkpointer=saver)
+
+
+def chat(graph, thread_id, turns):
+    config = {"configurable": {"thread_id": thread_id}}
+    for turn in range(turns):
+        graph.invoke({"messages": [HumanMessage(content=f"turn {turn}")]}, config)
+    return config
+
+
+def transcript(turns):
+    return [text for turn in range(turns) for text in (f"turn {turn}", f"reply {2 * turn + 1}")]
+
+
+def test_batches_apply_like_successive_add_messages():
+    first, second = HumanMessage(content="hi", id="1"), AIMessage(content="hello", id="2")
+    log = append_message_batches([], [[first], second])
+    assert [m.content for m in log] == ["hi", "hello"]
+    edited = append_message_batches(log, [[AIMessage(content="hello!", id="2")], [HumanMessage(content="bye", id="3")]])
+    assert [m.content for m in edited] == ["hi", "hello!", "bye"]
+    assert [m.id for m in append_message_batches(edited, [[RemoveMessage(id="1")]])] == ["2", "3"]
+
+
+def test_state_schema_is_shared_per_snapshot_interval():
+    assert message_log_state(4) is message_log_state(4)
+    assert message_log_state(4) is not message_log_state(8)
+
+
+def test_log_replays_across_snapshots(make_saver):
+    saver = make_saver()
+    graph = build_chat(saver, snapshot_every=4)
+    config = chat(graph, "chat", 11)
+
+    assert [m.content for m in graph.get_state(config).values["messages"]] == transcript(11)
+    # Every earlier checkpoint rebuilds the conversation as it was at that point
+    for snapshot in graph.get_state_history(config):
+        messages = snapshot.values.get("messages", [])
+        assert [m.content for m in messages] == transcript(11)[:len(messages)]
+
+
+def test_log_resumes_from_a_new_saver_instance(tmp_path):
+    path = str(tmp_path / "checkpoints.sqlite")
+    chat(build_chat(SqliteCheckpointer.from_path(path)), "chat", 6)
+    graph = build_chat(SqliteCheckpointer.from_path(path))
+    config = chat(graph, "chat", 1)
+    assert [m.content for m in graph.get_state(config).values["messages"]][-2:] == ["turn 0", "reply 13"]
+    assert len(graph.get_state(config).values["messages"]) == 14
+
+
+def test_delta_chain_length_counts_supersteps_since_the_snapshot():
+    assert CheckpointRetentionMixin._delta_chain_length({}) == 1
+    assert CheckpointRetentionMixin._delta_chain_length(None) == 1
+    metadata = {"counters_since_delta_snapshot": {"messages": (3, 5), "other": (1, 2)}}
+    assert CheckpointRetentionMixin._delta_chain_length(metadata) == 6
+
+
+def test_retention_keeps_the_replay_chain(make_saver):
+    saver = make_saver(RetentionPolicy(keep_last=2))
+    graph = build_chat(saver, snapshot_every=4)
+    config = chat(graph, "chat", 10)
+
+    humans = [m.content for m in graph.get_state(config).values["messages"] if m.type == "human"]
+    assert humans == [f"turn {turn}" for turn in range(10)]
+    # Pruning still happens, but never below the checkpoints back to the last snapshot.
+    kept = len(list(saver.list(config)))
+    assert saver.retention_stats()["pruned"] > 0
+    assert 2 <= kept <= 4 + 1
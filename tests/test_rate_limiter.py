@@ -0,0 +1,115 @@
+# tests/test_rate_limiter.py
+import time
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.langgraphagenticai.LLMS.rate_limiter import (AdaptiveRateLimiter, RateLimitedChatModel, _TokenBucket,
+                                                      is_rate_limit_error)
+
+
+class RateLimitError(Exception):
+    def __init__(self, retry_after: float):
+        super().__init__("429 Too Many Requests")
+        self.status_code = 429
+        self.response = SimpleNamespace(headers={"retry-after": str(retry_after)})
+
+
+USAGE = {"input_tokens": 30, "output_tokens": 10, "total_tokens": 40}
+
+
+def test_token_bucket_refills_at_rate_per_second():
+    bucket = _TokenBucket(per_minute=60)
+    now = bucket.updated
+    bucket.consume(60)
+    assert bucket.wait_time(1, now) == pytest.approx(1.0)
+    assert bucket.wait_time(1, now + 1.0) == pytest.approx(0.0)
+    # Requests larger than the bucket wait for a full bucket, not forever.
+    assert bucket.wait_time(600, now + 1.0) == pytest.approx(59.0)
+
+
+def test_rate_limit_halves_factor_and_success_adds_step():
+    limiter = AdaptiveRateLimiter(rpm=100, tpm=10000)
+    limiter.on_rate_limited(retry_after=0.01)
+    assert limiter.factor == pytest.approx(0.5)
+    assert limiter.stats()["effective_rpm"] == 50
+    assert limiter.stats()["effective_tpm"] == 5000
+    limiter.on_success()
+    assert limiter.factor == pytest.approx(0.55)
+    for _ in range(20):
+        limiter.on_success()
+    assert limiter.factor == 1.0
+
+
+def test_concurrent_rejections_cut_the_factor_once_per_cooldown():
+    limiter = AdaptiveRateLimiter(rpm=100, tpm=10000)
+    for _ in range(5):
+        limiter.on_rate_limited(retry_after=30)
+    assert limiter.factor == pytest.approx(0.5)
+    assert limiter.rate_limited == 5
+    # After the cooldown the next 429 cuts again.
+    limiter._last_decrease -= 30
+    limiter.on_rate_limited(retry_after=30)
+    assert limiter.factor == pytest.approx(0.25)
+
+
+def test_factor_never_drops_below_min_factor():
+    limiter = AdaptiveRateLimiter(rpm=100, tpm=10000, min_factor=0.1)
+    for _ in range(10):
+        limiter.on_rate_limited(retry_after=0.01)
+        limiter._last_decrease = 0.0
+    assert limiter.factor == pytest.approx(0.1)
+
+
+def test_rate_limit_pauses_the_key_for_retry_after():
+    limiter = AdaptiveRateLimiter(rpm=1000, tpm=1000000)
+    assert limiter.on_rate_limited(retry_after=5) == pytest.approx(5, abs=0.05)
+    assert limiter._try_acquire(1) == pytest.approx(5, abs=0.05)
+    assert limiter.requests == 0
+
+
+def test_acquire_waits_for_the_token_budget():
+    limiter = AdaptiveRateLimiter(rpm=6000, tpm=6000)
+    assert limiter._try_acquire(6000) <= 0
+    # The token bucket is empty; 10 tokens refill in 0.1s at 100 tokens per second.
+    assert limiter._try_acquire(10) == pytest.approx(0.1, abs=0.01)
+    started = time.monotonic()
+    limiter.acquire(10)
+    assert time.monotonic() - started >= 0.09
+    assert limiter.requests == 2
+
+
+def test_reconcile_charges_the_actual_usage():
+    limiter = AdaptiveRateLimiter(rpm=60, tpm=1000)
+    limiter._try_acquire(100)
+    limiter.reconcile(estimated=100, actual=400)
+    assert limiter._tokens.level == pytest.approx(600, abs=1)
+
+
+def test_model_retries_after_429_and_adapts(fake_model):
+    limiter = AdaptiveRateLimiter(rpm=60000, tpm=10000000)
+    inner = fake_model(failures=1, error=lambda: RateLimitError(0.01), usage=USAGE)
+    model = RateLimitedChatModel(inner=inner, limiter=limiter)
+    assert model.invoke([HumanMessage(content="hi")]).content == "ok"
+    assert len(inner.calls) == 2
+    assert limiter.rate_limited == 1
+    assert limiter.factor == pytest.approx(0.55)
+
+
+def test_model_gives_up_after_max_retries(fake_model):
+    inner = fake_model(failures=10, error=lambda: RateLimitError(0.01))
+    model = RateLimitedChatModel(inner=inner, limiter=AdaptiveRateLimiter(rpm=60000, tpm=10000000), max_retries=2)
+    with pytest.raises(RateLimitError):
+        model.invoke([HumanMessage(content="hi")])
+    assert len(inner.calls) == 3
+
+
+@pytest.mark.parametrize("error, expected", [
+    (RateLimitError(1), True),
+    (type("ResourceExhausted", (Exception,), {})(), True),
+    (Exception("429 RESOURCE_EXHAUSTED"), True),
+    (ValueError("bad request"), False),
+])
+def test_is_rate_limit_error(error, expected):
+    assert is_rate_limit_error(error) is expected
@@ -0,0 +1,115 @@
+# tests/test_response_cache.py
+import json
+import sqlite3
+
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration
+
+from src.langgraphagenticai.LLMS import response_cache
+from src.langgraphagenticai.LLMS.response_cache import ResponseCache
+
+
+def generations(text: str):
+    return [ChatGeneration(message=AIMessage(content=text))]
+
+
+def answer(cache, prompt: str, llm_string: str = "model"):
+    value = cache.lookup(prompt, llm_string)
+    return value[0].message.content if value else None
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() of the response cache module."""
+    now = [1_000_000.0]
+    monkeypatch.setattr(response_cache.time, "time", lambda: now[0])
+    return now
+
+
+def test_key_covers_prompt_and_model():
+    key = ResponseCache.make_key("prompt", "model a")
+    assert ResponseCache.make_key("prompt", "model a") == key
+    assert ResponseCache.make_key("prompt", "model b") != key
+    assert ResponseCache.make_key("other prompt", "model a") != key
+
+
+def test_memory_tier_is_lru_with_ttl(clock):
+    cache = ResponseCache(max_entries=2, ttl=60)
+    cache.update("a", "model", generations("A"))
+    cache.update("b", "model", generations("B"))
+    answer(cache, "a")
+    cache.update("c", "model", generations("C"))
+    assert (answer(cache, "a"), answer(cache, "b"), answer(cache, "c")) == ("A", None, "C")
+    assert answer(cache, "a", "another model") is None
+
+    clock[0] += 61
+    assert answer(cache, "a") is None
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["misses"], stats["memory_entries"]) == (3, 3, 1)
+
+
+def test_disk_hits_survive_restarts_and_are_promoted(tmp_path, clock):
+    db_path = str(tmp_path / "responses.sqlite")
+    ResponseCache(db_path=db_path).update("a", "model", generations("A"))
+
+    reopened = ResponseCache(db_path=db_path, ttl=60, disk_ttl=3600)
+    assert answer(reopened, "a") == "A"
+    assert answer(reopened, "a") == "A"
+    assert (reopened.stats()["disk_hits"], reopened.stats()["memory_hits"]) == (1, 1)
+
+    clock[0] += 3601
+    assert answer(ResponseCache(db_path=db_path, disk_ttl=3600), "a") is None
+
+
+def test_writes_prune_expired_and_least_recently_used_rows(tmp_path, clock):
+    db_path = str(tmp_path / "responses.sqlite")
+    cache = ResponseCache(db_path=db_path, max_entries=1, disk_ttl=3600, max_disk_entries=2)
+    cache.update("a", "model", generations("A"))
+    clock[0] += 1
+    cache.update("b", "model", generations("B"))
+    clock[0] += 1
+    answer(cache, "a")  # a disk hit refreshes a's last use
+    clock[0] += 1
+    cache.update("c", "model", generations("C"))
+    assert cache.stats()["evictions"] == 1
+    assert [answer(ResponseCache(db_path=db_path), p) for p in "abc"] == ["A", None, "C"]
+
+    clock[0] += 3601
+    cache.update("d", "model", generations("D"))
+    assert cache.stats()["evictions"] == 3
+    assert sqlite3.connect(db_path).execute("SELECT COUNT(*) FROM llm_response_cache").fetchone() == (1,)
+
+
+def test_tables_without_last_used_are_migrated(tmp_path):
+    db_path = str(tmp_path / "responses.sqlite")
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE llm_response_cache (key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)")
+    conn.commit()
+    conn.close()
+
+    cache = ResponseCache(db_path=db_path)
+    cache.update("a", "model", generations("A"))
+    assert answer(ResponseCache(db_path=db_path), "a") == "A"
+
+
+def test_disk_entries_only_load_core_objects(tmp_path):
+    db_path = str(tmp_path / "responses.sqlite")
+    cache = ResponseCache(db_path=db_path)
+    cache.update("a", "model", generations("A"))
+    payload = json.dumps({"lc": 1, "type": "constructor", "id": ["langchain_openai", "chat_models", "ChatOpenAI"],
+                          "kwargs": {"model": "gpt-4o"}})
+    cache._conn.execute("UPDATE llm_response_cache SET response = ?", (payload,))
+    cache._conn.commit()
+
+    reopened = ResponseCache(db_path=db_path)
+    assert reopened.lookup("a", "model") is None
+    assert reopened.stats()["misses"] == 1
+
+
+def test_chat_model_answers_repeated_prompts_from_the_cache(fake_model):
+    model = fake_model(content="answer to {prompt}").model_copy(update={"cache": ResponseCache()})
+    assert model.invoke([HumanMessage(content="q")]).content == "answer to q"
+    assert model.invoke([HumanMessage(content="q")]).content == "answer to q"
+    assert model.invoke([HumanMessage(content="other")]).content == "answer to other"
+    assert model.calls == ["q", "other"]
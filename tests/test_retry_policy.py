@@ -0,0 +1,109 @@
+# tests/test_retry_policy.py
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import HumanMessage
+
+from src.langgraphagenticai.LLMS.retry_policy import RetryingChatModel, _StepDeadlines, is_retryable_error, retry_stats
+
+PROMPT = [HumanMessage(content="hi")]
+
+
+class ServerError(Exception):
+    status_code = 503
+
+
+class BadRequestError(Exception):
+    status_code = 400
+
+
+def retrying(inner, **kwargs) -> RetryingChatModel:
+    return RetryingChatModel(inner=inner, **{"base_delay": 0.001, "max_delay": 0.01, **kwargs})
+
+
+@pytest.mark.parametrize("error, expected", [
+    (TimeoutError(), True),
+    (ConnectionError(), True),
+    (ServerError(), True),
+    (type("APIConnectionError", (Exception,), {})(), True),
+    (BadRequestError(), False),
+    (type("RateLimitError", (Exception,), {"status_code": 429})(), False),
+    (ValueError("invalid schema"), False),
+])
+def test_is_retryable_error(error, expected):
+    assert is_retryable_error(error) is expected
+
+
+def test_transient_error_is_retried_and_recorded(fake_model):
+    inner = fake_model(failures=2, error=ServerError)
+    result = retrying(inner)._generate(PROMPT)
+    assert result.generations[0].message.content == "ok"
+    assert len(inner.calls) == 3
+    assert result.llm_output["retry_attempts"] == 3
+
+
+def test_non_retryable_error_fails_at_once(fake_model):
+    inner = fake_model(failures=1, error=BadRequestError)
+    with pytest.raises(BadRequestError) as raised:
+        retrying(inner).invoke(PROMPT)
+    assert len(inner.calls) == 1
+    assert raised.value.retry_metrics["retry_attempts"] == 1
+
+
+def test_gives_up_after_max_attempts(fake_model):
+    inner = fake_model(failures=10, error=ServerError)
+    before = retry_stats()
+    with pytest.raises(ServerError) as raised:
+        retrying(inner, max_attempts=3).invoke(PROMPT)
+    assert len(inner.calls) == 3
+    assert raised.value.retry_metrics["retry_attempts"] == 3
+    after = retry_stats()
+    assert after["gave_up"] - before["gave_up"] == 1
+    assert after["deadline_exceeded"] == before["deadline_exceeded"]
+
+
+def test_deadline_stops_retries_whose_backoff_would_overrun_it(fake_model):
+    inner = fake_model(failures=10, error=ServerError)
+    model = retrying(inner, max_attempts=5, base_delay=10.0, max_delay=10.0, step_deadline=0.5)
+    before = retry_stats()
+    started = time.monotonic()
+    with pytest.raises(ServerError):
+        model.invoke(PROMPT)
+    # wait_random_exponential can draw a short first sleep, but never retries past the deadline.
+    assert time.monotonic() - started < 0.6
+    assert len(inner.calls) < 5
+    assert retry_stats()["deadline_exceeded"] - before["deadline_exceeded"] == 1
+
+
+def test_async_attempt_is_cut_off_at_the_deadline(fake_model):
+    inner = fake_model(delay=2.0)
+    model = retrying(inner, step_deadline=0.2)
+    started = time.monotonic()
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(model.ainvoke(PROMPT))
+    assert time.monotonic() - started < 1.0
+
+
+def test_calls_of_one_graph_step_share_a_deadline():
+    deadlines = _StepDeadlines()
+    step = {"thread_id": "t", "langgraph_checkpoint_ns": "node:1", "langgraph_step": 3}
+    first = deadlines.deadline(step, 10.0)
+    time.sleep(0.01)
+    assert deadlines.deadline(step, 10.0) == first
+    assert deadlines.deadline({**step, "langgraph_step": 4}, 10.0) > first
+    assert deadlines.deadline({}, 10.0) > first
+    assert deadlines.deadline(step, 0) == float("inf")
+
+
+def test_step_deadlines_are_bounded():
+    deadlines = _StepDeadlines(max_entries=2)
+    for step in range(5):
+        deadlines.deadline({"langgraph_checkpoint_ns": "n", "langgraph_step": step}, 1.0)
+    assert len(deadlines._started) == 2
+
+
+def test_stream_is_retried_before_the_first_chunk(fake_model):
+    inner = fake_model(failures=1, error=ServerError)
+    assert "".join(chunk.content for chunk in retrying(inner).stream(PROMPT)) == "ok"
+    assert len(inner.calls) == 2
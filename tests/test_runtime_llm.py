@@ -0,0 +1,99 @@
+# tests/test_runtime_llm.py
+import asyncio
+import uuid
+
+import pytest
+from langchain_core.messages import HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import tool
+
+from src.langgraphagenticai.LLMS.model_router import ModelRouter
+from src.langgraphagenticai.LLMS.runtime_llm import RuntimeChatModel, runtime_configurable
+from src.langgraphagenticai.graph.graph_templates import GraphTemplateCache
+
+
+@tool
+def lookup(query: str) -> str:
+    """Look something up."""
+    return query
+
+
+def run_config(model, router=None) -> dict:
+    return {"configurable": {"thread_id": uuid.uuid4().hex, **runtime_configurable(model, router)}}
+
+
+def in_run(model):
+    """Call `model` from inside a run, the way graph nodes do, so the run's config is in context."""
+    return RunnableLambda(lambda messages: model.invoke(messages))
+
+
+def last_reply(graph, model, text: str) -> str:
+    state = graph.invoke({"messages": [HumanMessage(content=text)]}, run_config(model))
+    return state["messages"][-1].content
+
+
+def test_sessions_sharing_a_template_use_their_own_models(fake_model):
+    templates = GraphTemplateCache(shared=True)
+    graph = templates.get("Basic Chatbot", "Fake", "scripted")
+    assert templates.get("Basic Chatbot", "Fake", "scripted") is graph
+    assert templates.stats() == {"builds": 1, "hits": 1, "templates": 1}
+
+    alice, bob = fake_model(content="alice's model"), fake_model(content="bob's model")
+    assert last_reply(graph, alice, "hi") == "alice's model"
+    assert last_reply(graph, bob, "hi") == "bob's model"
+    assert last_reply(graph, alice, "again") == "alice's model"
+    assert alice.calls == ["hi", "again"]
+    assert bob.calls == ["hi"]
+
+
+def test_templates_are_keyed_by_usecase_model_and_scope():
+    templates = GraphTemplateCache(shared=True)
+    graph = templates.get("Basic Chatbot", "Fake", "a")
+    assert templates.get("Basic Chatbot", "Fake", "b") is not graph
+    assert templates.get("Basic Chatbot", "Fake", "a", scope="other key") is not graph
+    assert templates.get("Basic Chatbot", "Fake", "a", use_async=True) is not graph
+
+
+def test_unshared_cache_compiles_every_time():
+    templates = GraphTemplateCache(shared=False)
+    assert templates.get("Basic Chatbot", "Fake", "a") is not templates.get("Basic Chatbot", "Fake", "a")
+    assert templates.stats()["templates"] == 0
+
+
+def test_calls_resolve_the_model_of_the_run(fake_model):
+    model = fake_model(content="session answer")
+    runtime = RuntimeChatModel()
+    assert in_run(runtime).invoke([HumanMessage(content="q")], run_config(model)).content == "session answer"
+
+    async def node(messages):
+        return await runtime.ainvoke(messages)
+
+    answer = asyncio.run(RunnableLambda(node).ainvoke([HumanMessage(content="q")], run_config(model)))
+    assert answer.content == "session answer"
+
+
+def test_tier_resolves_through_the_router(fake_model):
+    default, fast = fake_model(content="default"), fake_model(content="fast")
+    router = ModelRouter(default, {"fast": fast}, {"summary": "fast"})
+    config = run_config(default, router)
+    assert in_run(RuntimeChatModel(tier="fast")).invoke([HumanMessage(content="q")], config).content == "fast"
+    assert in_run(RuntimeChatModel()).invoke([HumanMessage(content="q")], config).content == "default"
+    # A tier the session's router does not have falls back to the selected model.
+    assert in_run(RuntimeChatModel(tier="missing")).invoke([HumanMessage(content="q")], config).content == "default"
+
+
+def test_bind_tools_binds_on_the_resolved_model(fake_model):
+    first, second = fake_model(content="first"), fake_model(content="second")
+    bound = RuntimeChatModel().bind_tools([lookup], tool_choice="lookup")
+    assert first.bound_tools == []  # nothing is resolved until the call
+    assert in_run(bound).invoke([HumanMessage(content="q")], run_config(first)).content == "first"
+    assert in_run(bound).invoke([HumanMessage(content="q")], run_config(second)).content == "second"
+    assert first.bound_tools == [["lookup"]]
+    assert second.bound_tools == [["lookup"]]
+
+
+def test_missing_model_fails_clearly():
+    with pytest.raises(ValueError, match=r"config\['configurable'\]\['llm'\]"):
+        RuntimeChatModel().invoke([HumanMessage(content="q")])
+    with pytest.raises(ValueError, match=r"config\['configurable'\]\['llm'\]"):
+        in_run(RuntimeChatModel()).invoke([HumanMessage(content="q")], {"configurable": {"thread_id": "t"}})
@@ -0,0 +1,73 @@
+# tests/test_sdlc_speculation.py
+from langchain_core.messages import HumanMessage, SystemMessage
+
+from src.langgraphagenticai.nodes.sdlc_speculation import SpeculationManager
+
+USAGE = {"input_tokens": 60, "output_tokens": 40, "total_tokens": 100}
+
+
+def prompt(text: str):
+    return [SystemMessage(content="Write the design document."), HumanMessage(content=text)]
+
+
+def test_matching_prompt_commits_the_speculation(fake_model):
+    model = fake_model(content="design for {prompt}")
+    manager = SpeculationManager()
+    assert manager.start("thread", "session", "design", prompt("stories v1"), model)
+
+    future = manager.take("thread", "design", prompt("stories v1"))
+    assert future is not None
+    assert future.result(timeout=5).content == "design for stories v1"
+    assert model.calls == ["stories v1"]
+    assert manager.stats() == {"started": 1, "committed": 1, "discarded": 0, "skipped_over_budget": 0,
+                               "wasted_tokens": 0, "pending": 0}
+    assert manager.take("thread", "design", prompt("stories v1")) is None
+
+
+def test_changed_prompt_discards_and_charges_the_session(fake_model):
+    model = fake_model(usage=USAGE)
+    manager = SpeculationManager()
+    manager.start("thread", "session", "design", prompt("stories v1"), model)
+    manager._pending["thread"].future.result(timeout=5)
+
+    assert manager.take("thread", "design", prompt("stories v2")) is None
+    assert manager.wasted_tokens("session") == 100
+    assert manager.wasted_tokens("other session") == 0
+    stats = manager.stats()
+    assert (stats["committed"], stats["discarded"], stats["wasted_tokens"], stats["pending"]) == (0, 1, 100, 0)
+
+
+def test_speculation_of_another_stage_stays_pending(fake_model):
+    manager = SpeculationManager()
+    manager.start("thread", "session", "design", prompt("stories"), fake_model())
+
+    assert manager.take("thread", "code", prompt("stories")) is None
+    assert manager.stats()["pending"] == 1
+    assert manager.stats()["discarded"] == 0
+    assert manager.take("thread", "design", prompt("stories")) is not None
+
+
+def test_queued_speculation_is_cancelled_without_charge(fake_model):
+    manager = SpeculationManager(max_workers=1)
+    slow, queued = fake_model(delay=0.3, usage=USAGE), fake_model(usage=USAGE)
+    manager.start("busy thread", "session", "design", prompt("a"), slow)
+    manager.start("thread", "session", "design", prompt("b"), queued)
+
+    assert manager.take("thread", "design", prompt("changed")) is None
+    assert queued.calls == []
+    assert manager.wasted_tokens("session") == 0
+
+
+def test_session_over_budget_is_not_speculated_for(fake_model):
+    model = fake_model(usage=USAGE)
+    manager = SpeculationManager(token_budget=50)
+    manager.start("thread", "session", "design", prompt("v1"), model)
+    manager._pending["thread"].future.result(timeout=5)
+    manager.take("thread", "design", prompt("v2"))
+
+    assert not manager.start("thread", "session", "code", prompt("v2"), model)
+    assert manager.start("thread 2", "other session", "code", prompt("v2"), model)
+    manager._pending["thread 2"].future.result(timeout=5)
+    assert model.calls == ["v1", "v2"]
+    stats = manager.stats()
+    assert (stats["started"], stats["skipped_over_budget"]) == (2, 1)